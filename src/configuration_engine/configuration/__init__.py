@@ -1,3 +1,5 @@
 
 from configuration_engine.configuration.metadata import Metadata
 from configuration_engine.configuration.training_schema import TrainingSchema
+from configuration_engine.configuration.fidelity import FidelitySchedule
+from configuration_engine.configuration.trial_cache import TrialCache, assignment_key
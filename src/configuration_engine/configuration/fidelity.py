@@ -0,0 +1,69 @@
+from typing import Callable, List
+import math
+import optuna
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+
+
+class FidelitySchedule:
+    """
+    Budgets of successive halving as fractions of rows, fractions grow geometrically
+    by reduction_factor up to all rows. Step i of trial is evaluated on fractions[i],
+    resource reported to the pruner is i + 1, see pruner and evaluate.
+    """
+
+    def __init__(self, min_fraction: float, reduction_factor: int = 3):
+        """
+        min_fraction: smallest fraction of rows, first budget is at least min_fraction
+        Raises:
+            ValueError: when min_fraction isn't in (0, 1] or reduction_factor is less than 2
+        """
+        if not 0 < min_fraction <= 1 or reduction_factor < 2:
+            raise ValueError(
+                error_message(
+                    MODULE_NAME,
+                    "fidelity schedule",
+                    f"Invalid schedule, min_fraction {min_fraction} must be in (0, 1] "
+                    f"and reduction_factor {reduction_factor} at least 2!",
+                )
+            )
+        self.min_fraction = min_fraction
+        self.reduction_factor = reduction_factor
+        # small tolerance, so that exact powers aren't lost to rounding
+        n_steps = math.floor(math.log(1 / min_fraction, reduction_factor) + 1e-9)
+        self.fractions: List[float] = [
+            float(reduction_factor ** -(n_steps - i)) for i in range(n_steps + 1)
+        ]
+
+    def pruner(self, **kwargs) -> optuna.pruners.HyperbandPruner:
+        """
+        Hyperband pruner, whose resources are steps of this schedule.
+        kwargs: passed to HyperbandPruner
+        """
+        return optuna.pruners.HyperbandPruner(
+            min_resource=1,
+            max_resource=len(self.fractions),
+            reduction_factor=self.reduction_factor,
+            **kwargs,
+        )
+
+    def evaluate(
+        self, trial: optuna.Trial, objective: Callable[[float], float]
+    ) -> float:
+        """
+        Evaluates objective on growing fractions of rows, value of each step is
+        reported to trial.
+        objective: trains model on given fraction of rows, e.g. constructed by
+            TabularConfiguration.construct_dataset(..., fraction=fraction)
+        Returns:
+            value of objective on all rows
+        Raises:
+            optuna.TrialPruned: when pruner stops the trial
+        """
+        value = None
+        for step, fraction in enumerate(self.fractions, start=1):
+            value = objective(fraction)
+            trial.report(value, step)
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+        return value
@@ -1,9 +1,19 @@
 from configuration_engine.configuration.pandas.tabular_configuration import (
     TabularConfiguration,
+    ProcessedPandasDataset,
 )
 from configuration_engine.configuration.pandas.tabular_schema import (
     TabularSchema,
 )
+from configuration_engine.configuration.pandas.dataset_matrices import (
+    DatasetMatrices,
+    ModelArrays,
+)
+from configuration_engine.configuration.pandas.shared_dataset import (
+    SharedPandasDataset,
+    AttachedPandasDataset,
+    SharedDatasetHandle,
+)
 from configuration_engine.configuration.pandas.tabular_utils import (
     get_best_tabular_config,
 )
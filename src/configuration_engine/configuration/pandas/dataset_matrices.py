@@ -0,0 +1,139 @@
+from typing import Any, List, Dict, Optional, Tuple
+from configuration_engine.folds import Fold
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+from dataclasses import dataclass
+import pandas as pd
+import numpy as np
+import threading
+
+
+@dataclass
+class ModelArrays:
+    """
+    Model ready arrays of subset of rows.
+    """
+
+    # float32, C-contiguous, shape (rows, len(feature_names))
+    features: np.ndarray
+    # int32 codes of categorical columns, C-contiguous, shape (rows, len(categorical_names))
+    codes: np.ndarray
+    label: np.ndarray
+    weight: Optional[np.ndarray] = None
+
+
+class DatasetMatrices:
+    """
+    Lazily built model ready arrays of processed data.
+    Arrays are built once and shared by all trials, so they shouldn't be modified inplace.
+    Numeric and boolean columns become float32 features, categorical columns become int32
+    codes, target column becomes label.
+    """
+
+    def __init__(self, data: pd.DataFrame, target_column: str, folds: List[Fold]):
+        self.data = data
+        self.target_column = target_column
+        self.folds = folds
+        self._columns: Optional[Tuple[List[str], List[str]]] = None
+        self._arrays: Optional[ModelArrays] = None
+        self._fold_arrays: Dict[int, Tuple[ModelArrays, ModelArrays]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies get their own lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def feature_names(self) -> List[str]:
+        """
+        Names of columns of features matrix.
+        Raises:
+            ValueError: when data contains column, that isn't numeric, boolean or categorical
+        """
+        return self.columns()[0]
+
+    @property
+    def categorical_names(self) -> List[str]:
+        """
+        Names of columns of codes matrix.
+        Raises:
+            ValueError: when data contains column, that isn't numeric, boolean or categorical
+        """
+        return self.columns()[1]
+
+    def columns(self) -> Tuple[List[str], List[str]]:
+        if self._columns is not None:
+            return self._columns
+        feature_names: List[str] = []
+        categorical_names: List[str] = []
+        for name, dtype in self.data.dtypes.items():
+            if name == self.target_column:
+                continue
+            if isinstance(dtype, pd.CategoricalDtype):
+                categorical_names.append(name)
+            elif isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+                feature_names.append(name)
+            else:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "dataset matrices",
+                        f"Column {name} of type {dtype} can't be converted to model matrix!",
+                    )
+                )
+        self._columns = (feature_names, categorical_names)
+        return self._columns
+
+    def arrays(self) -> ModelArrays:
+        """
+        Arrays of all rows, without weight.
+        Raises:
+            ValueError: when data contains column, that isn't numeric, boolean or categorical
+        """
+        with self._lock:
+            if self._arrays is None:
+                self._arrays = self._build()
+            return self._arrays
+
+    def fold(self, fold: int) -> Tuple[ModelArrays, ModelArrays]:
+        """
+        Train and validation arrays of fold, without weight.
+        """
+        arrays = self.arrays()
+        with self._lock:
+            if fold not in self._fold_arrays:
+                train_idx, valid_idx = self.folds[fold]
+                self._fold_arrays[fold] = (
+                    self._take(arrays, train_idx),
+                    self._take(arrays, valid_idx),
+                )
+            return self._fold_arrays[fold]
+
+    def _build(self) -> ModelArrays:
+        feature_names, categorical_names = self.columns()
+        features = np.empty((self.data.shape[0], len(feature_names)), dtype=np.float32)
+        for i, name in enumerate(feature_names):
+            features[:, i] = self.data[name].to_numpy()
+        codes = np.empty((self.data.shape[0], len(categorical_names)), dtype=np.int32)
+        for i, name in enumerate(categorical_names):
+            codes[:, i] = self.data[name].array.codes
+        label = self.data[self.target_column]
+        if isinstance(label.dtype, pd.CategoricalDtype):
+            label = np.asarray(label.array.codes, dtype=np.int32)
+        else:
+            label = np.ascontiguousarray(label.to_numpy())
+        return ModelArrays(features=features, codes=codes, label=label)
+
+    @staticmethod
+    def _take(arrays: ModelArrays, idx: np.ndarray) -> ModelArrays:
+        return ModelArrays(
+            features=arrays.features.take(idx, axis=0),
+            codes=arrays.codes.take(idx, axis=0),
+            label=arrays.label.take(idx, axis=0),
+        )
@@ -0,0 +1,273 @@
+from typing import List, Any, Dict, Optional, Sequence, Tuple
+from configuration_engine.configuration.pandas.tabular_configuration import (
+    ProcessedPandasDataset,
+    WeightSegment,
+    expand_weight_segments,
+)
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+from multiprocessing import shared_memory
+from dataclasses import dataclass, replace
+import pandas as pd
+import numpy as np
+import threading
+import math
+
+_ALIGNMENT = 64
+# memory attached by this process, it is kept open until detached explicitly
+_attached_memory: Dict[str, shared_memory.SharedMemory] = {}
+_attached_lock = threading.Lock()
+
+
+@dataclass
+class SharedArraySpec:
+    """
+    Location of array inside shared memory block.
+    """
+
+    offset: int
+    dtype: str
+    shape: Tuple[int, ...]
+
+
+@dataclass
+class SharedColumnSpec:
+    name: str
+    array: SharedArraySpec
+    # for categorical columns array contains codes
+    category: Optional[pd.CategoricalDtype] = None
+
+
+@dataclass
+class SharedDatasetHandle:
+    """
+    Picklable description of published dataset, it is sent to workers instead of data.
+    weight, weight_segments and dataset_parameters are frozen at publish time, weights
+    of datasets change on every trial, so they are sent to workers with each trial,
+    see AttachedPandasDataset.reweighted.
+    """
+
+    memory_name: str
+    columns: List[SharedColumnSpec]
+    weight: SharedArraySpec
+    folds: List[Tuple[SharedArraySpec, SharedArraySpec]]
+    dataset_parameters: List[Dict[str, Any]]
+    weight_segments: List[WeightSegment]
+    n_training: Optional[int]
+    target_column: Optional[str] = None
+
+
+def _column_array(
+    name: str, column: pd.Series
+) -> Tuple[np.ndarray, Optional[pd.CategoricalDtype]]:
+    """
+    Raises:
+        ValueError: when column isn't numeric, boolean or categorical
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return np.asarray(column.array.codes), column.dtype
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufcmM":
+        return column.to_numpy(), None
+    raise ValueError(
+        error_message(
+            MODULE_NAME,
+            "share dataset",
+            f"Column {name} of type {column.dtype} can't be shared, only numeric and categorical columns are supported!",
+        )
+    )
+
+
+def _view(
+    memory: shared_memory.SharedMemory, spec: SharedArraySpec, writeable: bool
+) -> np.ndarray:
+    """
+    Array holds export of memory buffer, so memory can't be closed while array exists.
+    """
+    dtype = np.dtype(spec.dtype)
+    array = np.frombuffer(
+        memory.buf, dtype=dtype, count=math.prod(spec.shape), offset=spec.offset
+    ).reshape(spec.shape)
+    array.flags.writeable = writeable
+    return array
+
+
+class SharedPandasDataset:
+    """
+    Publishes processed dataset into shared memory, so worker processes can attach it
+    without copying, see AttachedPandasDataset.
+    Publisher owns the memory block, it is freed by close.
+    Index of data isn't shared, attached data has RangeIndex.
+    """
+
+    def __init__(self, dataset: ProcessedPandasDataset):
+        """
+        Raises:
+            ValueError: when dataset contains column, that can't be shared
+        """
+        arrays: List[np.ndarray] = []
+        categories: List[Optional[pd.CategoricalDtype]] = []
+        for name in dataset.data.columns:
+            array, category = _column_array(name, dataset.data[name])
+            arrays.append(array)
+            categories.append(category)
+        arrays.append(np.asarray(dataset.weight))
+        for train, valid in dataset.folds:
+            arrays.append(np.asarray(train))
+            arrays.append(np.asarray(valid))
+
+        specs: List[SharedArraySpec] = []
+        offset = 0
+        for array in arrays:
+            specs.append(SharedArraySpec(offset, array.dtype.str, array.shape))
+            offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        self._memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for array, spec in zip(arrays, specs):
+            _view(self._memory, spec, True)[...] = array
+
+        n_columns = dataset.data.shape[1]
+        fold_specs = specs[n_columns + 1 :]
+        self.handle = SharedDatasetHandle(
+            memory_name=self._memory.name,
+            columns=[
+                SharedColumnSpec(name, spec, category)
+                for name, spec, category in zip(
+                    dataset.data.columns, specs[:n_columns], categories
+                )
+            ],
+            weight=specs[n_columns],
+            folds=list(zip(fold_specs[::2], fold_specs[1::2])),
+            dataset_parameters=dataset.dataset_parameters,
+            weight_segments=dataset.weight_segments,
+            n_training=dataset.n_training,
+            target_column=dataset.target_column,
+        )
+
+    def close(self):
+        """
+        Releases and unlinks shared memory, attached datasets must not be used after.
+        """
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> "SharedPandasDataset":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _attach_memory(name: str) -> shared_memory.SharedMemory:
+    with _attached_lock:
+        memory = _attached_memory.get(name)
+        # buffer is None after failed close
+        if memory is not None and memory.buf is not None:
+            return memory
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before python 3.13 attached memory is registered by resource tracker,
+            # that is harmless only for child processes sharing tracker of publisher
+            memory = shared_memory.SharedMemory(name=name)
+        _attached_memory[name] = memory
+        return memory
+
+
+class AttachedPandasDataset:
+    """
+    Processed dataset attached from shared memory, arrays are read only views of
+    shared memory, so they shouldn't be modified inplace.
+    Memory is mapped once per process and stays mapped until close is called.
+    Before python 3.13 only child processes of publisher should attach dataset.
+    """
+
+    def __init__(self, handle: SharedDatasetHandle):
+        """
+        Raises:
+            FileNotFoundError: if shared memory doesn't exist
+        """
+        self.memory_name = handle.memory_name
+        self._memory = _attach_memory(handle.memory_name)
+        columns: Dict[str, Any] = {}
+        for column in handle.columns:
+            array = _view(self._memory, column.array, False)
+            if column.category is not None:
+                array = pd.Categorical.from_codes(
+                    array, dtype=column.category, validate=False
+                )
+            columns[column.name] = array
+        self.dataset = ProcessedPandasDataset(
+            data=pd.DataFrame(columns, copy=False),
+            weight=_view(self._memory, handle.weight, False),
+            folds=[
+                (
+                    _view(self._memory, train, False),
+                    _view(self._memory, valid, False),
+                )
+                for train, valid in handle.folds
+            ],
+            dataset_parameters=handle.dataset_parameters,
+            weight_segments=handle.weight_segments,
+            n_training=handle.n_training,
+            target_column=handle.target_column,
+        )
+
+    def reweighted(self, weights: Sequence[float]) -> ProcessedPandasDataset:
+        """
+        Attached dataset with weights of trial, data and folds stay views of shared
+        memory, only weight is new array. Parent sends weights of trial dataset, e.g.
+        [parameters["weight"] for parameters in dataset.dataset_parameters].
+        weights: weight of each dataset in order of dataset_parameters
+        Raises:
+            ValueError: when number of weights doesn't match number of datasets
+        """
+        parameters = self.dataset.dataset_parameters
+        if len(weights) != len(parameters):
+            raise ValueError(
+                error_message(
+                    MODULE_NAME,
+                    "attach dataset",
+                    f"Expected {len(parameters)} weights, got {len(weights)}!",
+                )
+            )
+        dataset_parameters = [
+            {**curr_parameters, "weight": curr_weight}
+            for curr_parameters, curr_weight in zip(parameters, weights)
+        ]
+        # segments are ordered with cv datasets first, as datasets are concatenated
+        segment_weights = [
+            curr_parameters["weight"]
+            for cv in (True, False)
+            for curr_parameters in dataset_parameters
+            if curr_parameters.get("cv", True) == cv
+        ]
+        weight_segments = [
+            (offset, length, curr_weight)
+            for (offset, length, _), curr_weight in zip(
+                self.dataset.weight_segments, segment_weights
+            )
+        ]
+        return replace(
+            self.dataset,
+            weight=expand_weight_segments(
+                weight_segments, len(self.dataset.weight), self.dataset.weight.dtype
+            ),
+            dataset_parameters=dataset_parameters,
+            weight_segments=weight_segments,
+        )
+
+    def close(self):
+        """
+        Unmaps shared memory from this process.
+        Raises:
+            BufferError: if arrays of any dataset attached from this memory still exist
+        """
+        self.dataset = None
+        with _attached_lock:
+            self._memory.close()
+            _attached_memory.pop(self.memory_name, None)
+
+    def __enter__(self) -> "AttachedPandasDataset":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,21 +1,154 @@
 from typing import List, Any, Dict, Optional, Tuple
 from configuration_engine.datasets import PandasDataset
-from configuration_engine.parameter import Parameter, NontunableParameter
-from configuration_engine.processing_action.pandas import TabularProcessingAction
+from configuration_engine.parameter import (
+    Parameter,
+    NontunableParameter,
+    Assignment,
+    compile_search_space,
+    ParameterGrid,
+)
+from configuration_engine.processing_action.pandas import (
+    TabularProcessingAction,
+    PipelineStore,
+    actions_fingerprint,
+    TabularPipeline,
+    compile_pipeline,
+)
 from configuration_engine.configuration.metadata import Metadata
+from configuration_engine.error import error_message, NotFittedError
+from configuration_engine.constants import *
 import optuna
+from optuna.distributions import BaseDistribution
+import threading
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import StratifiedKFold
-from dataclasses import dataclass
+from configuration_engine.folds import (
+    FoldEngine,
+    Fold,
+    NestedSubsampler,
+    restrict_folds,
+    check_fraction,
+)
+from configuration_engine.configuration.pandas.dataset_matrices import (
+    DatasetMatrices,
+    ModelArrays,
+)
+from dataclasses import dataclass, field, replace
+
+BACKENDS = ("pandas", "arrow")
+
+# (offset, length, weight) of rows belonging to one dataset
+WeightSegment = Tuple[int, int, float]
+
+
+def expand_weight_segments(
+    segments: List[WeightSegment], n_rows: int, dtype: type = np.float64
+) -> np.ndarray:
+    """
+    Converts weight segments to contiguous array with weight for each row.
+    """
+    weight = np.empty(n_rows, dtype=dtype)
+    for offset, length, curr_weight in segments:
+        weight[offset : offset + length] = curr_weight
+    return weight
 
 
 @dataclass
 class ProcessedPandasDataset:
     data: pd.DataFrame
-    weight: List[float]
-    folds: List[Tuple[np.ndarray, np.ndarray]]
+    weight: np.ndarray
+    folds: List[Fold]
     dataset_parameters: List[Dict[str, Any]]
+    weight_segments: List[WeightSegment] = field(default_factory=list)
+    # number of leading rows from training (cv) datasets, None means all rows
+    n_training: Optional[int] = None
+    target_column: Optional[str] = None
+    # model ready arrays, shared by datasets with same data
+    matrices: Optional[DatasetMatrices] = field(default=None, repr=False)
+
+    @property
+    def training_data(self) -> pd.DataFrame:
+        """
+        Rows of training (cv) datasets, view of data.
+        """
+        return self.data.iloc[: self.n_training]
+
+    @property
+    def additional_data(self) -> pd.DataFrame:
+        """
+        Rows of additional datasets, view of data.
+        """
+        if self.n_training is None:
+            return self.data.iloc[:0]
+        return self.data.iloc[self.n_training :]
+
+    def model_matrices(self) -> DatasetMatrices:
+        """
+        Raises:
+            ValueError: if target column isn't set or data can't be converted
+        """
+        if self.matrices is None:
+            if self.target_column is None:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "model matrices",
+                        "Target column of dataset isn't set!",
+                    )
+                )
+            self.matrices = DatasetMatrices(self.data, self.target_column, self.folds)
+        return self.matrices
+
+    def arrays(self) -> ModelArrays:
+        """
+        Model ready arrays of all rows with weight of this dataset.
+        """
+        return replace(self.model_matrices().arrays(), weight=self.weight)
+
+    def fold_arrays(self, fold: int) -> Tuple[ModelArrays, ModelArrays]:
+        """
+        Model ready train and validation arrays of fold, features are built once and
+        reused, only weight is sliced for each call.
+        """
+        train, valid = self.model_matrices().fold(fold)
+        train_idx, valid_idx = self.folds[fold]
+        return (
+            replace(train, weight=self.weight.take(train_idx)),
+            replace(valid, weight=self.weight.take(valid_idx)),
+        )
+
+    def share(self) -> "SharedPandasDataset":
+        """
+        Publishes dataset into shared memory, workers attach it by returned handle.
+        Raises:
+            ValueError: when dataset contains column, that can't be shared
+        """
+        from configuration_engine.configuration.pandas.shared_dataset import (
+            SharedPandasDataset,
+        )
+
+        return SharedPandasDataset(self)
+
+
+@dataclass
+class ProcessedData:
+    """
+    Part of processed dataset, that doesn't depend on trial.
+    """
+
+    data: pd.DataFrame
+    folds: List[Fold]
+    # number of rows of each dataset, in order of training datasets
+    lengths: List[int]
+    # training rows are followed by rows of additional datasets
+    n_training: int
+    matrices: DatasetMatrices
+    key: Optional[Tuple] = None
+    # nested subsamples of rows by fraction, see TabularConfiguration.subsampled_data
+    subsampler: Optional[NestedSubsampler] = field(default=None, repr=False)
+    subsamples: Dict[float, "ProcessedData"] = field(
+        default_factory=dict, repr=False
+    )
 
 
 class TabularConfiguration:
@@ -29,7 +162,32 @@ class TabularConfiguration:
         training_parameters: List[Parameter[Any]],
         model_parameters: List[Parameter[Any]],
         processing: List[TabularProcessingAction],
+        cache_processed: bool = True,
+        fold_engine: Optional[FoldEngine] = None,
+        processing_workers: Optional[int] = None,
+        pipeline_store: Optional[PipelineStore] = None,
+        backend: str = "pandas",
     ):
+        """
+        cache_processed: processed datasets and folds are reused across trials,
+        only weights are recomputed for each trial
+        fold_engine: engine memoizing folds, by default in memory only
+        processing_workers: number of threads executing column processing actions
+        pipeline_store: if set fitted processing is loaded from it instead of refitting,
+        datasets must be read from files
+        backend: "pandas" or "arrow", with arrow datasets are concatenated and processed
+        as Arrow table, that is converted to pandas once, pipeline store isn't used
+        Raises:
+            ValueError: when backend is unknown
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                error_message(
+                    MODULE_NAME,
+                    "configuration",
+                    f"Unknown processing backend {backend}, expected one of {BACKENDS}!",
+                )
+            )
         self.additional_parameters = additional_parameters
         self.tuner_parameters = tuner_parameters
         self.metadata = metadata
@@ -37,35 +195,69 @@ class TabularConfiguration:
         self.training_parameters = training_parameters
         self.model_parameters = model_parameters
         self.processing = processing
+        self.cache_processed = cache_processed
+        self.fold_engine = fold_engine if fold_engine is not None else FoldEngine()
+        self.processing_workers = processing_workers
+        self.pipeline_store = pipeline_store
+        self.backend = backend
+        # (action, seconds) of last processing run
+        self.processing_timings: List[Tuple[str, float]] = []
+        self._processed: Optional[ProcessedData] = None
+        # compiled processing fitted by last processing run, ArrowPipeline with arrow
+        # backend, see transform
+        self.pipeline: Optional[TabularPipeline] = None
+        # trials of study.optimize(n_jobs=...) share processed data and subsamples
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies get their own lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     def construct_dataset(
-        self, target_column: str, trial: optuna.Trial = None, k_folds: Optional[int] = 5
+        self,
+        target_column: str,
+        trial: optuna.Trial = None,
+        k_folds: Optional[int] = 5,
+        weight_dtype: type = np.float64,
+        fraction: float = 1.0,
+        assignment: Optional[Assignment] = None,
     ) -> ProcessedPandasDataset:
         """
         First it constructs dataset, than processing is applied
+        weight_dtype: dtype of weight array, np.float64 or np.float32
+        fraction: fraction of rows of each dataset and target class, subsamples are
+        deterministic and nested, so budgets of multi fidelity tuning grow consistently,
+        see FidelitySchedule
+        assignment: suggested weights are recorded into it, without trial weights are
+        taken from it
+        When cache_processed is enabled, processed data and folds are shared by all
+        returned datasets, so they shouldn't be modified inplace.
+        Raises:
+            ValueError: when fraction isn't in (0, 1]
         """
+        check_fraction(fraction)
+        processed = self.processed_data(target_column, k_folds)
+        if fraction < 1:
+            processed = self.subsampled_data(processed, target_column, fraction)
         dataset_parameters: List[Dict[str, Any]] = []
-        training_datasets: List[pd.DataFrame] = []
-        aditional_datasets: List[pd.DataFrame] = []
-        training_weight: List[float] = []
-        additional_weight: List[float] = []
-        for dataset in self.training_datasets:
+        # (length, weight) of datasets in order they are concatenated
+        training_weight: List[Tuple[int, float]] = []
+        additional_weight: List[Tuple[int, float]] = []
+        for dataset, length in zip(self.training_datasets, processed.lengths):
+            if trial is not None:
+                curr_weight = dataset.weight.suggest(trial, assignment)
+            else:
+                curr_weight = dataset.weight.first(assignment)
             if dataset.cv:
-                training_datasets.append(dataset.data)
-                if trial is not None:
-                    curr_weight = dataset.weight.suggest(trial)
-                else:
-                    curr_weight = dataset.weight.first()
-                for i in range(dataset.data.shape[0]):
-                    training_weight.append(curr_weight)
+                training_weight.append((length, curr_weight))
             else:
-                aditional_datasets.append(dataset.data)
-                if trial is not None:
-                    curr_weight = dataset.weight.suggest(trial)
-                else:
-                    curr_weight = dataset.weight.first()
-                for i in range(dataset.data.shape[0]):
-                    additional_weight.append(curr_weight)
+                additional_weight.append((length, curr_weight))
             dataset_parameters.append(
                 {
                     "path": dataset.path,
@@ -75,66 +267,226 @@ class TabularConfiguration:
                 }
             )
 
-        training_dataset = pd.concat(training_datasets, axis=0)
-        if aditional_datasets:
-            additional_dataset = pd.concat(aditional_datasets, axis=0)
-            total_dataset = pd.concat([training_dataset, additional_dataset], axis=0)
-        else:
-            total_dataset = training_dataset.copy()
+        weight_segments: List[WeightSegment] = []
+        offset = 0
+        for length, curr_weight in training_weight + additional_weight:
+            weight_segments.append((offset, length, curr_weight))
+            offset += length
 
-        for processor in self.processing:
-            processor.fit_transform(total_dataset, True)
-            processor.transform(training_dataset, True)
-            if aditional_datasets:
-                processor.transform(additional_dataset, True)
+        return ProcessedPandasDataset(
+            data=processed.data,
+            weight=expand_weight_segments(weight_segments, offset, weight_dtype),
+            folds=processed.folds,
+            dataset_parameters=dataset_parameters,
+            weight_segments=weight_segments,
+            n_training=processed.n_training,
+            target_column=target_column,
+            matrices=processed.matrices,
+        )
 
-        kf = StratifiedKFold(
-            n_splits=k_folds, shuffle=True, random_state=self.metadata.seed
+    def processed_data(self, target_column: str, k_folds: int) -> ProcessedData:
+        """
+        Returns concatenated and processed datasets with folds, result is cached until
+        datasets, processing, target column or number of folds change.
+        """
+        key = (
+            tuple((dataset, dataset.cv) for dataset in self.training_datasets),
+            tuple(self.processing),
+            target_column,
+            k_folds,
         )
-        folds = [
-            (train_idx, val_idx)
-            for train_idx, val_idx in kf.split(
-                X=training_dataset, y=training_dataset[target_column]
+        with self._lock:
+            if self._processed is not None and self._processed.key == key:
+                return self._processed
+            processed = self.process_datasets(target_column, k_folds)
+            processed.key = key
+            if self.cache_processed:
+                self._processed = processed
+            return processed
+
+    def subsampled_data(
+        self, processed: ProcessedData, target_column: str, fraction: float
+    ) -> ProcessedData:
+        """
+        Stratified subsample of processed data, strata are pairs of dataset and target
+        value, seed is seed of metadata. Subsamples are cached with processed data,
+        folds are folds of processed data restricted to subsample.
+        Raises:
+            ValueError: when fraction isn't in (0, 1]
+        """
+        with self._lock:
+            subsample = processed.subsamples.get(fraction)
+            if subsample is not None:
+                return subsample
+            # datasets in order they are concatenated
+            order = [i for i, d in enumerate(self.training_datasets) if d.cv] + [
+                i for i, d in enumerate(self.training_datasets) if not d.cv
+            ]
+            lengths = [processed.lengths[i] for i in order]
+            if processed.subsampler is None:
+                segments = np.repeat(np.arange(len(lengths)), lengths)
+                target_codes, _ = pd.factorize(processed.data[target_column])
+                # missing target is its own stratum
+                strata = segments * (target_codes.max(initial=0) + 2) + target_codes + 1
+                processed.subsampler = NestedSubsampler(strata, self.metadata.seed)
+            rows = processed.subsampler.rows(fraction)
+            counts = np.bincount(
+                np.searchsorted(np.cumsum(lengths), rows, side="right"),
+                minlength=len(lengths),
             )
-        ]
-        if aditional_datasets:
-            for i in range(len(folds)):
-                folds[i] = (
-                    np.concat(
-                        [
-                            folds[i][0],
-                            np.arange(additional_dataset.shape[0])
-                            + training_dataset.shape[0],
-                        ],
-                        axis=0,
-                    ),
-                    folds[i][1],
-                )
+            sub_lengths = [0] * len(lengths)
+            for position, i in enumerate(order):
+                sub_lengths[i] = int(counts[position])
+            data = processed.data.iloc[rows]
+            folds = restrict_folds(processed.folds, rows, processed.data.shape[0])
+            subsample = ProcessedData(
+                data=data,
+                folds=folds,
+                lengths=sub_lengths,
+                n_training=int(np.searchsorted(rows, processed.n_training)),
+                matrices=DatasetMatrices(data, target_column, folds),
+                key=processed.key,
+            )
+            processed.subsamples[fraction] = subsample
+            return subsample
 
-        return ProcessedPandasDataset(
+    def clear_cache(self):
+        self._processed = None
+
+    def process_datasets(self, target_column: str, k_folds: int) -> ProcessedData:
+        """
+        Datasets are concatenated once, training (cv) datasets first, than additional
+        datasets, compiled processing pipeline is applied once to the concatenated frame.
+        """
+        frames: List[pd.DataFrame] = []
+        additional_frames: List[pd.DataFrame] = []
+        lengths: List[int] = []
+        for dataset in self.training_datasets:
+            if dataset.cv:
+                frames.append(dataset.data)
+            else:
+                additional_frames.append(dataset.data)
+            lengths.append(dataset.data.shape[0])
+        n_training = sum(frame.shape[0] for frame in frames)
+        n_additional = sum(frame.shape[0] for frame in additional_frames)
+
+        if self.backend == "arrow":
+            total_dataset = self.process_arrow(frames + additional_frames)
+        else:
+            total_dataset = pd.concat(frames + additional_frames, axis=0)
+            pipeline = self.fitted_pipeline()
+            if pipeline is None:
+                pipeline = compile_pipeline(self.processing, self.processing_workers)
+                pipeline.fit_transform(total_dataset, True)
+                self.store_pipeline(pipeline)
+            else:
+                pipeline.transform(total_dataset, True)
+            # loaded pipeline is kept too, actions of processing aren't fitted
+            self.pipeline = pipeline
+            self.processing_timings = pipeline.timings
+
+        folds = self.fold_engine.split(
+            total_dataset[target_column].iloc[:n_training],
+            k_folds,
+            self.metadata.seed,
+            n_additional,
+        )
+        return ProcessedData(
             data=total_dataset,
-            weight=training_weight + additional_weight,
             folds=folds,
-            dataset_parameters=dataset_parameters,
+            lengths=lengths,
+            n_training=n_training,
+            matrices=DatasetMatrices(total_dataset, target_column, folds),
         )
 
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies processing fitted on training datasets to new data, e.g. holdout.
+        Actions of processing are replaced by compiled pipeline, so they themselves
+        aren't fitted, fitted pipeline is kept in attribute pipeline.
+        Raises:
+            NotFittedError: when datasets weren't processed yet
+            ValueError: when any action fails
+        """
+        if self.pipeline is None:
+            raise NotFittedError(
+                error_message(
+                    MODULE_NAME,
+                    "transform",
+                    "Processing isn't fitted, construct dataset first!",
+                )
+            )
+        if self.backend == "arrow":
+            from configuration_engine.processing_action.arrow import frames_to_table
+
+            return self.pipeline.transform(frames_to_table([X])).to_pandas()
+        return self.pipeline.transform(X)
+
+    def process_arrow(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Runs processing on Arrow table, result has RangeIndex.
+        Raises:
+            ValueError: when processing contains action unsupported by arrow backend
+            ImportError: without pyarrow installed
+        """
+        from configuration_engine.processing_action.arrow import (
+            compile_arrow_pipeline,
+            frames_to_table,
+        )
+
+        pipeline = compile_arrow_pipeline(self.processing, self.processing_workers)
+        table = pipeline.fit_transform(frames_to_table(frames))
+        self.processing_timings = pipeline.timings
+        self.pipeline = pipeline
+        return table.to_pandas()
+
+    def pipeline_key(self) -> Optional[str]:
+        """
+        Key of processing fitted on training datasets, None if some dataset
+        wasn't read from file, or pipeline store isn't set.
+        """
+        if self.pipeline_store is None:
+            return None
+        data_fingerprints: List[str] = []
+        for dataset in sorted(self.training_datasets, key=lambda d: not d.cv):
+            fingerprint = dataset.fingerprint()
+            if fingerprint is None:
+                return None
+            data_fingerprints.append(fingerprint)
+        return self.pipeline_store.key(self.processing, data_fingerprints)
+
+    def fitted_pipeline(self) -> Optional[TabularPipeline]:
+        key = self.pipeline_key()
+        if key is None:
+            return None
+        pipeline = self.pipeline_store.load(key)
+        if pipeline is not None:
+            pipeline.max_workers = self.processing_workers
+        return pipeline
+
+    def store_pipeline(self, pipeline: TabularPipeline):
+        key = self.pipeline_key()
+        if key is not None:
+            self.pipeline_store.store(key, pipeline)
+
     def suggest_model_params(
-        self, trial: optuna.Trial
+        self, trial: optuna.Trial, assignment: Optional[Assignment] = None
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Mělby vrátit dvojici, parametry pro program a parametry vhodné pro uložení do yamlu
+        assignment: if set, suggestions are recorded into it
         """
         params: Dict[str, Any] = {}
         for param in self.model_parameters:
-            params[param.name] = param.suggest(trial)
+            params[param.name] = param.suggest(trial, assignment)
         return params, params
 
     def suggest_training_params(
-        self, trial: optuna.Trial
+        self, trial: optuna.Trial, assignment: Optional[Assignment] = None
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         params: Dict[str, Any] = {}
         for param in self.training_parameters:
-            params[param.name] = param.suggest(trial)
+            params[param.name] = param.suggest(trial, assignment)
         return params, params
 
     def construct_additional_params(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -149,8 +501,71 @@ class TabularConfiguration:
             params[param.name()] = param.value()
         return params, params
 
-    def first_model_params(self) -> Dict[str, Any]:
+    def trial_values(self, assignment: Assignment) -> Dict[str, Any]:
+        """
+        Values, that determine score of trial: yaml values of model and training
+        parameters, weights and fingerprints of datasets by name and processing,
+        used as key of TrialCache.
+        Datasets, that weren't read from file, have fingerprint None, so changes of
+        their data aren't part of values.
+        Fraction of data isn't known to configuration, callers training on subsample
+        (see construct_dataset) must add it, e.g. values["fraction"] = fraction.
+        Raises:
+            OSError: when file of dataset can't be read
+        """
+        return {
+            "model_parameters": {
+                param.name: param.yaml(assignment) for param in self.model_parameters
+            },
+            "training_parameters": {
+                param.name: param.yaml(assignment)
+                for param in self.training_parameters
+            },
+            "weights": {
+                dataset.name: dataset.weight.first(assignment)
+                for dataset in self.training_datasets
+            },
+            "datasets": {
+                dataset.name: dataset.fingerprint()
+                for dataset in self.training_datasets
+            },
+            "processing": actions_fingerprint(self.processing),
+        }
+
+    def search_space(self) -> Dict[str, BaseDistribution]:
+        """
+        Optuna distributions of model parameters, training parameters and weights
+        of datasets, see compile_search_space and ask_trials.
+        Raises:
+            ValueError: when two parameters share alias with different distributions
+        """
+        return compile_search_space(self.tunable_parameters())
+
+    def grid(self) -> ParameterGrid:
+        """
+        Lazy grid of model parameters, training parameters and weights of datasets,
+        used when metadata.tuner is "grid". Points are assignments, they are passed
+        to construct_dataset and first_model_params instead of trial.
+        Raises:
+            ValueError: when parameter can't be enumerated
+        """
+        return ParameterGrid(self.tunable_parameters())
+
+    def tunable_parameters(self) -> List[Parameter[Any]]:
+        return [
+            *self.model_parameters,
+            *self.training_parameters,
+            *(dataset.weight for dataset in self.training_datasets),
+        ]
+
+    def first_model_params(
+        self, assignment: Optional[Assignment] = None
+    ) -> Dict[str, Any]:
+        """
+        assignment: values of parameters, e.g. Assignment.from_trial(trial), defaults
+        are used without it
+        """
         params: Dict[str, Any] = {}
         for param in self.model_parameters:
-            params[param.name] = param.first()
+            params[param.name] = param.first(assignment)
         return params
@@ -2,8 +2,13 @@ from pydantic import Field
 from configuration_engine.processing_action.pandas import (
     TabularColumnActionSchema,
     TabularProcessingAction,
+    PipelineStore,
+    Downcast,
+    DropColumnSchema,
+    ChangeCategorySchema,
 )
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Union, Any, Optional, Tuple, Literal
+from concurrent.futures import ThreadPoolExecutor
 from configuration_engine.parameter import (
     RangeParameterSchema,
     Parameter,
@@ -12,14 +17,16 @@ from configuration_engine.parameter import (
     NontunableParameter,
     ConstantNontunableParameter,
 )
-from configuration_engine.datasets import DatasetSchema
+from configuration_engine.datasets import DatasetSchema, merge_categories
 from pydantic import BaseModel
 from configuration_engine.configuration.pandas import (
     TabularConfiguration,
 )
 from configuration_engine.datasets import PandasDataset
+from configuration_engine.folds import FoldEngine
 from configuration_engine.configuration.metadata import Metadata
 import pandas as pd
+import os
 
 
 ParameterType = Union[
@@ -41,6 +48,21 @@ class TabularSchema(BaseModel):
     training_parameters: Dict[str, ParameterType]
     model_parameters: Dict[str, ParameterType]
     preprocessing: List[TabularColumnActionSchema] = Field(default_factory=list)
+    # number of threads loading training datasets, None means one per dataset up to cpu count
+    dataset_workers: Optional[int] = Field(default=None, ge=1)
+    # directory where computed folds are persisted, None keeps them only in memory
+    fold_cache_dir: Optional[str] = None
+    # number of threads executing column processing actions, None runs them sequentially
+    processing_workers: Optional[int] = Field(default=None, ge=1)
+    # directory where fitted processing pipelines are persisted, None disables it
+    pipeline_cache_dir: Optional[str] = None
+    # dropped columns aren't read and leading category changes are done by dataset
+    # reader, these actions are then missing from processing of configuration
+    pushdown: bool = False
+    # processed data is shrunk to smallest safe dtypes, see Downcast
+    downcast: bool = False
+    # library executing processing, arrow requires pyarrow
+    backend: Literal["pandas", "arrow"] = "pandas"
 
     def convert_paramaeters(
         self,
@@ -54,22 +76,151 @@ class TabularSchema(BaseModel):
                 converted.append(ConstantParameter(name=key, value=val))
         return converted
 
-    def build(self, categories: Dict[str, pd.CategoricalDtype]) -> TabularConfiguration:
-        converted_training_datasets: List[PandasDataset] = []
+    def pushdown_preprocessing(
+        self, categories: Dict[str, pd.CategoricalDtype]
+    ) -> Tuple[
+        Dict[str, pd.CategoricalDtype], List[str], List[TabularProcessingAction]
+    ]:
+        """
+        Splits preprocessing into part done by dataset reader and actions, that remain.
+        Columns, that are dropped, aren't read, so all their actions are skipped.
+        Category change, that is first action on column, becomes dtype of the column.
+        Pushed down actions aren't part of remaining actions, so they are missing
+        from TabularConfiguration.processing and its transform. Readers still raise
+        ValueError, when excluded or dtype column isn't in the file.
+        Without pushdown all actions remain.
+        Returns:
+            dtype, excluded columns, remaining actions
+        """
+        dtype: Dict[str, pd.CategoricalDtype] = {}
+        exclude: List[str] = []
+        if self.pushdown:
+            for action in self.preprocessing:
+                if any(isinstance(a, DropColumnSchema) for a in action.actions):
+                    exclude.append(action.column)
+        seen: List[str] = []
+        remaining: List[TabularProcessingAction] = []
+        for action in self.preprocessing:
+            if action.column in exclude:
+                continue
+            converted = action.build(categories)
+            if (
+                self.pushdown
+                and action.column not in seen
+                and action.actions
+                and isinstance(action.actions[0], ChangeCategorySchema)
+            ):
+                dtype[action.column] = categories[action.actions[0].category]
+                converted = converted[1:]
+            seen.append(action.column)
+            remaining.extend(converted)
+        return dtype, exclude, remaining
+
+    def category_columns(self) -> Dict[str, List[str]]:
+        """
+        Columns converted to each category by preprocessing. Dropped columns are
+        skipped, unless no other column uses their category, actions of dropped
+        columns are still built without pushdown, so their categories are needed.
+        """
+        dropped = [
+            action.column
+            for action in self.preprocessing
+            if any(isinstance(a, DropColumnSchema) for a in action.actions)
+        ]
+        columns: Dict[str, List[str]] = {}
+        dropped_columns: Dict[str, List[str]] = {}
+        for action in self.preprocessing:
+            target = dropped_columns if action.column in dropped else columns
+            for column_action in action.actions:
+                if isinstance(column_action, ChangeCategorySchema):
+                    category_columns = target.setdefault(column_action.category, [])
+                    if action.column not in category_columns:
+                        category_columns.append(action.column)
+        for category, category_columns in dropped_columns.items():
+            columns.setdefault(category, category_columns)
+        return columns
+
+    def infer_categories(self) -> Dict[str, pd.CategoricalDtype]:
+        """
+        Categories used by preprocessing are distinct values of their columns over all
+        training datasets. Datasets are read concurrently in chunks, distinct values
+        are cached in cache_dir of each dataset.
+        Raises:
+            OSError
+            ValueError
+        """
+        columns = self.category_columns()
+        if not columns or not self.training_datasets:
+            return merge_categories([], columns)
+        read_columns = list(
+            dict.fromkeys(column for names in columns.values() for column in names)
+        )
+        workers = self.dataset_workers or min(
+            len(self.training_datasets), os.cpu_count() or 1
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            values = list(
+                executor.map(
+                    lambda dataset: dataset.distinct_values(read_columns),
+                    self.training_datasets,
+                )
+            )
+        return merge_categories(values, columns)
 
-        for dataset in self.training_datasets:
-            converted_training_datasets.append(dataset.build())
+    def build_datasets(
+        self,
+        lazy: Optional[bool] = None,
+        dtype: Optional[Dict[str, pd.CategoricalDtype]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[PandasDataset]:
+        """
+        Loads training datasets concurrently, result has same order as training_datasets.
+        lazy: overrides lazy option of every dataset, when set
+        dtype, exclude: passed to reader of every dataset, see pushdown_preprocessing
+        Raises:
+            OSError
+            ValueError
+        """
+        if not self.training_datasets:
+            return []
+        workers = self.dataset_workers or min(
+            len(self.training_datasets), os.cpu_count() or 1
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda dataset: dataset.build(
+                        lazy=lazy, dtype=dtype or None, exclude=exclude or None
+                    ),
+                    self.training_datasets,
+                )
+            )
+
+    def build(
+        self,
+        categories: Optional[Dict[str, pd.CategoricalDtype]] = None,
+        lazy: Optional[bool] = None,
+    ) -> TabularConfiguration:
+        """
+        categories: categories used by preprocessing, inferred from datasets when None,
+            see infer_categories, inference reads datasets even when lazy
+        lazy: if True datasets are loaded on first access, overrides dataset settings,
+            with categories given files aren't touched until then
+        """
+        if categories is None:
+            categories = self.infer_categories()
+        dtype, exclude, converted_preprocessing = self.pushdown_preprocessing(categories)
+        if self.downcast:
+            converted_preprocessing.append(Downcast())
+        converted_training_datasets: List[PandasDataset] = self.build_datasets(
+            lazy, dtype, exclude
+        )
         converted_training_parameters: List[Parameter[Any]] = self.convert_paramaeters(
             self.training_parameters
         )
         converted_model_parameters: List[Parameter[Any]] = self.convert_paramaeters(
             self.model_parameters
         )
-        converted_preprocessing: List[TabularProcessingAction] = []
-        for action in self.preprocessing:
-            for converted_action in action.build(categories):
-                converted_preprocessing.append(converted_action)
-
         converted_tuner_parameters: List[NontunableParameter[Any]] = []
         for key, val in self.tuner_parameters.items():
             converted_tuner_parameters.append(
@@ -89,4 +240,12 @@ class TabularSchema(BaseModel):
             training_parameters=converted_training_parameters,
             model_parameters=converted_model_parameters,
             processing=converted_preprocessing,
+            fold_engine=FoldEngine(self.fold_cache_dir),
+            processing_workers=self.processing_workers,
+            pipeline_store=(
+                PipelineStore(self.pipeline_cache_dir)
+                if self.pipeline_cache_dir is not None
+                else None
+            ),
+            backend=self.backend,
         )
@@ -4,7 +4,12 @@ import pandas as pd
 import yaml
 
 
-def get_best_tabular_config(config: TrainingSchema, categories):
+def get_best_tabular_config(config: TrainingSchema, categories, lazy: bool = True):
+    """
+    categories: categories used by preprocessing, required, so that picking
+        configuration doesn't read datasets
+    lazy: datasets of returned configuration are loaded on first access
+    """
     with open(config.config_path) as configurationsStream:
         configurations = yaml.safe_load_all(configurationsStream)
         configs = list(configurations)
@@ -19,5 +24,5 @@ def get_best_tabular_config(config: TrainingSchema, categories):
         best_config = configs[index]
 
     validatedConfig = TabularSchema(**best_config)
-    tabularConfig = validatedConfig.build(categories=categories)
+    tabularConfig = validatedConfig.build(categories=categories, lazy=lazy)
     return tabularConfig
@@ -0,0 +1,165 @@
+from typing import Any, Callable, Dict, Optional
+import hashlib
+import json
+import math
+import os
+import threading
+import numpy as np
+import optuna
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Converts value to json serializable form, in which equal values are equal,
+    e.g. numpy scalars are converted to python values and -0.0 to 0.0.
+    """
+    if isinstance(value, dict):
+        return {str(key): _canonical(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return repr(value)
+        return value + 0.0
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def assignment_key(values: Dict[str, Any]) -> str:
+    """
+    Canonical hash of values of trial, independent of order of keys.
+    values: yaml values of parameters and weights of datasets,
+        see TabularConfiguration.trial_values
+    """
+    return hashlib.blake2b(
+        json.dumps(_canonical(values), sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+class TrialCache:
+    """
+    Scores of evaluated trials persisted as json lines, key is assignment_key
+    of trial values. Trials repeating evaluated values return stored score
+    instead of training again.
+    File is only appended to, so trials running concurrently in threads or processes
+    can share it, entries written by other processes are seen after reload.
+    Values must contain everything that changes score, e.g. fraction of data for
+    multi fidelity trials, which isn't part of TabularConfiguration.trial_values.
+    """
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            OSError
+            ValueError: when file contains entry without key or score
+        """
+        self.path = path
+        self._scores: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.reload()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies get their own lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reload(self):
+        """
+        Reads entries of file, including entries stored by other processes.
+        Raises:
+            OSError
+            ValueError: when file contains entry without key or score
+        """
+        if not os.path.exists(self.path):
+            return
+        scores: Dict[str, float] = {}
+        with open(self.path) as stream:
+            lines = stream.readlines()
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # line written only partially by interrupted process, entries stored
+                # after it start on new line, see store
+                continue
+            try:
+                scores[entry["key"]] = float(entry["score"])
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "trial cache",
+                        f"Invalid entry on line {number} of {self.path}: {error}",
+                    )
+                )
+        with self._lock:
+            self._scores.update(scores)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._scores
+
+    def get(self, key: str) -> Optional[float]:
+        return self._scores.get(key)
+
+    def store(self, key: str, score: float, values: Optional[Dict[str, Any]] = None):
+        """
+        values: stored with score, so that entries are readable
+        Raises:
+            OSError
+        """
+        entry = {"key": key, "score": float(score)}
+        if values is not None:
+            entry["values"] = _canonical(values)
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a+b") as stream:
+                # previous line could be written only partially, entry must not
+                # be appended to it
+                if stream.seek(0, os.SEEK_END) > 0:
+                    stream.seek(-1, os.SEEK_END)
+                    if stream.read(1) != b"\n":
+                        line = "\n" + line
+                stream.write(line.encode())
+            self._scores[key] = float(score)
+
+    def evaluate(
+        self,
+        values: Dict[str, Any],
+        objective: Callable[[], float],
+        trial: Optional[optuna.Trial] = None,
+    ) -> float:
+        """
+        Returns stored score of values, objective is called only for new values
+        and its score is stored.
+        trial: user attribute "cached" of trial is set, so repeated trials can be
+            filtered out of study
+        Raises:
+            OSError
+        """
+        key = assignment_key(values)
+        score = self.get(key)
+        if trial is not None:
+            trial.set_user_attr("cached", score is not None)
+        if score is None:
+            score = objective()
+            self.store(key, score, values)
+        return score
@@ -1,2 +1,18 @@
 from configuration_engine.datasets.dataset_schema import DatasetSchema
-from configuration_engine.datasets.training_dataset import PandasDataset
\ No newline at end of file
+from configuration_engine.datasets.training_dataset import PandasDataset
+from configuration_engine.datasets.dataset_cache import (
+    DatasetCache,
+    file_fingerprint,
+    dataset_fingerprint,
+)
+from configuration_engine.datasets.category_inference import (
+    distinct_values,
+    read_distinct_values,
+    merge_categories,
+)
+from configuration_engine.datasets.streaming import (
+    StreamingOptions,
+    iter_chunks,
+    read_chunked,
+    spill_to_parquet,
+)
@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from configuration_engine.datasets.dataset_cache import dataset_fingerprint
+from configuration_engine.datasets.streaming import CHUNK_SIZE, iter_chunks
+
+
+def read_distinct_values(
+    path: str,
+    columns: List[str],
+    filters: Optional[List[Any]] = None,
+    chunksize: int = CHUNK_SIZE,
+) -> Dict[str, List[Any]]:
+    """
+    Distinct non missing values of columns, file is read in chunks.
+    Raises:
+        OSError
+        ValueError
+    """
+    values: Dict[str, set] = {column: set() for column in columns}
+    for chunk in iter_chunks(path, columns, filters, chunksize=chunksize):
+        for column in columns:
+            values[column].update(chunk[column].dropna().unique().tolist())
+    return {column: list(distinct) for column, distinct in values.items()}
+
+
+def distinct_values(
+    path: str,
+    columns: List[str],
+    filters: Optional[List[Any]] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Same as read_distinct_values, result is cached in cache_dir as json,
+    key is fingerprint of file, columns and filters.
+    Raises:
+        OSError
+        ValueError
+    """
+    if cache_dir is None:
+        return read_distinct_values(path, columns, filters)
+    key = dataset_fingerprint(path, columns=sorted(columns), filters=filters)
+    entry_path = os.path.join(cache_dir, f"{key}.categories.json")
+    if os.path.exists(entry_path):
+        with open(entry_path) as stream:
+            return json.load(stream)
+    values = read_distinct_values(path, columns, filters)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as stream:
+        json.dump(values, stream)
+    os.replace(tmp_path, entry_path)
+    return values
+
+
+def merge_categories(
+    values: List[Dict[str, List[Any]]], columns: Dict[str, List[str]]
+) -> Dict[str, pd.CategoricalDtype]:
+    """
+    values: distinct values of columns of each file
+    columns: columns of each category
+    Returns:
+        category for each name, categories are sorted, so they don't depend on order
+        of files
+    """
+    categories: Dict[str, pd.CategoricalDtype] = {}
+    for name, category_columns in columns.items():
+        distinct = set()
+        for file_values in values:
+            for column in category_columns:
+                distinct.update(file_values.get(column, []))
+        try:
+            ordered = sorted(distinct)
+        except TypeError:
+            ordered = sorted(distinct, key=lambda value: (type(value).__name__, value))
+        categories[name] = pd.CategoricalDtype(categories=ordered)
+    return categories
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Optional
+import pandas as pd
+
+_CHUNK_SIZE = 1 << 20
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Fingerprint of file combining absolute path, size, mtime and hash of its content.
+    Raises:
+        OSError
+    """
+    stat = os.stat(path)
+    content = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as stream:
+        while chunk := stream.read(_CHUNK_SIZE):
+            content.update(chunk)
+    fingerprint = hashlib.blake2b(digest_size=16)
+    fingerprint.update(
+        json.dumps(
+            [os.path.abspath(path), stat.st_size, stat.st_mtime_ns, content.hexdigest()]
+        ).encode()
+    )
+    return fingerprint.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, pd.CategoricalDtype):
+        return {"categories": value.categories.tolist(), "ordered": value.ordered}
+    return str(value)
+
+
+def dataset_fingerprint(path: str, **read_options: Any) -> str:
+    """
+    Fingerprint of parsed dataset, combines file fingerprint with options,
+    that change parsed frame (columns, filters, dtype, ...).
+    Raises:
+        OSError
+    """
+    key = hashlib.blake2b(digest_size=16)
+    key.update(file_fingerprint(path).encode())
+    key.update(json.dumps(read_options, sort_keys=True, default=_json_default).encode())
+    return key.hexdigest()
+
+
+class DatasetCache:
+    """
+    On disk cache of parsed datasets, frames are stored as uncompressed Arrow IPC (feather)
+    files, so they can be memory mapped when loading.
+    Requires pyarrow.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def key(self, path: str, **read_options: Any) -> str:
+        """
+        read_options: options that change parsed frame (columns, filters, dtype, ...)
+        Raises:
+            OSError
+        """
+        return dataset_fingerprint(path, **read_options)
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns None when key isn't cached.
+        """
+        from pyarrow import feather
+
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            return None
+        return feather.read_table(path, memory_map=True).to_pandas()
+
+    def store(self, key: str, data: pd.DataFrame):
+        """
+        Raises:
+            OSError
+        """
+        from pyarrow import feather
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.entry_path(key)
+        # datasets are loaded by threads, they can store same key concurrently
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        feather.write_feather(data, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
@@ -1,10 +1,13 @@
-from typing import Union
+from typing import Union, Optional, List, Tuple, Dict, Any
 from configuration_engine.parameter import (
     RangeParameterSchema,
     ConstantParameter,
 )
 from configuration_engine import Base
+from pydantic import Field
 from configuration_engine.datasets.training_dataset import PandasDataset
+from configuration_engine.datasets.category_inference import distinct_values
+from configuration_engine.datasets.streaming import StreamingOptions, CHUNK_SIZE
 
 
 class DatasetSchema(Base[PandasDataset]):
@@ -12,12 +15,73 @@ class DatasetSchema(Base[PandasDataset]):
     path: str
     weight: Union[float, RangeParameterSchema[float]] = 1.0
     cv: bool = False
+    # column projection, None means all columns
+    columns: Optional[List[str]] = None
+    # parquet row filters, e.g. [["year", ">=", 2020]]
+    filters: Optional[List[Tuple[str, str, Union[int, float, str, bool, list]]]] = None
+    # directory of binary cache of parsed dataset, None disables caching
+    cache_dir: Optional[str] = None
+    # dataset is loaded on first access of data
+    lazy: bool = False
+    # file is read in chunks of this many rows, None reads it at once,
+    # unless other streaming option is set
+    chunksize: Optional[int] = Field(default=None, ge=1)
+    # maximal bytes of read data
+    memory_limit: Optional[int] = Field(default=None, ge=1)
+    # numeric columns are downcast chunk by chunk
+    downcast: bool = False
+    # csv file is converted to parquet in this directory chunk by chunk
+    spill_dir: Optional[str] = None
 
-    def build(self) -> PandasDataset:
+    def streaming(self) -> Optional[StreamingOptions]:
+        if (
+            self.chunksize is None
+            and self.memory_limit is None
+            and not self.downcast
+            and self.spill_dir is None
+        ):
+            return None
+        return StreamingOptions(
+            chunksize=self.chunksize or CHUNK_SIZE,
+            memory_limit=self.memory_limit,
+            downcast=self.downcast,
+            spill_dir=self.spill_dir,
+        )
+
+    def build(
+        self,
+        lazy: Optional[bool] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> PandasDataset:
+        """
+        lazy: overrides lazy field, when set
+        dtype: types columns are parsed into, see PandasDataset.from_file
+        exclude: columns that aren't read
+        """
         if isinstance(self.weight, float):
             parameter = ConstantParameter[float](name="weight", value=self.weight)
         else:
             parameter = self.weight.build("weight", f"weight_{self.name}")
         return PandasDataset.from_file(
-            path=self.path, name=self.name, weight=parameter, cv=self.cv
+            path=self.path,
+            name=self.name,
+            weight=parameter,
+            cv=self.cv,
+            columns=self.columns,
+            filters=self.filters,
+            cache_dir=self.cache_dir,
+            lazy=self.lazy if lazy is None else lazy,
+            dtype=dtype,
+            exclude=exclude,
+            streaming=self.streaming(),
         )
+
+    def distinct_values(self, columns: List[str]) -> Dict[str, List[Any]]:
+        """
+        Distinct values of columns, read in chunks, cached in cache_dir.
+        Raises:
+            OSError
+            ValueError
+        """
+        return distinct_values(self.path, columns, self.filters, self.cache_dir)
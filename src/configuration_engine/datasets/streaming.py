@@ -0,0 +1,266 @@
+import os
+import threading
+import pathlib
+from typing import Any, Dict, Iterator, List, Optional
+from dataclasses import dataclass
+import pandas as pd
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+
+# rows read at once
+CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class StreamingOptions:
+    """
+    Options of chunked reading of datasets, that don't fit into memory as raw frame.
+    """
+
+    chunksize: int = CHUNK_SIZE
+    # maximal bytes of read data, None means unlimited
+    memory_limit: Optional[int] = None
+    # numeric columns are downcast chunk by chunk
+    downcast: bool = False
+    # csv files are converted to parquet in this directory, before they are read
+    spill_dir: Optional[str] = None
+
+
+def file_format(path: str, operation: str) -> str:
+    """
+    Raises:
+        ValueError: when file isn't csv or parquet
+    """
+    suffix = pathlib.Path(path).suffix
+    if suffix not in (".csv", ".parquet"):
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                operation,
+                f"Couln't determine extension of file {path}!",
+            )
+        )
+    return suffix[1:]
+
+
+def check_filters(path: str, filters: Optional[List[Any]], operation: str):
+    """
+    Raises:
+        ValueError: when filters are used with csv file
+    """
+    if filters and file_format(path, operation) == "csv":
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                operation,
+                f"Row filters are supported only for parquet files, not for {path}!",
+            )
+        )
+
+
+def check_dtype_columns(
+    path: str, data: pd.DataFrame, dtype: Optional[Dict[str, Any]], operation: str
+):
+    """
+    Raises:
+        ValueError: when column of dtype isn't in the file
+    """
+    missing = [column for column in dtype or {} if column not in data.columns]
+    if missing:
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                operation,
+                f"File {path} doesn't contain columns {missing}!",
+            )
+        )
+
+
+def file_columns(path: str) -> List[str]:
+    """
+    Columns of file, only header or schema is read.
+    Raises:
+        OSError
+        ValueError: when file isn't csv or parquet
+    """
+    if file_format(path, "from_file") == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    from pyarrow import parquet
+
+    return [
+        column
+        for column in parquet.read_schema(path).names
+        if not column.startswith("__index_level_")
+    ]
+
+
+def column_projection(
+    path: str, columns: Optional[List[str]], exclude: Optional[List[str]]
+) -> Optional[List[str]]:
+    """
+    Columns read from file, without excluded columns. Excluded columns must be
+    in header of file, so that excluding them fails same way as dropping them.
+    Raises:
+        OSError
+        ValueError: when excluded column isn't in the file
+    """
+    if not exclude:
+        return columns
+    header = file_columns(path)
+    missing = [column for column in exclude if column not in header]
+    if missing:
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                "from_file",
+                f"File {path} doesn't contain excluded columns {missing}!",
+            )
+        )
+    if columns is not None:
+        return [column for column in columns if column not in exclude]
+    return [column for column in header if column not in exclude]
+
+
+def iter_chunks(
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    exclude: Optional[List[str]] = None,
+    chunksize: int = CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads file in chunks of rows, memory is bounded by chunk size.
+    At least one, possibly empty, chunk is returned.
+    Csv types are inferred for each chunk, dtype should fix types of columns,
+    whose inferred type could differ between chunks.
+    Raises:
+        OSError
+        ValueError
+    """
+    check_filters(path, filters, "read chunks")
+    projection = column_projection(path, columns, exclude)
+    if file_format(path, "read chunks") == "csv":
+        with pd.read_csv(
+            path, usecols=projection, dtype=dtype, chunksize=chunksize
+        ) as reader:
+            empty = True
+            for chunk in reader:
+                check_dtype_columns(path, chunk, dtype, "read chunks")
+                empty = False
+                yield chunk
+        if empty:
+            yield pd.read_csv(path, usecols=projection, dtype=dtype, nrows=0)
+        return
+    from pyarrow import dataset, parquet
+
+    source = dataset.dataset(path, format="parquet")
+    batches = source.to_batches(
+        columns=projection,
+        filter=parquet.filters_to_expression(filters) if filters else None,
+        batch_size=chunksize,
+    )
+    empty = True
+    for batch in batches:
+        chunk = batch.to_pandas()
+        check_dtype_columns(path, chunk, dtype, "read chunks")
+        empty = False
+        yield chunk.astype(dtype) if dtype else chunk
+    if empty:
+        chunk = source.schema.empty_table().select(projection or source.schema.names)
+        chunk = chunk.to_pandas()
+        check_dtype_columns(path, chunk, dtype, "read chunks")
+        yield chunk.astype(dtype) if dtype else chunk
+
+
+def read_chunked(
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Any]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    exclude: Optional[List[str]] = None,
+    chunksize: int = CHUNK_SIZE,
+    downcast: bool = False,
+    memory_limit: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Reads file chunk by chunk, each chunk is compacted before next one is read,
+    so raw strings of whole file never exist at once.
+    downcast: numeric columns of chunks are downcast, chunks are concatenated
+        to common type, see Downcast
+    memory_limit: maximal bytes of compacted chunks, concatenation needs the same
+        amount again
+    Raises:
+        OSError
+        ValueError
+        MemoryError: when compacted chunks exceed memory_limit
+    """
+    from configuration_engine.processing_action.pandas import Downcast
+
+    chunks: List[pd.DataFrame] = []
+    size = 0
+    for chunk in iter_chunks(path, columns, filters, dtype, exclude, chunksize):
+        if downcast:
+            chunk = Downcast(max_category_ratio=None).fit_transform(chunk)
+        size += int(chunk.memory_usage(index=True, deep=True).sum())
+        if memory_limit is not None and size > memory_limit:
+            raise MemoryError(
+                error_message(
+                    MODULE_NAME,
+                    "read chunks",
+                    f"File {path} exceeds memory limit of {memory_limit} bytes, "
+                    "spill it to parquet and read only needed columns or rows!",
+                )
+            )
+        chunks.append(chunk)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, axis=0, ignore_index=True)
+
+
+def spill_to_parquet(
+    path: str,
+    output_path: str,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    exclude: Optional[List[str]] = None,
+    chunksize: int = CHUNK_SIZE,
+):
+    """
+    Converts csv file to parquet chunk by chunk, memory is bounded by chunk size.
+    Schema is given by first chunk, following chunks are cast to it.
+    Raises:
+        OSError
+        ValueError: also when chunk can't be cast to schema of first chunk
+        ImportError: without pyarrow installed
+    """
+    import pyarrow as pa
+    from pyarrow import parquet
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    writer: Optional[parquet.ParquetWriter] = None
+    try:
+        for chunk in iter_chunks(path, columns, None, dtype, exclude, chunksize):
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = parquet.ParquetWriter(tmp_path, table.schema)
+            else:
+                try:
+                    table = pa.Table.from_pandas(
+                        chunk, schema=writer.schema, preserve_index=False
+                    )
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+                    raise ValueError(
+                        error_message(
+                            MODULE_NAME,
+                            "spill",
+                            f"Chunk of {path} doesn't match types of first chunk, "
+                            f"set dtype of its columns: {error}",
+                        )
+                    )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, output_path)
@@ -1,10 +1,27 @@
 import pandas as pd
 from configuration_engine.parameter import Parameter
 from abc import ABC
-from typing import Optional
+from typing import Optional, List, Tuple, Any, Callable, Dict
+import functools
 import pathlib
+import threading
 from configuration_engine.error import error_message
+from configuration_engine.datasets.dataset_cache import (
+    DatasetCache,
+    dataset_fingerprint,
+)
+from configuration_engine.datasets.streaming import (
+    StreamingOptions,
+    column_projection,
+    file_format,
+    read_chunked,
+    spill_to_parquet,
+)
 from configuration_engine.constants import *
+import os
+
+
+ParquetFilter = Tuple[str, str, Any]
 
 
 class BaseDataset(ABC):
@@ -14,18 +31,187 @@ class BaseDataset(ABC):
 class PandasDataset(BaseDataset):
 
     @staticmethod
-    def from_file(path: str, name: str, weight: Parameter[float], cv: bool):
+    def from_file(
+        path: str,
+        name: str,
+        weight: Parameter[float],
+        cv: bool,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[ParquetFilter]] = None,
+        cache_dir: Optional[str] = None,
+        lazy: bool = False,
+        dtype: Optional[Dict[str, Any]] = None,
+        exclude: Optional[List[str]] = None,
+        streaming: Optional[StreamingOptions] = None,
+    ):
+        """
+        columns: only these columns are read from the file, if None all columns are read
+        filters: parquet only, row filters in pyarrow DNF form [(column, op, value), ...],
+            row groups are skipped based on their statistics
+        dtype: types of columns, csv columns are parsed directly into them, so
+            categorical columns never exist as strings
+        exclude: columns that aren't read from the file
+        cache_dir: if set parsed frame is cached in this directory, see DatasetCache
+        lazy: if True file is read on first access of data, errors are raised then
+        streaming: if set file is read in chunks, see read_chunked
+        Raise:
+            OSError
+            ValueError
+            MemoryError: when streamed data exceed memory limit
+            ImportError: when reading parquet or using cache without pyarrow installed
+        """
+        loader = functools.partial(
+            PandasDataset.load_file,
+            path,
+            columns,
+            filters,
+            cache_dir,
+            dtype,
+            exclude,
+            streaming,
+        )
+        return PandasDataset(
+            data=None if lazy else loader(),
+            name=name,
+            weight=weight,
+            cv=cv,
+            path=path,
+            loader=loader,
+            read_options={
+                "columns": columns,
+                "filters": filters,
+                "dtype": dtype,
+                "exclude": exclude,
+                "downcast": streaming is not None and streaming.downcast,
+            },
+        )
+
+    @staticmethod
+    def load_file(
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[ParquetFilter]] = None,
+        cache_dir: Optional[str] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        exclude: Optional[List[str]] = None,
+        streaming: Optional[StreamingOptions] = None,
+    ) -> pd.DataFrame:
         """
+        Reads file through the dataset cache, if cache_dir is set.
         Raise:
             OSError
             ValueError
+            MemoryError: when streamed data exceed memory limit
+        """
+        read = functools.partial(
+            PandasDataset.stream_file if streaming else PandasDataset.read_file,
+            path,
+            columns,
+            filters,
+            dtype,
+            exclude,
+        )
+        if streaming:
+            read = functools.partial(read, streaming)
+        if cache_dir is None:
+            return read()
+        cache = DatasetCache(cache_dir)
+        key = cache.key(
+            path,
+            columns=columns,
+            filters=filters,
+            dtype=dtype,
+            exclude=exclude,
+            downcast=streaming is not None and streaming.downcast,
+        )
+        data = cache.load(key)
+        if data is None:
+            data = read()
+            cache.store(key, data)
+        return data
+
+    @staticmethod
+    def stream_file(
+        path: str,
+        columns: Optional[List[str]],
+        filters: Optional[List[ParquetFilter]],
+        dtype: Optional[Dict[str, Any]],
+        exclude: Optional[List[str]],
+        streaming: StreamingOptions,
+    ) -> pd.DataFrame:
+        """
+        Reads file in chunks, csv file is first converted to parquet, if spill_dir is set,
+        conversion is reused while csv file doesn't change.
+        Raise:
+            OSError
+            ValueError
+            MemoryError: when data exceed memory limit
+        """
+        if streaming.spill_dir is not None and file_format(path, "from_file") == "csv":
+            key = dataset_fingerprint(
+                path, columns=columns, dtype=dtype, exclude=exclude
+            )
+            spilled = os.path.join(streaming.spill_dir, f"{key}.parquet")
+            if not os.path.exists(spilled):
+                # dtype fixes types of columns, whose inferred type differs by chunk
+                spill_to_parquet(
+                    path,
+                    spilled,
+                    columns,
+                    dtype,
+                    exclude,
+                    streaming.chunksize,
+                )
+            # dtype is applied again when reading, parquet chunks keep only used
+            # categories
+            path, columns, exclude = spilled, None, None
+        return read_chunked(
+            path,
+            columns,
+            filters,
+            dtype,
+            exclude,
+            streaming.chunksize,
+            streaming.downcast,
+            streaming.memory_limit,
+        )
+
+    @staticmethod
+    def read_file(
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[ParquetFilter]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Parquet columns are already typed, so dtype is applied after reading.
+        Raise:
+            OSError
+            ValueError: also when column of dtype isn't in the file
         """
         suffix = pathlib.Path(path).suffix
         match suffix:
             case ".csv":
-                data = pd.read_csv(path)
+                if filters:
+                    raise ValueError(
+                        error_message(
+                            MODULE_NAME,
+                            "from_file",
+                            f"Row filters are supported only for parquet files, not for {path}!",
+                        )
+                    )
+                data = pd.read_csv(
+                    path, usecols=column_projection(path, columns, exclude), dtype=dtype
+                )
             case ".parquet":
-                data = pd.read_csv(path)
+                data = pd.read_parquet(
+                    path,
+                    engine="pyarrow",
+                    columns=column_projection(path, columns, exclude),
+                    filters=filters or None,
+                    use_threads=True,
+                )
             case _:
                 raise ValueError(
                     error_message(
@@ -34,21 +220,108 @@ class PandasDataset(BaseDataset):
                         f"Couln't determine extension of file {path}!",
                     )
                 )
-        return PandasDataset(data=data, name=name, weight=weight, cv=cv, path=path)
+        if dtype:
+            missing = [column for column in dtype if column not in data.columns]
+            if missing:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "from_file",
+                        f"File {path} doesn't contain columns {missing}!",
+                    )
+                )
+            data = data.astype(dtype)
+        return data
 
     def __init__(
         self,
-        data: pd.DataFrame,
+        data: Optional[pd.DataFrame],
         name: str,
         weight: Parameter[float],
         cv: bool,
         path: Optional[str] = None,
+        loader: Optional[Callable[[], pd.DataFrame]] = None,
+        read_options: Optional[Dict[str, Any]] = None,
     ):
         """
         cv: říká jestli data z datasetu můžou patříti mezi validační data v rámci cross validace
+        loader: loads data, when data is None or was released
+        read_options: options data was read with from path, part of fingerprint
         """
-        self.data = data
+        if data is None and loader is None:
+            raise ValueError(
+                error_message(
+                    MODULE_NAME,
+                    "dataset",
+                    f"Dataset {name} needs either data or loader!",
+                )
+            )
+        self._data = data
+        self._loader = loader
+        self._lock = threading.Lock()
         self.name = name
         self.weight = weight
         self.cv = cv
         self.path = path
+        self.read_options = read_options or {}
+        self._fingerprint: Optional[str] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies get their own lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """
+        Loads data on first access, if dataset is lazy.
+        """
+        data = self._data
+        if data is not None:
+            return data
+        with self._lock:
+            if self._data is None:
+                self._data = self._loader()
+            return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame):
+        self._data = data
+
+    def fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint of file and read options, computed once.
+        Returns None for datasets, that weren't read from file.
+        Raises:
+            OSError
+        """
+        if self.path is None:
+            return None
+        if self._fingerprint is None:
+            self._fingerprint = dataset_fingerprint(self.path, **self.read_options)
+        return self._fingerprint
+
+    def is_loaded(self) -> bool:
+        return self._data is not None
+
+    def release(self):
+        """
+        Frees loaded data, next access of data loads it again.
+        Raises:
+            ValueError: if dataset has no loader, so data couldn't be loaded again
+        """
+        if self._loader is None:
+            raise ValueError(
+                error_message(
+                    MODULE_NAME,
+                    "release",
+                    f"Dataset {self.name} can't be released, it has no loader!",
+                )
+            )
+        with self._lock:
+            self._data = None
@@ -0,0 +1,10 @@
+from configuration_engine.folds.fold_engine import (
+    FoldEngine,
+    Fold,
+    target_fingerprint,
+)
+from configuration_engine.folds.subsample import (
+    NestedSubsampler,
+    restrict_folds,
+    check_fraction,
+)
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+# (train indices, validation indices)
+Fold = Tuple[np.ndarray, np.ndarray]
+FoldKey = Tuple[int, int, str, int, int]
+
+
+def target_fingerprint(target: Union[pd.Series, np.ndarray]) -> str:
+    """
+    Hash of target values, index isn't part of the hash.
+    """
+    hashed = pd.util.hash_pandas_object(pd.Series(target), index=False)
+    return hashlib.blake2b(hashed.to_numpy().tobytes(), digest_size=16).hexdigest()
+
+
+def index_dtype(n_rows: int) -> type:
+    if n_rows <= np.iinfo(np.int32).max:
+        return np.int32
+    return np.int64
+
+
+class FoldEngine:
+    """
+    Memoized stratified k-fold splits.
+    Splits are computed once for each (seed, k_folds, target fingerprint, n_rows, n_additional)
+    and stored as compact index arrays, optionally also on disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        cache_dir: if set, splits are persisted in this directory
+        """
+        self.cache_dir = cache_dir
+        self._folds: Dict[FoldKey, List[Fold]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies get their own lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def split(
+        self,
+        target: Union[pd.Series, np.ndarray],
+        k_folds: int,
+        seed: int,
+        n_additional: int = 0,
+    ) -> List[Fold]:
+        """
+        Stratified splits of target rows, n_additional rows, that follow target rows,
+        are appended to train indices of each fold.
+        Returned arrays are shared, so they shouldn't be modified.
+        Raises:
+            ValueError: if target can't be split into k_folds
+        """
+        key = (seed, k_folds, target_fingerprint(target), len(target), n_additional)
+        with self._lock:
+            folds = self._folds.get(key)
+            if folds is None:
+                folds = self._load(key)
+            if folds is None:
+                folds = self._compute(target, k_folds, seed, n_additional)
+                self._store(key, folds)
+            self._folds[key] = folds
+        return folds
+
+    def clear(self):
+        with self._lock:
+            self._folds.clear()
+
+    def _compute(
+        self,
+        target: Union[pd.Series, np.ndarray],
+        k_folds: int,
+        seed: int,
+        n_additional: int,
+    ) -> List[Fold]:
+        n_rows = len(target)
+        dtype = index_dtype(n_rows + n_additional)
+        kf = StratifiedKFold(n_splits=k_folds, shuffle=True, random_state=seed)
+        additional = np.arange(n_rows, n_rows + n_additional, dtype=dtype)
+        folds: List[Fold] = []
+        for train_idx, val_idx in kf.split(X=np.zeros(n_rows), y=target):
+            train = np.empty(train_idx.shape[0] + n_additional, dtype=dtype)
+            train[: train_idx.shape[0]] = train_idx
+            train[train_idx.shape[0] :] = additional
+            folds.append((train, val_idx.astype(dtype)))
+        return folds
+
+    def _path(self, key: FoldKey) -> str:
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.npz")
+
+    def _load(self, key: FoldKey) -> Optional[List[Fold]]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as stored:
+            return [(stored[f"train_{i}"], stored[f"valid_{i}"]) for i in range(key[1])]
+
+    def _store(self, key: FoldKey, folds: List[Fold]):
+        """
+        Raises:
+            OSError
+        """
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        arrays: Dict[str, np.ndarray] = {}
+        for i, (train, valid) in enumerate(folds):
+            arrays[f"train_{i}"] = train
+            arrays[f"valid_{i}"] = valid
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
@@ -0,0 +1,78 @@
+from typing import List
+import numpy as np
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+from configuration_engine.folds.fold_engine import Fold, index_dtype
+
+
+def check_fraction(fraction: float):
+    """
+    Raises:
+        ValueError: when fraction isn't in (0, 1]
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                "subsample",
+                f"Fraction of rows must be in (0, 1], got {fraction}!",
+            )
+        )
+
+
+class NestedSubsampler:
+    """
+    Deterministic stratified subsamples, that are nested: subsample of smaller fraction
+    is subset of subsample of larger fraction with same seed.
+    Rows of each stratum are ranked in seeded random order once, subsample of fraction
+    contains ceil(fraction * size) best ranked rows of each stratum.
+    """
+
+    def __init__(self, strata: np.ndarray, seed: int):
+        """
+        strata: stratum of each row, e.g. codes of (dataset, target) pairs
+        """
+        strata = np.asarray(strata)
+        n_rows = strata.shape[0]
+        dtype = index_dtype(n_rows)
+        order = np.random.default_rng(seed).permutation(n_rows).astype(dtype)
+        _, codes, counts = np.unique(strata, return_inverse=True, return_counts=True)
+        codes = codes.reshape(-1)
+        # rows grouped by stratum, random order inside group
+        grouped = order[np.argsort(codes[order], kind="stable")]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        self._ranks = np.empty(n_rows, dtype=dtype)
+        self._ranks[grouped] = np.arange(n_rows, dtype=dtype) - np.repeat(
+            starts, counts
+        )
+        self._sizes = counts[codes]
+
+    def rows(self, fraction: float) -> np.ndarray:
+        """
+        Sorted positions of rows in subsample.
+        Raises:
+            ValueError: when fraction isn't in (0, 1]
+        """
+        check_fraction(fraction)
+        limit = np.ceil(self._sizes * fraction)
+        return np.flatnonzero(self._ranks < limit).astype(self._ranks.dtype)
+
+
+def restrict_folds(folds: List[Fold], rows: np.ndarray, n_rows: int) -> List[Fold]:
+    """
+    Folds of subsample, each row keeps its fold, positions are renumbered to positions
+    in subsample, so validation rows of nested subsamples are nested too.
+    rows: sorted positions of subsample rows
+    n_rows: number of rows folds were computed for
+    """
+    selected = np.zeros(n_rows, dtype=bool)
+    selected[rows] = True
+    restricted: List[Fold] = []
+    for train, valid in folds:
+        restricted.append(
+            (
+                np.searchsorted(rows, train[selected[train]]).astype(rows.dtype),
+                np.searchsorted(rows, valid[selected[valid]]).astype(rows.dtype),
+            )
+        )
+    return restricted
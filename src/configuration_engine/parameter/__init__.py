@@ -8,6 +8,7 @@ from configuration_engine.parameter.parameter_schema import (
     MultiFloatRangeSchema,
     MultiIntRangeSchema,
 )
+from configuration_engine.parameter.assignment import Assignment
 from configuration_engine.parameter.tunable_parameter import (
     Parameter,
     RangeParameter,
@@ -16,6 +17,11 @@ from configuration_engine.parameter.tunable_parameter import (
     ClassCallableParameter,
     MultiParameter,
 )
+from configuration_engine.parameter.grid import ParameterGrid
+from configuration_engine.parameter.search_space import (
+    compile_search_space,
+    ask_trials,
+)
 
 from configuration_engine.parameter.nontunable_parameter import (
     NontunableParameter,
@@ -0,0 +1,49 @@
+from typing import Any, Dict, Iterator, Optional, Union
+from optuna import Trial
+from optuna.trial import FrozenTrial
+
+
+class Assignment:
+    """
+    Values suggested for one trial, keyed by alias of parameter.
+    Values are raw values of optuna distributions, e.g. index of literal value,
+    so assignment of finished trial equals its params.
+    Parameters don't store suggestions, so one configuration can be shared by trials
+    running concurrently, each trial has its own assignment.
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None):
+        self.values: Dict[str, Any] = dict(values or {})
+
+    @staticmethod
+    def from_trial(trial: Union[Trial, FrozenTrial]) -> "Assignment":
+        """
+        Assignment of parameters already suggested by trial.
+        """
+        return Assignment(trial.params)
+
+    def get(self, alias: str, default: Any = None) -> Any:
+        return self.values.get(alias, default)
+
+    def __getitem__(self, alias: str) -> Any:
+        return self.values[alias]
+
+    def __setitem__(self, alias: str, value: Any):
+        self.values[alias] = value
+
+    def __contains__(self, alias: str) -> bool:
+        return alias in self.values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __eq__(self, other: Any):
+        if not isinstance(other, Assignment):
+            return False
+        return self.values == other.values
+
+    def __repr__(self) -> str:
+        return f"Assignment({self.values!r})"
@@ -0,0 +1,198 @@
+from typing import Any, Dict, Iterable, Iterator, List
+import bisect
+import itertools
+import math
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+from configuration_engine.parameter.assignment import Assignment
+from configuration_engine.parameter.tunable_parameter import (
+    Parameter,
+    ConstantParameter,
+    LiteralParameter,
+    ClassCallableParameter,
+    RangeParameter,
+    MultiParameter,
+)
+
+
+class GridAxis:
+    """
+    Values of one parameter in grid, point i is assignment of parameter,
+    values are computed from i, so they are never materialized.
+    """
+
+    def __init__(self, parameter: Parameter):
+        """
+        Raises:
+            ValueError: when parameter has infinitely many values, e.g. float range
+                without step
+        """
+        self.parameter = parameter
+        self.children: List[GridAxis] = []
+        self.offsets: List[int] = []
+        match parameter:
+            case ConstantParameter():
+                self.size = 1
+            case LiteralParameter():
+                self.size = len(parameter.values)
+            case ClassCallableParameter():
+                self.size = len(parameter.callables)
+            case RangeParameter():
+                if isinstance(parameter.min, int):
+                    step = parameter.step if parameter.step is not None else 1
+                elif parameter.step is None:
+                    raise ValueError(
+                        error_message(
+                            MODULE_NAME,
+                            "grid",
+                            f"Float range {parameter.alias} needs step to be "
+                            "enumerated!",
+                        )
+                    )
+                else:
+                    step = parameter.step
+                # small tolerance, so that max isn't lost to rounding of float step
+                self.size = max(
+                    0, math.floor((parameter.max - parameter.min) / step + 1e-9) + 1
+                )
+                self.step = step
+            case MultiParameter():
+                self.children = [GridAxis(child) for child in parameter.parameters]
+                sizes = [child.size for child in self.children]
+                self.offsets = list(itertools.accumulate(sizes, initial=0))
+                self.size = self.offsets[-1]
+            case _:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "grid",
+                        f"Parameter {parameter.alias} of type "
+                        f"{type(parameter).__name__} can't be enumerated!",
+                    )
+                )
+
+    def point(self, index: int, values: Dict[str, Any]):
+        """
+        Writes raw values of point index into values.
+        """
+        match self.parameter:
+            case ConstantParameter():
+                pass
+            case RangeParameter():
+                value = self.parameter.min + index * self.step
+                if isinstance(value, float):
+                    value = min(value, self.parameter.max)
+                values[self.parameter.alias] = value
+            case MultiParameter():
+                branch = bisect.bisect_right(self.offsets, index) - 1
+                values[self.parameter.alias] = branch
+                self.children[branch].point(index - self.offsets[branch], values)
+            case _:
+                values[self.parameter.alias] = index
+
+
+class ParameterGrid:
+    """
+    Lazy cartesian product of parameter values, for Metadata.tuner == "grid".
+    Point of grid is Assignment, parameters read their values from it by method first.
+    Literal, class callable and int range parameters are enumerated fully, float
+    range by its step, multi parameter is union of its parameters.
+    Points are indexed in mixed radix, last parameter changes fastest, so any point
+    can be computed from its index without enumerating previous points.
+    Size is python int, so it isn't exposed by len, which is limited to sys.maxsize.
+    """
+
+    def __init__(self, parameters: Iterable[Parameter]):
+        """
+        Raises:
+            ValueError: when parameter can't be enumerated or aliases aren't unique
+        """
+        self.axes: List[GridAxis] = []
+        aliases = set()
+        for parameter in parameters:
+            axis = GridAxis(parameter)
+            new_aliases = set(axis_aliases(axis))
+            if aliases & new_aliases:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "grid",
+                        f"Aliases {sorted(aliases & new_aliases)} aren't unique!",
+                    )
+                )
+            aliases |= new_aliases
+            self.axes.append(axis)
+        self.size = math.prod(axis.size for axis in self.axes)
+
+    def __getitem__(self, index: int) -> Assignment:
+        """
+        Raises:
+            IndexError: when index is out of grid
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} is out of grid of size {self.size}!")
+        digits: List[int] = []
+        for axis in reversed(self.axes):
+            index, digit = divmod(index, axis.size)
+            digits.append(digit)
+        values: Dict[str, Any] = {}
+        for axis, digit in zip(self.axes, reversed(digits)):
+            axis.point(digit, values)
+        return Assignment(values)
+
+    def __iter__(self) -> Iterator[Assignment]:
+        return self.iterate()
+
+    def shard_size(self, shard: int = 0, n_shards: int = 1) -> int:
+        """
+        Number of points of shard.
+        """
+        check_shard(shard, n_shards)
+        return max(0, -(-(self.size - shard) // n_shards))
+
+    def iterate(
+        self, shard: int = 0, n_shards: int = 1, offset: int = 0
+    ) -> Iterator[Assignment]:
+        """
+        Points of shard, shard contains every n_shards-th point starting at shard,
+        so shards are disjoint, cover grid and have similar mixes of values.
+        offset: number of points of shard to skip, e.g. points evaluated before restart
+        Raises:
+            ValueError: when shard isn't in [0, n_shards) or offset is negative
+        """
+        check_shard(shard, n_shards)
+        if offset < 0:
+            raise ValueError(
+                error_message(
+                    MODULE_NAME, "grid", f"Offset must be non negative, got {offset}!"
+                )
+            )
+        indices = range(shard + offset * n_shards, self.size, n_shards)
+        return (self[index] for index in indices)
+
+
+def axis_aliases(axis: GridAxis) -> Iterator[str]:
+    """
+    Aliases assigned by axis.
+    """
+    if not isinstance(axis.parameter, ConstantParameter):
+        yield axis.parameter.alias
+    for child in axis.children:
+        yield from axis_aliases(child)
+
+
+def check_shard(shard: int, n_shards: int):
+    """
+    Raises:
+        ValueError: when shard isn't in [0, n_shards)
+    """
+    if n_shards < 1 or not 0 <= shard < n_shards:
+        raise ValueError(
+            error_message(
+                MODULE_NAME,
+                "grid",
+                f"Shard {shard} must be in [0, {n_shards}), n_shards at least 1!",
+            )
+        )
@@ -7,8 +7,8 @@ from configuration_engine.parameter.tunable_parameter import (
     Parameter,
 )
 from pydantic import BaseModel
+from configuration_engine.utils import check_class_path
 from abc import ABC, abstractmethod
-from configuration_engine.utils import resolve_function
 
 
 class Tunable:
@@ -35,17 +35,20 @@ class ClassCallableSchema(BaseParameter[ClassCallableParameter]):
     callable_class: str | list[str]
 
     def build(self, name: str, alias: Optional[str] = None) -> ClassCallableParameter:
+        """
+        Classes aren't imported, only chosen class is imported and instantiated
+        by parameter, see ClassCallableParameter. Modules of classes are looked up
+        without importing them, so misspelled paths fail here.
+        Raises:
+            ValueError: when module of class doesn't exist
+        """
         if isinstance(self.callable_class, str):
-            converted_callables = [resolve_function(self.callable_class)()]
-        elif isinstance(self.callable_class, list) and all(
-            isinstance(item, str) for item in self.callable_class
-        ):
-            converted_callables = [
-                resolve_function(fn)() for fn in self.callable_class
-            ]
-        return ClassCallableParameter(
-            name=name, callables=converted_callables, alias=alias
-        )
+            paths = [self.callable_class]
+        else:
+            paths = list(self.callable_class)
+        for path in paths:
+            check_class_path(path)
+        return ClassCallableParameter(name=name, callables=paths, alias=alias)
 
 
 class RangeParameterSchema[RangeType: (int, float)](
@@ -59,7 +62,7 @@ class RangeParameterSchema[RangeType: (int, float)](
     def build(
         self, name: str, alias: Optional[str] = None
     ) -> RangeParameter[RangeType]:
-        return RangeParameter[RangeType](
+        return RangeParameter(
             name=name,
             alias=alias,
             min=self.min,
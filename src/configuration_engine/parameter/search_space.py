@@ -0,0 +1,50 @@
+from typing import Dict, Iterable, List, Tuple
+import optuna
+from optuna.distributions import BaseDistribution
+from configuration_engine.error import error_message
+from configuration_engine.constants import *
+from configuration_engine.parameter.assignment import Assignment
+from configuration_engine.parameter.tunable_parameter import Parameter
+
+
+def compile_search_space(
+    parameters: Iterable[Parameter],
+) -> Dict[str, BaseDistribution]:
+    """
+    Flat search space of parameters, alias of each parameter is mapped to its optuna
+    distribution, see Parameter.distributions.
+    Raises:
+        ValueError: when two parameters share alias with different distributions
+    """
+    space: Dict[str, BaseDistribution] = {}
+    for parameter in parameters:
+        for alias, distribution in parameter.distributions().items():
+            if alias in space and space[alias] != distribution:
+                raise ValueError(
+                    error_message(
+                        MODULE_NAME,
+                        "search space",
+                        f"Alias {alias} has distributions {space[alias]} and "
+                        f"{distribution}, aliases of parameters must be unique!",
+                    )
+                )
+            space[alias] = distribution
+    return space
+
+
+def ask_trials(
+    study: optuna.Study,
+    search_space: Dict[str, BaseDistribution],
+    n_trials: int,
+) -> List[Tuple[optuna.Trial, Assignment]]:
+    """
+    Asks study for batch of trials, whose parameters are sampled from whole search
+    space at once, so multivariate samplers see joint space from the first trial.
+    Values of parameters are in returned assignments, suggest of parameters returns
+    same values. Trials must be finished by study.tell.
+    """
+    trials: List[Tuple[optuna.Trial, Assignment]] = []
+    for _ in range(n_trials):
+        trial = study.ask(search_space)
+        trials.append((trial, Assignment.from_trial(trial)))
+    return trials
@@ -1,12 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from optuna import Trial
+from optuna.distributions import (
+    BaseDistribution,
+    IntDistribution,
+    FloatDistribution,
+)
+from configuration_engine.parameter.assignment import Assignment
+from configuration_engine.utils import resolve_class
 import math
 
 
 class Parameter[T](ABC):
     """
     Třída reprezentující tunable parametr
+    Parameter doesn't store suggested values, they are recorded into assignment of trial.
     """
 
     def __init__(self, name: str, alias: Optional[str] = None):
@@ -14,21 +22,42 @@ class Parameter[T](ABC):
         self.alias = name if not alias else alias
 
     @abstractmethod
-    def suggest(self, trial: Trial) -> T:
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None) -> T:
         """
         Value suggested by optuna
+        assignment: if set, suggestion is recorded into it
         """
         pass
 
     @abstractmethod
-    def first(self) -> T:
+    def first(self, assignment: Optional[Assignment] = None) -> T:
         """
-        Returns last suggested value
+        Returns value of assignment, default value if parameter isn't assigned
         """
         pass
 
-    def yaml(self):
-        return self.first()
+    def yaml(self, assignment: Optional[Assignment] = None):
+        return self.first(assignment)
+
+    @abstractmethod
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        """
+        Optuna distributions suggested by method suggest, keyed by alias.
+        Trial asked with them suggests same values as trial suggesting one by one.
+        """
+        pass
+
+    def record(self, assignment: Optional[Assignment], value: Any):
+        if assignment is not None:
+            assignment[self.alias] = value
+
+    def assigned(self, assignment: Optional[Assignment]) -> Any:
+        """
+        Raw value of assignment, None if parameter isn't assigned
+        """
+        if assignment is None:
+            return None
+        return assignment.get(self.alias)
 
     @abstractmethod
     def __eq__(self, other: Any):
@@ -41,12 +70,15 @@ class ConstantParameter[T](Parameter[T]):
         super().__init__(name, alias)
         self.value = value
 
-    def suggest(self, trial: Trial) -> T:
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None) -> T:
         return self.value
 
-    def first(self) -> T:
+    def first(self, assignment: Optional[Assignment] = None) -> T:
         return self.value
 
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        return {}
+
     def __eq__(self, other: Any):
         if not isinstance(other, ConstantParameter):
             return False
@@ -61,29 +93,56 @@ class ConstantParameter[T](Parameter[T]):
 
 
 class ClassCallableParameter(Parameter[Callable]):
+    """
+    Chooses one of classes and returns its instance.
+    Classes given by import path are imported and instantiated only when chosen,
+    each call of suggest or first returns new instance.
+    """
 
     def __init__(
         self,
         name: str,
-        callables: list[Callable],
+        callables: list[str | Callable],
         alias: Optional[str] = None,
     ):
+        """
+        callables: import paths of classes, e.g. "sklearn.tree.DecisionTreeClassifier",
+        or already constructed callables, that are returned as they are
+        """
         super().__init__(name, alias)
         self.callables = callables
-        self.index: int | None = None
 
-    def suggest(self, trial: Trial):
-        self.index = trial.suggest_int(
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None):
+        """
+        Raises:
+            ImportError, AttributeError, TypeError, ValueError: when chosen path
+                can't be resolved to class
+        """
+        index = trial.suggest_int(
             name=self.alias,
             low=0,
             high=len(self.callables) - 1,
         )
-        return self.callables[self.index]
+        self.record(assignment, index)
+        return self.instantiate(index)
+
+    def first(self, assignment: Optional[Assignment] = None):
+        """
+        Raises:
+            ImportError, AttributeError, TypeError, ValueError: when chosen path
+                can't be resolved to class
+        """
+        index = self.assigned(assignment)
+        return self.instantiate(0 if index is None else index)
+
+    def instantiate(self, index: int) -> Callable:
+        candidate = self.callables[index]
+        if isinstance(candidate, str):
+            return resolve_class(candidate)()
+        return candidate
 
-    def first(self):
-        if self.index is None:
-            return self.callables[0]
-        return self.callables[self.index]
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        return {self.alias: IntDistribution(low=0, high=len(self.callables) - 1)}
 
     def __eq__(self, other: Any):
         if not isinstance(other, ClassCallableParameter):
@@ -94,11 +153,16 @@ class ClassCallableParameter(Parameter[Callable]):
             and self.callables == other.callables
         )
 
-    def yaml(self):
-        obj = self.first()
-        return {
-            "callable_class": f"{obj.__class__.__module__}.{obj.__class__.__name__}"
-        }
+    def yaml(self, assignment: Optional[Assignment] = None):
+        """
+        Path of chosen class, class isn't imported, when it's given by path.
+        """
+        index = self.assigned(assignment)
+        candidate = self.callables[0 if index is None else index]
+        if isinstance(candidate, str):
+            return {"callable_class": candidate}
+        cls = candidate.__class__
+        return {"callable_class": f"{cls.__module__}.{cls.__name__}"}
 
 
 class LiteralParameter[T: (int | float | str | bool)](Parameter[T]):
@@ -106,20 +170,22 @@ class LiteralParameter[T: (int | float | str | bool)](Parameter[T]):
     def __init__(self, name: str, values: list[T], alias: Optional[str] = None):
         super().__init__(name, alias)
         self.values = values
-        self.index: int | None = None
 
-    def suggest(self, trial: Trial):
-        self.index = trial.suggest_int(
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None):
+        index = trial.suggest_int(
             name=self.alias,
             low=0,
             high=len(self.values) - 1,
         )
-        return self.values[self.index]
+        self.record(assignment, index)
+        return self.values[index]
 
-    def first(self):
-        if self.index is None:
-            return self.values[0]
-        return self.values[self.index]
+    def first(self, assignment: Optional[Assignment] = None):
+        index = self.assigned(assignment)
+        return self.values[0 if index is None else index]
+
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        return {self.alias: IntDistribution(low=0, high=len(self.values) - 1)}
 
     def __eq__(self, other: Any):
         """
@@ -153,29 +219,40 @@ class RangeParameter[T: (int, float)](Parameter[T]):
         self.max = max
         self.log = log
         self.step = step
-        self.suggested: T | None = None
-        self.was_suggested: bool = False
 
-    def suggest(self, trial: Trial) -> T:
-        self.was_suggested = True
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None) -> T:
         if isinstance(self.min, int):
-            self.suggested = trial.suggest_int(
+            suggested = trial.suggest_int(
                 self.alias,
                 low=self.min,
                 high=self.max,
                 log=self.log,
                 step=self.step if self.step is not None else 1,
             )
-            return self.suggested
-        self.suggested = trial.suggest_float(
-            self.alias, low=self.min, high=self.max, step=self.step, log=self.log
-        )
-        return self.suggested
+        else:
+            suggested = trial.suggest_float(
+                self.alias, low=self.min, high=self.max, step=self.step, log=self.log
+            )
+        self.record(assignment, suggested)
+        return suggested
+
+    def first(self, assignment: Optional[Assignment] = None):
+        suggested = self.assigned(assignment)
+        return self.min if suggested is None else suggested
 
-    def first(self):
-        if self.was_suggested:
-            return self.suggested
-        return self.min
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        if isinstance(self.min, int):
+            distribution = IntDistribution(
+                low=self.min,
+                high=self.max,
+                log=self.log,
+                step=self.step if self.step is not None else 1,
+            )
+        else:
+            distribution = FloatDistribution(
+                low=self.min, high=self.max, log=self.log, step=self.step
+            )
+        return {self.alias: distribution}
 
     def __eq__(self, other: Any):
         if not isinstance(other, RangeParameter):
@@ -207,20 +284,31 @@ class MultiParameter[T](Parameter[T]):
     ):
         super().__init__(name, alias)
         self.parameters = parameters
-        self.index: int | None = None
 
-    def suggest(self, trial: Trial) -> T:
-        self.index = trial.suggest_int(
+    def suggest(self, trial: Trial, assignment: Optional[Assignment] = None) -> T:
+        index = trial.suggest_int(
             name=self.alias,
             low=0,
             high=len(self.parameters) - 1,
         )
-        return self.parameters[self.index].suggest(trial)
+        self.record(assignment, index)
+        return self.parameters[index].suggest(trial, assignment)
+
+    def first(self, assignment: Optional[Assignment] = None):
+        index = self.assigned(assignment)
+        return self.parameters[0 if index is None else index].first(assignment)
 
-    def first(self):
-        if self.index is None:
-            return self.parameters[0]
-        return self.parameters[self.index].first()
+    def distributions(self) -> Dict[str, BaseDistribution]:
+        """
+        Choice of parameter and distributions of all parameters, parameters, that
+        aren't chosen, are sampled too, but their values aren't used.
+        """
+        distributions = {
+            self.alias: IntDistribution(low=0, high=len(self.parameters) - 1)
+        }
+        for parameter in self.parameters:
+            distributions.update(parameter.distributions())
+        return distributions
 
     def __eq__(self, other: Any):
         if not isinstance(other, MultiParameter):
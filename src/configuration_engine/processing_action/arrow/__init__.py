@@ -0,0 +1,14 @@
+from configuration_engine.processing_action.arrow.arrow_processing_action import (
+    ArrowProcessingAction,
+    ArrowColumnAction,
+    DropColumns,
+    ChangeCategory,
+    CategoryToCodes,
+    ChangeCategoryToCodes,
+)
+from configuration_engine.processing_action.arrow.arrow_pipeline import (
+    ArrowPipeline,
+    compile_arrow_pipeline,
+    frames_to_table,
+    to_arrow_action,
+)
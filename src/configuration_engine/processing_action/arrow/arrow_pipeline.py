@@ -0,0 +1,182 @@
+from typing import List, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+import time
+import pandas as pd
+import pyarrow as pa
+from configuration_engine import error_message
+from configuration_engine.constants import *
+from configuration_engine.processing_action.pandas import (
+    TabularProcessingAction,
+    compile_pipeline,
+)
+from configuration_engine.processing_action.pandas import (
+    tabular_processing_action as pandas_actions,
+)
+from configuration_engine.processing_action.arrow.arrow_processing_action import (
+    ArrowProcessingAction,
+    ArrowColumnAction,
+    DropColumns,
+    ChangeCategory,
+    CategoryToCodes,
+    ChangeCategoryToCodes,
+)
+
+
+class ArrowPipeline(ArrowProcessingAction):
+    """
+    Runs Arrow actions one after another, Arrow compute kernels run outside of GIL,
+    so with max_workers > 1 consecutive column actions are executed concurrently,
+    column by column, like in TabularPipeline.
+    Duration of each action from last run is stored in timings.
+    """
+
+    def __init__(
+        self, actions: List[ArrowProcessingAction], max_workers: Optional[int] = None
+    ):
+        super().__init__()
+        self.actions = actions
+        self.max_workers = max_workers
+        self.timings: List[Tuple[str, float]] = []
+
+    def transform(self, X: pa.Table) -> pa.Table:
+        """
+        Raises:
+            ValueError: when any action fails
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        return self._execute(X, False)
+
+    def fit_transform(self, X: pa.Table) -> pa.Table:
+        """
+        Raises:
+            ValueError: when any action fails
+        """
+        result = self._execute(X, True)
+        self._is_fitted = True
+        return result
+
+    def _execute(self, X: pa.Table, fit: bool) -> pa.Table:
+        self.timings = []
+        if self.max_workers is None or self.max_workers <= 1:
+            for action in self.actions:
+                X = self._run_action(action, X, fit)
+            return X
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for stage in self._stages():
+                if isinstance(stage, list):
+                    X = self._run_column_stage(executor, stage, X, fit)
+                else:
+                    X = self._run_action(stage, X, fit)
+        return X
+
+    def _run_action(
+        self, action: ArrowProcessingAction, X: pa.Table, fit: bool
+    ) -> pa.Table:
+        start = time.perf_counter()
+        result = action.fit_transform(X) if fit else action.transform(X)
+        self.timings.append((repr(action), time.perf_counter() - start))
+        return result
+
+    def _stages(
+        self,
+    ) -> List[Union[ArrowProcessingAction, List[ArrowColumnAction]]]:
+        stages: List[Union[ArrowProcessingAction, List[ArrowColumnAction]]] = []
+        for action in self.actions:
+            if not isinstance(action, ArrowColumnAction):
+                stages.append(action)
+            elif stages and isinstance(stages[-1], list):
+                stages[-1].append(action)
+            else:
+                stages.append([action])
+        return stages
+
+    def _run_column_stage(
+        self,
+        executor: ThreadPoolExecutor,
+        stage: List[ArrowColumnAction],
+        X: pa.Table,
+        fit: bool,
+    ) -> pa.Table:
+        chains: Dict[str, List[ArrowColumnAction]] = {}
+        for action in stage:
+            if not fit:
+                action.check_fitted()
+            action.check_column(X)
+            chains.setdefault(action.column, []).append(action)
+        futures = {
+            column: executor.submit(self._run_chain, X, column, chain, fit)
+            for column, chain in chains.items()
+        }
+        for column, future in futures.items():
+            transformed, timings = future.result()
+            X = X.set_column(X.column_names.index(column), column, transformed)
+            self.timings.extend(timings)
+        return X
+
+    @staticmethod
+    def _run_chain(
+        X: pa.Table, column: str, chain: List[ArrowColumnAction], fit: bool
+    ) -> Tuple[pa.ChunkedArray, List[Tuple[str, float]]]:
+        timings: List[Tuple[str, float]] = []
+        array = X.column(column)
+        for action in chain:
+            start = time.perf_counter()
+            if fit:
+                action.fit(X)
+            array = action.transform_column(array)
+            timings.append((repr(action), time.perf_counter() - start))
+        return array, timings
+
+
+def to_arrow_action(action: TabularProcessingAction) -> ArrowProcessingAction:
+    """
+    Arrow action with same result as pandas action.
+    Raises:
+        ValueError: when action has no Arrow implementation
+    """
+    match action:
+        case pandas_actions.DropColumn():
+            return DropColumns([action.column])
+        case pandas_actions.DropColumns():
+            return DropColumns(list(action.columns))
+        case pandas_actions.ChangeCategoryToCodes():
+            return ChangeCategoryToCodes(action.column, action.category)
+        case pandas_actions.ChangeCategory():
+            return ChangeCategory(action.column, action.category)
+        case pandas_actions.CategoryToCodes():
+            return CategoryToCodes(action.column)
+    raise ValueError(
+        error_message(
+            f"{MODULE_NAME}:compile_arrow_pipeline",
+            "compile",
+            f"Action {action!r} isn't supported by arrow backend!",
+        )
+    )
+
+
+def compile_arrow_pipeline(
+    actions: List[TabularProcessingAction], max_workers: Optional[int] = None
+) -> ArrowPipeline:
+    """
+    Optimizes pandas actions same way as compile_pipeline and converts them to Arrow.
+    Raises:
+        ValueError: when column is used after it was dropped, or action isn't supported
+    """
+    compiled = compile_pipeline(actions).actions
+    return ArrowPipeline([to_arrow_action(action) for action in compiled], max_workers)
+
+
+def frames_to_table(frames: List[pd.DataFrame]) -> pa.Table:
+    """
+    Concatenates frames into one table, chunks of frames aren't copied.
+    Index of frames is dropped, so is pandas metadata, it would restore types
+    of columns changed by processing.
+    """
+    return pa.concat_tables(
+        [
+            pa.Table.from_pandas(frame, preserve_index=False).replace_schema_metadata()
+            for frame in frames
+        ],
+        promote_options="default",
+    )
@@ -0,0 +1,238 @@
+from abc import ABC, abstractmethod
+from typing import List
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from configuration_engine import NotFittedError, error_message
+from configuration_engine.constants import *
+
+
+class ArrowProcessingAction(ABC):
+    """
+    Action transforming Arrow table, tables are immutable, so transform returns
+    new table, unchanged columns share buffers with input.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._is_fitted = False
+
+    def fit(self, X: pa.Table):
+        self._is_fitted = True
+
+    @abstractmethod
+    def transform(self, X: pa.Table) -> pa.Table:
+        """
+        Raises:
+            NotFittedError: if method fit wasn't called before.
+        """
+        self.check_fitted()
+        return X
+
+    def fit_transform(self, X: pa.Table) -> pa.Table:
+        self.fit(X)
+        return self.transform(X)
+
+    def is_fit(self) -> bool:
+        return self._is_fitted
+
+    def check_fitted(self):
+        """
+        Raises:
+            NotFittedError: if method fit wasn't called before.
+        """
+        if not self.is_fit():
+            raise NotFittedError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    "fit",
+                    "U can't transform data before fitting!",
+                )
+            )
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+
+class ArrowColumnAction(ArrowProcessingAction):
+    """
+    Action, that replaces single column with result of transform_column.
+    """
+
+    action_name = "column action"
+
+    def __init__(self, column: str):
+        super().__init__()
+        self.column = column
+
+    @abstractmethod
+    def transform_column(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Raises:
+            ValueError: when column can't be transformed
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.column})"
+
+    def check_column(self, X: pa.Table):
+        """
+        Raises:
+            ValueError: when column doesn't exist!
+        """
+        if self.column not in X.column_names:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    self.action_name,
+                    f"Arrow table doesn't contain column {self.column}!",
+                )
+            )
+
+    def transform(self, X: pa.Table) -> pa.Table:
+        """
+        Raises:
+            ValueError: when column doesn't exist or can't be transformed!
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        self.check_column(X)
+        index = X.column_names.index(self.column)
+        transformed = self.transform_column(X.column(index))
+        return X.set_column(index, self.column, transformed)
+
+
+class DropColumns(ArrowProcessingAction):
+
+    def __init__(self, columns: List[str]):
+        super().__init__()
+        self.columns = columns
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self.columns)})"
+
+    def transform(self, X: pa.Table) -> pa.Table:
+        """
+        Raises:
+            ValueError: when any column doesn't exist!
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        missing = [column for column in self.columns if column not in X.column_names]
+        if missing:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    "drop columns",
+                    f"Arrow table doesn't contain columns {missing}!",
+                )
+            )
+        return X.drop_columns(self.columns)
+
+
+def _codes_type(n_categories: int) -> pa.DataType:
+    """
+    Same width as codes of pandas categorical.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return pa.from_numpy_dtype(dtype)
+    return pa.int64()
+
+
+class ChangeCategory(ArrowColumnAction):
+    """
+    Column becomes dictionary array with categories as dictionary, values outside
+    categories become null, converted to pandas it is categorical column of category.
+    """
+
+    action_name = "change category"
+
+    def __init__(self, column: str, category: pd.CategoricalDtype):
+        super().__init__(column)
+        self.category = category
+        self._dictionary = pa.array(category.categories.to_numpy())
+
+    def indices(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Positions of values in categories, int32 with nulls.
+        Raises:
+            ValueError: when values can't be compared with categories
+        """
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        try:
+            if column.type != self._dictionary.type:
+                column = column.cast(self._dictionary.type)
+            return pc.index_in(column, value_set=self._dictionary)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as error:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    self.action_name,
+                    f"Column {self.column} can't be converted to category: {error}",
+                )
+            )
+
+    def transform_column(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        indices = self.indices(column)
+        dictionary_type = pa.dictionary(
+            indices.type, self._dictionary.type, self.category.ordered
+        )
+        return pa.chunked_array(
+            [
+                pa.DictionaryArray.from_arrays(
+                    chunk, self._dictionary, ordered=self.category.ordered
+                )
+                for chunk in indices.chunks
+            ],
+            type=dictionary_type,
+        )
+
+
+class CategoryToCodes(ArrowColumnAction):
+    """
+    Dictionary column becomes its indices, nulls become -1, same as pandas codes.
+    """
+
+    action_name = "category to codes"
+
+    def transform_column(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Raises:
+            ValueError: when column isn't dictionary array
+        """
+        if not pa.types.is_dictionary(column.type):
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    self.action_name,
+                    f"Column isn't categorical {self.column}!",
+                )
+            )
+        # chunks of concatenated tables may have different dictionaries
+        column = pa.table({self.column: column}).unify_dictionaries().column(0)
+        if column.num_chunks == 0:
+            return pa.chunked_array([], type=pa.int8())
+        codes_type = _codes_type(len(column.chunk(0).dictionary))
+        return pa.chunked_array(
+            [
+                pc.fill_null(chunk.indices, -1).cast(codes_type)
+                for chunk in column.chunks
+            ],
+            type=codes_type,
+        )
+
+
+class ChangeCategoryToCodes(ChangeCategory):
+    """
+    Same as ChangeCategory followed by CategoryToCodes, dictionary isn't built.
+    """
+
+    action_name = "change category to codes"
+
+    def transform_column(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        codes_type = _codes_type(len(self._dictionary))
+        return pc.fill_null(self.indices(column), -1).cast(codes_type)
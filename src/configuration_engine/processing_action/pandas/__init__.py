@@ -1,8 +1,20 @@
 from configuration_engine.processing_action.pandas.tabular_processing_action import (
     TabularProcessingAction,
+    ColumnProcessingAction,
     DropColumn,
     ChangeCategory,
     CategoryToCodes,
+    DropColumns,
+    ChangeCategoryToCodes,
+    Downcast,
+)
+from configuration_engine.processing_action.pandas.tabular_pipeline import (
+    TabularPipeline,
+    compile_pipeline,
+)
+from configuration_engine.processing_action.pandas.pipeline_store import (
+    PipelineStore,
+    actions_fingerprint,
 )
 from configuration_engine.processing_action.pandas.tabular_processing_schema import (
     DropColumnSchema,
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+import pickle
+from typing import Any, List, Optional
+import numpy as np
+import pandas as pd
+from configuration_engine.processing_action.pandas.tabular_processing_action import (
+    TabularProcessingAction,
+)
+from configuration_engine.processing_action.pandas.tabular_pipeline import (
+    TabularPipeline,
+)
+
+
+def _token(value: Any) -> Any:
+    """
+    Converts value to json serializable token, that is stable between runs.
+    """
+    if isinstance(value, TabularProcessingAction):
+        return [
+            f"{value.__class__.__module__}.{value.__class__.__qualname__}",
+            _token(value.get_params()),
+        ]
+    if isinstance(value, pd.CategoricalDtype):
+        hashed = pd.util.hash_array(np.asarray(value.categories))
+        return [
+            "category",
+            str(value.categories.dtype),
+            hashlib.blake2b(hashed.tobytes(), digest_size=16).hexdigest(),
+            value.ordered,
+        ]
+    if isinstance(value, dict):
+        return {str(key): _token(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_token(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def actions_fingerprint(actions: List[TabularProcessingAction]) -> str:
+    """
+    Fingerprint of action list, independent of fitted state of actions.
+    """
+    return hashlib.blake2b(
+        json.dumps(_token(actions), sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+class PipelineStore:
+    """
+    Persists fitted processing pipelines, key is fingerprint of actions and of data
+    pipeline was fitted on.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def key(
+        self, actions: List[TabularProcessingAction], data_fingerprints: List[str]
+    ) -> str:
+        key = hashlib.blake2b(digest_size=16)
+        key.update(actions_fingerprint(actions).encode())
+        key.update(json.dumps(data_fingerprints).encode())
+        return key.hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pipeline.pkl")
+
+    def load(self, key: str) -> Optional[TabularPipeline]:
+        """
+        Returns None when key isn't stored.
+        Raises:
+            OSError
+        """
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as stream:
+            return pickle.load(stream)
+
+    def store(self, key: str, pipeline: TabularPipeline):
+        """
+        Raises:
+            OSError
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as stream:
+            pickle.dump(pipeline, stream)
+        os.replace(tmp_path, path)
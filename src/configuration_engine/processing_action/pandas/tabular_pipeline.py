@@ -0,0 +1,214 @@
+from typing import List, Dict, Union, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+import time
+import pandas as pd
+from configuration_engine import error_message
+from configuration_engine.constants import *
+from configuration_engine.processing_action.pandas.tabular_processing_action import (
+    TabularProcessingAction,
+    ColumnProcessingAction,
+    DropColumn,
+    DropColumns,
+    ChangeCategory,
+    CategoryToCodes,
+    ChangeCategoryToCodes,
+)
+
+ColumnAction = Union[ChangeCategory, CategoryToCodes, ChangeCategoryToCodes]
+
+
+class TabularPipeline(TabularProcessingAction):
+    """
+    Runs processing actions one after another, each action is fitted on output
+    of previous actions. With inplace=False actions run in copy on write mode, so
+    only changed columns are copied.
+    With max_workers > 1 consecutive column actions are executed concurrently on thread
+    pool, column by column, other actions (drops, unknown actions) are applied
+    between such stages.
+    Duration of each action from last run is stored in timings.
+    """
+
+    def __init__(
+        self, actions: List[TabularProcessingAction], max_workers: Optional[int] = None
+    ):
+        super().__init__()
+        self.actions = actions
+        self.max_workers = max_workers
+        self.timings: List[Tuple[str, float]] = []
+
+    def get_params(self) -> Dict[str, Any]:
+        return {"actions": self.actions}
+
+    def fit(self, X: pd.DataFrame):
+        self.fit_transform(X, False)
+
+    def transform(self, X: pd.DataFrame, inplace: bool = False):
+        """
+        Raises:
+            ValueError: when any action fails
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        return self._execute(X, inplace, False)
+
+    def fit_transform(self, X, inplace=False):
+        """
+        Raises:
+            ValueError: when any action fails
+        """
+        result = self._execute(X, inplace, True)
+        self._is_fitted = True
+        return result
+
+    def _execute(
+        self, X: pd.DataFrame, inplace: bool, fit: bool
+    ) -> Optional[pd.DataFrame]:
+        self.timings = []
+        if self.max_workers is None or self.max_workers <= 1:
+            for action in self.actions:
+                X = self._run_action(action, X, inplace, fit)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                if not inplace:
+                    # only whole columns are replaced in copy
+                    X = X.copy(deep=False)
+                for stage in self._stages():
+                    if isinstance(stage, list):
+                        self._run_column_stage(executor, stage, X, fit)
+                    else:
+                        X = self._run_action(stage, X, inplace, fit)
+        if not inplace:
+            return X
+
+    def _run_action(
+        self, action: TabularProcessingAction, X: pd.DataFrame, inplace: bool, fit: bool
+    ) -> pd.DataFrame:
+        start = time.perf_counter()
+        if fit:
+            result = action.fit_transform(X, inplace)
+        else:
+            result = action.transform(X, inplace)
+        self.timings.append((repr(action), time.perf_counter() - start))
+        return X if inplace else result
+
+    def _stages(
+        self,
+    ) -> List[Union[TabularProcessingAction, List[ColumnProcessingAction]]]:
+        stages: List[Union[TabularProcessingAction, List[ColumnProcessingAction]]] = []
+        for action in self.actions:
+            if not isinstance(action, ColumnProcessingAction):
+                stages.append(action)
+            elif stages and isinstance(stages[-1], list):
+                stages[-1].append(action)
+            else:
+                stages.append([action])
+        return stages
+
+    def _run_column_stage(
+        self,
+        executor: ThreadPoolExecutor,
+        stage: List[ColumnProcessingAction],
+        X: pd.DataFrame,
+        fit: bool,
+    ):
+        chains: Dict[str, List[ColumnProcessingAction]] = {}
+        for action in stage:
+            if not fit:
+                action.check_fitted()
+            action.check_column(X)
+            chains.setdefault(action.column, []).append(action)
+        futures = {
+            column: executor.submit(self._run_chain, X[column], chain, fit)
+            for column, chain in chains.items()
+        }
+        for column, future in futures.items():
+            transformed, timings = future.result()
+            X[column] = transformed
+            self.timings.extend(timings)
+
+    @staticmethod
+    def _run_chain(
+        column: pd.Series, chain: List[ColumnProcessingAction], fit: bool
+    ) -> Tuple[pd.Series, List[Tuple[str, float]]]:
+        timings: List[Tuple[str, float]] = []
+        for action in chain:
+            start = time.perf_counter()
+            if fit:
+                action.fit(column.to_frame())
+            column = action.transform_column(column)
+            timings.append((repr(action), time.perf_counter() - start))
+        return column, timings
+
+
+def _compile_segment(
+    actions: List[Union[DropColumn, ColumnAction]],
+) -> List[TabularProcessingAction]:
+    """
+    Segment contains only column actions, which touch only their own column, so
+    actions on different columns can be reordered.
+    Raises:
+        ValueError: when column is used after it was dropped
+    """
+    dropped: List[str] = []
+    per_column: Dict[str, List[ColumnAction]] = {}
+    for action in actions:
+        if action.column in dropped:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:compile_pipeline",
+                    "compile",
+                    f"Column {action.column} is used after it was dropped!",
+                )
+            )
+        if isinstance(action, DropColumn):
+            dropped.append(action.column)
+            # work on dropped column is skipped
+            per_column.pop(action.column, None)
+        else:
+            per_column.setdefault(action.column, []).append(action)
+
+    compiled: List[TabularProcessingAction] = []
+    for column_actions in per_column.values():
+        i = 0
+        while i < len(column_actions):
+            action = column_actions[i]
+            if (
+                isinstance(action, ChangeCategory)
+                and i + 1 < len(column_actions)
+                and isinstance(column_actions[i + 1], CategoryToCodes)
+            ):
+                compiled.append(ChangeCategoryToCodes(action.column, action.category))
+                i += 2
+            else:
+                compiled.append(action)
+                i += 1
+    if dropped:
+        compiled.append(DropColumns(dropped))
+    return compiled
+
+
+def compile_pipeline(
+    actions: List[TabularProcessingAction], max_workers: Optional[int] = None
+) -> TabularPipeline:
+    """
+    Builds optimized pipeline with same result as running actions one after another:
+    * all drops are batched into one drop
+    * ChangeCategory followed by CategoryToCodes on same column is fused
+    * actions on columns, that are dropped later, are skipped
+    Unknown actions may touch any column, so they are kept in place and actions
+    aren't moved across them.
+    max_workers: number of threads executing column actions, see TabularPipeline
+    Raises:
+        ValueError: when column is used after it was dropped
+    """
+    compiled: List[TabularProcessingAction] = []
+    segment: List[Union[DropColumn, ColumnAction]] = []
+    for action in actions:
+        if isinstance(action, (DropColumn, ChangeCategory, CategoryToCodes)):
+            segment.append(action)
+        else:
+            compiled.extend(_compile_segment(segment))
+            segment = []
+            compiled.append(action)
+    compiled.extend(_compile_segment(segment))
+    return TabularPipeline(compiled, max_workers)
@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from configuration_engine import NotFittedError, error_message
 from configuration_engine.constants import *
-from typing import overload, Literal, Union
+from typing import overload, Literal, Union, List, Dict, Any, Optional
 
 
 class TabularProcessingAction(ABC):
+    """
+    Actions transform data inplace or in copy on write mode (inplace=False).
+    In copy on write mode returned frame is shallow copy of X, only columns changed
+    by action are replaced, unchanged columns share buffers with X. So values of
+    returned frame shouldn't be modified inplace, unless pandas copy on write is enabled.
+    """
 
     def __init__(self):
         super().__init__()
@@ -29,14 +36,7 @@ class TabularProcessingAction(ABC):
         Raises:
             NotFittedError: if method fit wasn't called before.
         """
-        if not self.is_fit():
-            raise NotFittedError(
-                error_message(
-                    f"{MODULE_NAME}:{self.__class__}",
-                    "fit",
-                    "U can't transform data before fitting!",
-                )
-            )
+        self.check_fitted()
         return X
 
     @overload
@@ -56,8 +56,39 @@ class TabularProcessingAction(ABC):
     def is_fit(self) -> bool:
         return self._is_fitted
 
+    def check_fitted(self):
+        """
+        Raises:
+            NotFittedError: if method fit wasn't called before.
+        """
+        if not self.is_fit():
+            raise NotFittedError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    "fit",
+                    "U can't transform data before fitting!",
+                )
+            )
+
+    def get_params(self) -> Dict[str, Any]:
+        """
+        Parameters that define action, fitted state isn't part of them.
+        By default public attributes are returned.
+        """
+        return {
+            key: value for key, value in vars(self).items() if not key.startswith("_")
+        }
 
-class DropColumn(TabularProcessingAction):
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+
+class ColumnProcessingAction(TabularProcessingAction):
+    """
+    Action, that replaces single column with result of transform_column.
+    """
+
+    action_name = "column action"
 
     def __init__(self, column: str):
         super().__init__()
@@ -67,45 +98,70 @@ class DropColumn(TabularProcessingAction):
         super().fit(X)
         self._is_fitted = True
 
-    def transform(self, X: pd.DataFrame, inplace: bool = False):
+    @abstractmethod
+    def transform_column(self, column: pd.Series) -> pd.Series:
+        """
+        Returns new column, column mustn't be modified.
+        Raises:
+            ValueError: when column can't be transformed
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.column})"
+
+    def check_column(self, X: pd.DataFrame):
         """
         Raises:
             ValueError: when column doesn't exist!
-            NotFittedError: if method fit wasn't called before.
         """
-        super().transform(X)
         if self.column not in X.columns:
             raise ValueError(
                 error_message(
                     f"{MODULE_NAME}:{self.__class__}",
-                    "drop column",
+                    self.action_name,
                     f"Pandas dataframe doesn't contain column {self.column}!",
                 )
             )
-        return X.drop(columns=[self.column], inplace=inplace)
+
+    def transform(self, X: pd.DataFrame, inplace: bool = False):
+        """
+        Raises:
+            ValueError: when column doesn't exist or can't be transformed!
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        self.check_column(X)
+        transformed = self.transform_column(X[self.column])
+        if inplace:
+            X[self.column] = transformed
+            return
+        copy = X.copy(deep=False)
+        copy[self.column] = transformed
+        return copy
 
     def fit_transform(self, X, inplace=False):
         """
-        ValueError: when column doesn't exist!
+        Raises:
+            ValueError: when column doesn't exist or can't be transformed!
         """
         self.fit(X)
         return self.transform(X, inplace)
 
 
-class ChangeCategory(TabularProcessingAction):
+class DropColumn(TabularProcessingAction):
 
-    def __init__(self, column: str, category: pd.CategoricalDtype):
+    def __init__(self, column: str):
         super().__init__()
         self.column = column
-        self.category = category
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.column})"
 
     def fit(self, X: pd.DataFrame):
         super().fit(X)
         self._is_fitted = True
 
-    def change_category(self, X: pd.DataFrame):
-        X[self.column] = X[self.column].astype(self.category)
-
     def transform(self, X: pd.DataFrame, inplace: bool = False):
         """
         Raises:
@@ -117,70 +173,289 @@ class ChangeCategory(TabularProcessingAction):
             raise ValueError(
                 error_message(
                     f"{MODULE_NAME}:{self.__class__}",
-                    "change category",
+                    "drop column",
                     f"Pandas dataframe doesn't contain column {self.column}!",
                 )
             )
         if inplace:
-            self.change_category(X)
+            X.drop(columns=[self.column], inplace=True)
             return
-
-        copy = X.copy()
-        self.change_category(copy)
+        # del slices remaining blocks, drop would copy them without copy on write
+        copy = X.copy(deep=False)
+        del copy[self.column]
         return copy
 
     def fit_transform(self, X, inplace=False):
         """
-        Raises:
-            ValueError: when column doesn't exist!
+        ValueError: when column doesn't exist!
         """
         self.fit(X)
         return self.transform(X, inplace)
 
 
-class CategoryToCodes(TabularProcessingAction):
+class ChangeCategory(ColumnProcessingAction):
 
-    def __init__(self, column: str):
+    action_name = "change category"
+
+    def __init__(self, column: str, category: pd.CategoricalDtype):
+        super().__init__(column)
+        self.category = category
+
+    def change_category(self, X: pd.DataFrame):
+        X[self.column] = self.transform_column(X[self.column])
+
+    def transform_column(self, column: pd.Series) -> pd.Series:
+        return column.astype(self.category)
+
+
+class CategoryToCodes(ColumnProcessingAction):
+
+    action_name = "category to codes"
+
+    def to_codes(self, X: pd.DataFrame):
+        X[self.column] = self.transform_column(X[self.column])
+
+    def transform_column(self, column: pd.Series) -> pd.Series:
+        """
+        Raises:
+            ValueError: when column isn't categorical
+        """
+        try:
+            return column.cat.codes
+        except AttributeError:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    self.action_name,
+                    f"Column isn't categorical {self.column}!",
+                )
+            )
+
+
+class DropColumns(TabularProcessingAction):
+    """
+    Drops multiple columns in one operation.
+    """
+
+    def __init__(self, columns: List[str]):
         super().__init__()
-        self.column = column
+        self.columns = columns
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self.columns)})"
 
-    def fit(self, X):
+    def fit(self, X: pd.DataFrame):
         super().fit(X)
         self._is_fitted = True
 
-    def to_codes(self, X: pd.DataFrame):
-        X[self.column] = X[self.column].cat.codes
-
     def transform(self, X: pd.DataFrame, inplace: bool = False):
         """
         Raises:
-            ValueError: when column doesn't exist!
+            ValueError: when any column doesn't exist!
             NotFittedError: if method fit wasn't called before.
         """
         super().transform(X)
-        if self.column not in X.columns:
+        missing = [column for column in self.columns if column not in X.columns]
+        if missing:
             raise ValueError(
                 error_message(
                     f"{MODULE_NAME}:{self.__class__}",
-                    "category to codes",
-                    f"Pandas dataframe doesn't contain column {self.column}!",
+                    "drop columns",
+                    f"Pandas dataframe doesn't contain columns {missing}!",
                 )
             )
-        try:
-            if inplace:
-                self.to_codes(X)
-                return
-            copy = X.copy()
-            self.to_codes(copy)
-        except AttributeError:
+        if inplace:
+            X.drop(columns=self.columns, inplace=True)
+            return
+        # del slices remaining blocks, drop would copy them without copy on write
+        copy = X.copy(deep=False)
+        for column in self.columns:
+            del copy[column]
+        return copy
+
+    def fit_transform(self, X, inplace=False):
+        """
+        ValueError: when any column doesn't exist!
+        """
+        self.fit(X)
+        return self.transform(X, inplace)
+
+
+def code_dtype(n_categories: int) -> type:
+    """
+    Dtype of codes of categorical with n_categories, same as pandas uses.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class ChangeCategoryToCodes(ColumnProcessingAction):
+    """
+    Same as ChangeCategory followed by CategoryToCodes, codes are computed in one pass.
+    """
+
+    action_name = "change category to codes"
+
+    def __init__(self, column: str, category: pd.CategoricalDtype):
+        super().__init__(column)
+        self.category = category
+
+    def to_codes(self, X: pd.DataFrame):
+        X[self.column] = self.transform_column(X[self.column])
+
+    def transform_column(self, column: pd.Series) -> pd.Series:
+        # unknown values are -1, same as missing values of ChangeCategory
+        categories = self.category.categories
+        codes = categories.get_indexer(column).astype(code_dtype(len(categories)))
+        return pd.Series(codes, index=column.index, name=column.name)
+
+
+class Downcast(TabularProcessingAction):
+    """
+    Shrinks columns to smallest safe dtype, dtypes are profiled once in fit:
+    * integers become smallest signed integer type holding fitted range
+    * floats become float_dtype, when their values fit into it
+    * string columns with few distinct values become categorical, categories are
+      values seen in fit, so unseen values become missing
+    Categorical and boolean columns are kept, so configured categories are respected.
+    Bytes saved by last transform are in memory_saved.
+    """
+
+    _INT_DTYPES = (np.int8, np.int16, np.int32)
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        float_dtype: Optional[str] = "float32",
+        max_category_ratio: Optional[float] = 0.5,
+    ):
+        """
+        columns: columns to downcast, None means all columns
+        float_dtype: None keeps floats unchanged
+        max_category_ratio: maximal ratio of distinct values to rows of string column
+            converted to categorical, None keeps strings unchanged
+        """
+        super().__init__()
+        self.columns = columns
+        self.float_dtype = float_dtype
+        self.max_category_ratio = max_category_ratio
+        self._dtypes: Dict[str, Any] = {}
+        self._memory_saved = 0
+
+    @property
+    def memory_saved(self) -> int:
+        return self._memory_saved
+
+    def dtypes(self) -> Dict[str, Any]:
+        """
+        Fitted dtypes of changed columns.
+        """
+        return dict(self._dtypes)
+
+    def check_columns(self, X: pd.DataFrame, columns: List[str]):
+        """
+        Raises:
+            ValueError: when any column doesn't exist!
+        """
+        missing = [column for column in columns if column not in X.columns]
+        if missing:
             raise ValueError(
                 error_message(
                     f"{MODULE_NAME}:{self.__class__}",
-                    "category to codes",
-                    f"Column isn't categorical {self.column}!",
+                    "downcast",
+                    f"Pandas dataframe doesn't contain columns {missing}!",
                 )
             )
-        return copy
+
+    def fit(self, X: pd.DataFrame):
+        """
+        Raises:
+            ValueError: when any column doesn't exist!
+        """
+        super().fit(X)
+        columns = list(X.columns) if self.columns is None else self.columns
+        self.check_columns(X, columns)
+        self._dtypes = {}
+        for name in columns:
+            dtype = self._profile(X[name])
+            if dtype is not None and dtype != X[name].dtype:
+                self._dtypes[name] = dtype
+        self._is_fitted = True
+
+    def _profile(self, column: pd.Series) -> Any:
+        dtype = column.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or column.empty:
+            return None
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            low, high = column.min(), column.max()
+            for candidate in self._INT_DTYPES:
+                info = np.iinfo(candidate)
+                if info.min <= low and high <= info.max:
+                    return np.dtype(candidate)
+            return None
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            if self.float_dtype is None:
+                return None
+            target = np.dtype(self.float_dtype)
+            if target.itemsize < dtype.itemsize and self._fits_float(column, target):
+                return target
+            return None
+        if self.max_category_ratio is not None and pd.api.types.is_string_dtype(dtype):
+            values = column.dropna().unique()
+            if len(values) > self.max_category_ratio * len(column):
+                return None
+            try:
+                values = sorted(values)
+            except TypeError:
+                pass
+            return pd.CategoricalDtype(categories=values)
+        return None
+
+    @staticmethod
+    def _fits_float(column: pd.Series, dtype: np.dtype) -> bool:
+        values = np.abs(column.to_numpy())
+        finite = values[np.isfinite(values)]
+        return finite.size == 0 or finite.max() <= np.finfo(dtype).max
+
+    def _convert(self, name: str, column: pd.Series) -> pd.Series:
+        dtype = self._dtypes[name]
+        out_of_range = False
+        if isinstance(dtype, np.dtype) and dtype.kind == "i" and not column.empty:
+            info = np.iinfo(dtype)
+            out_of_range = column.min() < info.min or column.max() > info.max
+        elif isinstance(dtype, np.dtype) and dtype.kind == "f":
+            out_of_range = not self._fits_float(column, dtype)
+        if out_of_range:
+            raise ValueError(
+                error_message(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    "downcast",
+                    f"Values of column {name} don't fit into fitted type {dtype}!",
+                )
+            )
+        return column.astype(dtype)
+
+    def transform(self, X: pd.DataFrame, inplace: bool = False):
+        """
+        Raises:
+            ValueError: when column doesn't exist or its values don't fit fitted type!
+            NotFittedError: if method fit wasn't called before.
+        """
+        super().transform(X)
+        self.check_columns(X, list(self._dtypes))
+        converted = {name: self._convert(name, X[name]) for name in self._dtypes}
+        self._memory_saved = sum(
+            X[name].memory_usage(index=False, deep=True)
+            - column.memory_usage(index=False, deep=True)
+            for name, column in converted.items()
+        )
+        target = X if inplace else X.copy(deep=False)
+        for name, column in converted.items():
+            target[name] = column
+        if not inplace:
+            return target
 
     def fit_transform(self, X, inplace=False):
         """
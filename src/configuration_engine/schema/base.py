@@ -5,6 +5,9 @@ from configuration_engine.parameter.tunable_parameter import (
     ConstantParameter,
 )
 from configuration_engine.parameter.parameter_schema import Tunable, BaseParameter
+from configuration_engine.parameter.assignment import Assignment
+from configuration_engine.parameter.search_space import compile_search_space
+from configuration_engine.parameter.grid import ParameterGrid
 from configuration_engine.parameter.nontunable_parameter import (
     NontunableParameter,
     ConstantNontunableParameter,
@@ -13,8 +16,9 @@ from configuration_engine.parameter.nontunable_parameter_schema import (
     Nontunable,
     BaseNontunableParameter,
 )
-from typing import Any
+from typing import Any, Optional
 import optuna
+from optuna.distributions import BaseDistribution
 from configuration_engine import error_message
 from configuration_engine.constants import *
 import yaml
@@ -93,12 +97,15 @@ class Configuration:
             )
         return self.data[key]
 
-    def construct(self, key: str) -> dict[str, Any]:
+    def construct(
+        self, key: str, assignment: Optional[Assignment] = None
+    ) -> dict[str, Any]:
         """
         This value contructs parameter dict:
         * for BasicSchema it model_dumps()
         * For tunable parameters it gets value returned by method first
         * For nontunable parameter it calls value method
+        assignment: values of tunable parameters, e.g. Assignment.from_trial(trial)
         Raises:
             ValueError
         """
@@ -122,7 +129,7 @@ class Configuration:
             if isinstance(parameter, NontunableParameter):
                 constructed_values[parameter_name] = parameter.value()
             elif isinstance(parameter, Parameter):
-                constructed_values[parameter_name] = parameter.first()
+                constructed_values[parameter_name] = parameter.first(assignment)
             else:
                 raise ValueError(
                     f"{MODULE_NAME}:{self.__class__}",
@@ -131,7 +138,12 @@ class Configuration:
                 )
         return constructed_values
 
-    def yaml(self, key: str) -> dict[str, Any]:
+    def yaml(
+        self, key: str, assignment: Optional[Assignment] = None
+    ) -> dict[str, Any]:
+        """
+        assignment: values of tunable parameters, e.g. Assignment.from_trial(trial)
+        """
         if key not in self.data:
             raise ValueError(
                 f"{MODULE_NAME}:{self.__class__}",
@@ -152,7 +164,7 @@ class Configuration:
             if isinstance(parameter, NontunableParameter):
                 constructed_values[parameter_name] = parameter.value()
             elif isinstance(parameter, Parameter):
-                constructed_values[parameter_name] = parameter.yaml()
+                constructed_values[parameter_name] = parameter.yaml(assignment)
             else:
                 raise ValueError(
                     f"{MODULE_NAME}:{self.__class__}",
@@ -161,9 +173,15 @@ class Configuration:
                 )
         return constructed_values
 
-    def suggest(self, key: str, trial: optuna.Trial) -> dict[Any]:
+    def suggest(
+        self,
+        key: str,
+        trial: optuna.Trial,
+        assignment: Optional[Assignment] = None,
+    ) -> dict[Any]:
         """
         This method suggest parameters, if the value is dict of tunable parameters.
+        assignment: if set, suggestions are recorded into it
         Raises:
             ValueError
         """
@@ -193,9 +211,63 @@ class Configuration:
         values: dict[str, Parameter[Any]]
         suggested_values: dict[str, Any] = {}
         for parameter_name, parameter in values.items():
-            suggested_values[parameter_name] = parameter.suggest(trial)
+            suggested_values[parameter_name] = parameter.suggest(trial, assignment)
         return suggested_values
 
+    def trial_values(
+        self, assignment: Assignment, keys: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Yaml values of keys, all keys by default, for assignment of trial, used as key
+        of TrialCache, e.g. cache.evaluate(config.trial_values(assignment), objective)
+        Raises:
+            ValueError
+        """
+        return {
+            key: self.yaml(key, assignment)
+            for key in (keys if keys is not None else self.data)
+        }
+
+    def search_space(
+        self, keys: Optional[list[str]] = None
+    ) -> dict[str, BaseDistribution]:
+        """
+        Optuna distributions of tunable parameters of keys, all keys by default,
+        see compile_search_space.
+        Raises:
+            ValueError
+        """
+        return compile_search_space(self.parameters(keys, "search_space"))
+
+    def grid(self, keys: Optional[list[str]] = None) -> ParameterGrid:
+        """
+        Lazy grid of tunable parameters of keys, all keys by default, points are
+        assignments accepted by construct and yaml.
+        Raises:
+            ValueError: when parameter can't be enumerated
+        """
+        return ParameterGrid(self.parameters(keys, "grid"))
+
+    def parameters(
+        self, keys: Optional[list[str]], operation: str
+    ) -> list[Parameter[Any]]:
+        parameters: list[Parameter[Any]] = []
+        for key in keys if keys is not None else self.data:
+            if key not in self.data:
+                raise ValueError(
+                    f"{MODULE_NAME}:{self.__class__}",
+                    operation,
+                    f"Key {key} isn't present!",
+                )
+            values = self.data[key]
+            if isinstance(values, dict):
+                parameters.extend(
+                    parameter
+                    for parameter in values.values()
+                    if isinstance(parameter, Parameter)
+                )
+        return parameters
+
 
 class SmartSchema(BaseModel, ABC):
     """
@@ -1 +1,5 @@
-from configuration_engine.utils.functional import resolve_function
+from configuration_engine.utils.functional import (
+    resolve_function,
+    resolve_class,
+    check_class_path,
+)
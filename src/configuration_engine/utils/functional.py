@@ -1,7 +1,9 @@
 import importlib
+import importlib.util
 from types import ModuleType
 from typing import Optional, Iterable
 import inspect
+import functools
 
 
 def resolve_function(
@@ -37,3 +39,31 @@ def resolve_function(
         raise ValueError("Class only flag allows only callable classes!")
 
     return func
+
+
+@functools.cache
+def resolve_class(path: str):
+    """
+    Same as resolve_function for classes, resolved classes are cached per process,
+    so module of class is imported only once.
+    """
+    return resolve_function(path)
+
+
+def check_class_path(path: str):
+    """
+    Checks, that module of path exists, without importing the module itself,
+    only its parent packages are imported. Class is checked when it is resolved.
+    Raises:
+        ValueError: when path has no module or module doesn't exist
+    """
+    parts = path.split(".")
+    if len(parts) < 2:
+        raise ValueError(f"Class path '{path}' has no module. Use full module path.")
+    module_path = ".".join(parts[:-1])
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        raise ValueError(f"Module '{module_path}' of class path '{path}' not found.")
@@ -0,0 +1,87 @@
+from configuration_engine.configuration.pandas import (
+    DatasetMatrices,
+    TabularConfiguration,
+)
+from test.fixtures.dataframes import state_category, test_dataframe
+from test.fixtures.configuration import (
+    dataset_files,
+    tabular_schema_data,
+    tabular_configuration,
+)
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+
+
+class TestDatasetMatrices:
+
+    def test_arrays(self, state_category: pd.CategoricalDtype):
+        data = pd.DataFrame(
+            data={
+                "state": pd.Series(["used", "new", "worn out"], dtype=state_category),
+                "price": [1, 10, 5],
+                "discount": [0.5, 0.0, 0.25],
+                "target": [0, 1, 0],
+            }
+        )
+        arrays = DatasetMatrices(data, "target", []).arrays()
+        assert arrays.features.dtype == np.float32
+        assert arrays.features.flags["C_CONTIGUOUS"]
+        expected = np.array([[1, 0.5], [10, 0], [5, 0.25]], dtype=np.float32)
+        assert npt.assert_array_equal(arrays.features, expected) == None
+        assert arrays.codes.dtype == np.int32
+        assert npt.assert_array_equal(arrays.codes, [[0], [1], [2]]) == None
+        assert npt.assert_array_equal(arrays.label, [0, 1, 0]) == None
+
+    def test_pickle(self, state_category: pd.CategoricalDtype):
+        import pickle
+
+        data = pd.DataFrame(
+            data={
+                "state": pd.Series(["used", "new"], dtype=state_category),
+                "target": [0, 1],
+            }
+        )
+        matrices = DatasetMatrices(data, "target", [])
+        matrices.arrays()
+        restored = pickle.loads(pickle.dumps(matrices))
+        assert npt.assert_array_equal(restored.arrays().codes, [[0], [1]]) == None
+
+    def test_object_column_should_fail(self, test_dataframe: pd.DataFrame):
+        matrices = DatasetMatrices(test_dataframe, "price", [])
+        with pytest.raises(ValueError):
+            matrices.arrays()
+
+
+class TestProcessedDatasetArrays:
+
+    def test_fold_arrays(self, tabular_configuration: TabularConfiguration):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        train, valid = dataset.fold_arrays(0)
+        train_idx, valid_idx = dataset.folds[0]
+        assert train.features.shape == (len(train_idx), 2)
+        assert train.codes.shape == (len(train_idx), 0)
+        assert npt.assert_array_equal(valid.weight, dataset.weight[valid_idx]) == None
+        assert (
+            npt.assert_array_equal(
+                valid.label, dataset.data["target"].to_numpy()[valid_idx]
+            )
+            == None
+        )
+
+    def test_fold_arrays_reused_across_trials(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert first.fold_arrays(1)[0].features is second.fold_arrays(1)[0].features
+
+    def test_missing_target_should_fail(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        dataset.matrices = None
+        dataset.target_column = None
+        with pytest.raises(ValueError):
+            dataset.arrays()
@@ -0,0 +1,31 @@
+from configuration_engine.configuration import FidelitySchedule
+import optuna
+import pytest
+
+
+class TestFidelitySchedule:
+
+    def test_fractions(self):
+        assert FidelitySchedule(1 / 27).fractions == pytest.approx(
+            [1 / 27, 1 / 9, 1 / 3, 1.0]
+        )
+        assert FidelitySchedule(0.2, 2).fractions == pytest.approx([0.25, 0.5, 1.0])
+
+    @pytest.mark.parametrize("min_fraction,factor", [(0, 3), (1.5, 3), (0.1, 1)])
+    def test_invalid(self, min_fraction, factor):
+        with pytest.raises(ValueError):
+            FidelitySchedule(min_fraction, factor)
+
+    def test_evaluate_reports_steps(self):
+        schedule = FidelitySchedule(1 / 9)
+        study = optuna.create_study(pruner=schedule.pruner())
+        fractions = []
+
+        def objective(trial):
+            return schedule.evaluate(trial, lambda f: fractions.append(f) or f)
+
+        study.optimize(objective, n_trials=1)
+        assert fractions == pytest.approx([1 / 9, 1 / 3, 1.0])
+        assert study.trials[0].intermediate_values == pytest.approx(
+            {1: 1 / 9, 2: 1 / 3, 3: 1.0}
+        )
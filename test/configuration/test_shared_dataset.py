@@ -0,0 +1,136 @@
+from typing import List
+from configuration_engine.configuration.pandas import (
+    AttachedPandasDataset,
+    ProcessedPandasDataset,
+    SharedPandasDataset,
+)
+from configuration_engine.configuration.pandas.shared_dataset import (
+    SharedDatasetHandle,
+)
+from test.fixtures.dataframes import state_category
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import multiprocessing
+import pickle
+import pytest
+
+
+def attach_in_worker(handle: SharedDatasetHandle, weights: List[float]):
+    """
+    Runs in worker process, returns copies of attached arrays, so memory can be closed.
+    """
+    attached = AttachedPandasDataset(handle)
+    dataset = attached.reweighted(weights)
+    result = (
+        dataset.data.copy(deep=True),
+        dataset.weight.copy(),
+        [(train.copy(), valid.copy()) for train, valid in dataset.folds],
+    )
+    del dataset
+    attached.close()
+    return result
+
+
+@pytest.fixture
+def processed_dataset(state_category: pd.CategoricalDtype):
+    data = pd.DataFrame(
+        data={
+            "state": pd.Series(
+                ["used", "new", "worn out", "new"], dtype=state_category
+            ),
+            "price": [1.0, 10.0, 5.0, 5.0],
+            "target": [0, 1, 0, 1],
+        }
+    )
+    return ProcessedPandasDataset(
+        data=data,
+        weight=np.array([1.0, 1.0, 2.0, 2.0]),
+        folds=[
+            (np.array([0, 1], dtype=np.int32), np.array([2, 3], dtype=np.int32)),
+            (np.array([2, 3], dtype=np.int32), np.array([0, 1], dtype=np.int32)),
+        ],
+        dataset_parameters=[
+            {"name": "data", "weight": 1.0, "cv": True},
+            {"name": "other", "weight": 2.0, "cv": True},
+        ],
+        weight_segments=[(0, 2, 1.0), (2, 2, 2.0)],
+        n_training=4,
+    )
+
+
+class TestSharedPandasDataset:
+
+    def test_attach(self, processed_dataset: ProcessedPandasDataset):
+        with processed_dataset.share() as shared:
+            handle = pickle.loads(pickle.dumps(shared.handle))
+            attached = AttachedPandasDataset(handle)
+            dataset = attached.dataset
+            pd.testing.assert_frame_equal(dataset.data, processed_dataset.data)
+            assert (
+                npt.assert_array_equal(dataset.weight, processed_dataset.weight) == None
+            )
+            for (train, valid), (ref_train, ref_valid) in zip(
+                dataset.folds, processed_dataset.folds
+            ):
+                assert npt.assert_array_equal(train, ref_train) == None
+                assert npt.assert_array_equal(valid, ref_valid) == None
+            assert dataset.weight_segments == processed_dataset.weight_segments
+            assert dataset.n_training == 4
+
+    def test_attach_in_worker_process(self, processed_dataset: ProcessedPandasDataset):
+        context = multiprocessing.get_context("spawn")
+        with processed_dataset.share() as shared:
+            with context.Pool(1) as pool:
+                data, weight, folds = pool.apply(
+                    attach_in_worker, (shared.handle, [3.0, 4.0])
+                )
+        pd.testing.assert_frame_equal(data, processed_dataset.data)
+        assert npt.assert_array_equal(weight, [3.0, 3.0, 4.0, 4.0]) == None
+        for (train, valid), (ref_train, ref_valid) in zip(
+            folds, processed_dataset.folds
+        ):
+            assert npt.assert_array_equal(train, ref_train) == None
+            assert npt.assert_array_equal(valid, ref_valid) == None
+
+    def test_reweighted(self, processed_dataset: ProcessedPandasDataset):
+        processed_dataset.dataset_parameters = [
+            {"name": "other", "weight": 2.0, "cv": False},
+            {"name": "data", "weight": 1.0, "cv": True},
+        ]
+        with processed_dataset.share() as shared:
+            attached = AttachedPandasDataset(shared.handle)
+            dataset = attached.reweighted([5.0, 2.0])
+            # cv dataset is concatenated first
+            assert dataset.weight_segments == [(0, 2, 2.0), (2, 2, 5.0)]
+            assert npt.assert_array_equal(dataset.weight, [2.0, 2.0, 5.0, 5.0]) == None
+            assert dataset.dataset_parameters[0]["weight"] == 5.0
+            with pytest.raises(ValueError):
+                attached.reweighted([1.0])
+            del dataset
+            attached.close()
+
+    def test_attached_arrays_are_read_only(
+        self, processed_dataset: ProcessedPandasDataset
+    ):
+        with SharedPandasDataset(processed_dataset) as shared:
+            attached = AttachedPandasDataset(shared.handle)
+            with pytest.raises(ValueError):
+                attached.dataset.weight[0] = 10.0
+            attached.close()
+
+    def test_close_with_referenced_arrays_should_fail(
+        self, processed_dataset: ProcessedPandasDataset
+    ):
+        with SharedPandasDataset(processed_dataset) as shared:
+            attached = AttachedPandasDataset(shared.handle)
+            weight = attached.dataset.weight
+            with pytest.raises(BufferError):
+                attached.close()
+            del weight
+            attached.close()
+
+    def test_object_column_should_fail(self, processed_dataset: ProcessedPandasDataset):
+        processed_dataset.data["name"] = ["a", "b", "c", "d"]
+        with pytest.raises(ValueError):
+            SharedPandasDataset(processed_dataset)
@@ -0,0 +1,216 @@
+from configuration_engine.configuration.pandas import TabularConfiguration
+from test.fixtures.dataframes import state_category
+from test.fixtures.configuration import (
+    dataset_files,
+    tabular_schema_data,
+    tabular_configuration,
+)
+import numpy as np
+import pandas as pd
+import numpy.testing as npt
+import pytest
+import optuna
+
+
+class TestConstructDataset:
+
+    def test_weight_array(self, tabular_configuration: TabularConfiguration):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert isinstance(dataset.weight, np.ndarray)
+        assert dataset.weight.dtype == np.float64
+        assert dataset.weight.flags["C_CONTIGUOUS"]
+        expected = np.repeat([1.0, 3.0, 2.0, 4.0], 8)
+        assert npt.assert_array_equal(dataset.weight, expected) == None
+
+    def test_weight_dtype(self, tabular_configuration: TabularConfiguration):
+        dataset = tabular_configuration.construct_dataset(
+            "target", k_folds=2, weight_dtype=np.float32
+        )
+        assert dataset.weight.dtype == np.float32
+
+    def test_weight_segments(self, tabular_configuration: TabularConfiguration):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert dataset.weight_segments == [
+            (0, 8, 1.0),
+            (8, 8, 3.0),
+            (16, 8, 2.0),
+            (24, 8, 4.0),
+        ]
+
+    def test_folds_contain_additional_rows(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert len(dataset.folds) == 2
+        for train_idx, val_idx in dataset.folds:
+            assert val_idx.max() < 16
+            assert set(range(16, 32)) <= set(train_idx)
+            assert len(train_idx) + len(val_idx) == 32
+
+    def test_training_and_additional_views(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        dataset = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert dataset.n_training == 16
+        assert dataset.training_data.shape[0] == 16
+        assert dataset.additional_data.shape[0] == 16
+        assert (
+            npt.assert_array_equal(dataset.training_data["price"], [0] * 8 + [2] * 8)
+            == None
+        )
+
+    def test_source_datasets_not_modified(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        tabular_configuration.construct_dataset("target", k_folds=2)
+        for dataset in tabular_configuration.training_datasets:
+            assert dataset.data["state"].dtype != "category"
+
+
+class TestProcessedCache:
+
+    def test_processed_data_reused(self, tabular_configuration: TabularConfiguration):
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert first.data is second.data
+        assert first.folds is second.folds
+
+    def test_weights_recomputed(self, tabular_configuration: TabularConfiguration):
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        tabular_configuration.training_datasets[0].weight.value = 10.0
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert first.weight[0] == 1.0
+        assert second.weight[0] == 10.0
+
+    def test_invalidated_by_processing_change(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        tabular_configuration.processing.pop()
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert first.data is not second.data
+        assert second.data["state"].dtype == "category"
+
+    def test_invalidated_by_dataset_change(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        tabular_configuration.training_datasets.pop()
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert second.data.shape[0] == first.data.shape[0] - 8
+
+    def test_invalidated_by_fold_change(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        tabular_configuration.construct_dataset("target", k_folds=2)
+        dataset = tabular_configuration.construct_dataset("target", k_folds=4)
+        assert len(dataset.folds) == 4
+
+    def test_cache_disabled(self, tabular_configuration: TabularConfiguration):
+        tabular_configuration.cache_processed = False
+        first = tabular_configuration.construct_dataset("target", k_folds=2)
+        second = tabular_configuration.construct_dataset("target", k_folds=2)
+        assert first.data is not second.data
+
+
+class TestSubsample:
+
+    def test_fraction(self, tabular_configuration: TabularConfiguration):
+        dataset = tabular_configuration.construct_dataset(
+            "target", k_folds=2, fraction=0.5
+        )
+        assert dataset.data.shape[0] == 16
+        assert dataset.n_training == 8
+        assert [segment[1] for segment in dataset.weight_segments] == [4, 4, 4, 4]
+        assert dataset.weight.shape[0] == 16
+        assert dataset.data["target"].value_counts().tolist() == [8, 8]
+        for train_idx, val_idx in dataset.folds:
+            assert val_idx.max() < 8
+            assert len(train_idx) + len(val_idx) == 16
+
+    def test_nested_and_cached(self, tabular_configuration: TabularConfiguration):
+        small = tabular_configuration.construct_dataset(
+            "target", k_folds=2, fraction=0.25
+        )
+        large = tabular_configuration.construct_dataset(
+            "target", k_folds=2, fraction=0.5
+        )
+        again = tabular_configuration.construct_dataset(
+            "target", k_folds=2, fraction=0.25
+        )
+        assert again.data is small.data
+        small_rows = set(zip(small.data.index, small.data["price"]))
+        large_rows = set(zip(large.data.index, large.data["price"]))
+        assert small_rows <= large_rows
+
+    def test_invalid_fraction(self, tabular_configuration: TabularConfiguration):
+        with pytest.raises(ValueError):
+            tabular_configuration.construct_dataset("target", k_folds=2, fraction=0)
+
+
+class TestSearchSpace:
+
+    def test_search_space(self, tabular_configuration: TabularConfiguration):
+        space = tabular_configuration.search_space()
+        assert list(space) == ["depth"]
+        trial = optuna.create_study().ask(space)
+        params, _ = tabular_configuration.suggest_model_params(trial)
+        assert params["depth"] == trial.params["depth"]
+
+    def test_grid(self, tabular_configuration: TabularConfiguration):
+        grid = tabular_configuration.grid()
+        assert grid.size == 5
+        depths = [
+            tabular_configuration.first_model_params(point)["depth"] for point in grid
+        ]
+        assert depths == [1, 2, 3, 4, 5]
+
+
+class TestTransform:
+
+    def test_not_fitted(self, tabular_configuration: TabularConfiguration):
+        from configuration_engine.error import NotFittedError
+
+        with pytest.raises(NotFittedError):
+            tabular_configuration.transform(pd.DataFrame({"state": ["a"]}))
+
+    def test_transform_new_data(self, tabular_configuration: TabularConfiguration):
+        processed = tabular_configuration.construct_dataset("target", k_folds=2)
+        holdout = tabular_configuration.training_datasets[0].data.copy()
+        transformed = tabular_configuration.transform(holdout)
+        expected = processed.data.iloc[: holdout.shape[0]]
+        pd.testing.assert_frame_equal(
+            transformed.reset_index(drop=True), expected.reset_index(drop=True)
+        )
+
+
+class TestPickle:
+
+    def test_round_trip(self, tabular_configuration: TabularConfiguration):
+        import copy
+        import pickle
+
+        expected = tabular_configuration.construct_dataset("target", k_folds=2)
+        for restored in (
+            pickle.loads(pickle.dumps(tabular_configuration)),
+            copy.deepcopy(tabular_configuration),
+        ):
+            dataset = restored.construct_dataset("target", k_folds=2)
+            pd.testing.assert_frame_equal(dataset.data, expected.data)
+            assert npt.assert_array_equal(dataset.weight, expected.weight) == None
+            holdout = restored.training_datasets[0].data
+            pd.testing.assert_frame_equal(
+                restored.transform(holdout), tabular_configuration.transform(holdout)
+            )
+
+    def test_round_trip_before_loading(self, tabular_schema_data, state_category):
+        import pickle
+        from configuration_engine.configuration.pandas import TabularSchema
+
+        configuration = TabularSchema(**tabular_schema_data).build(
+            {"state": state_category}, lazy=True
+        )
+        restored = pickle.loads(pickle.dumps(configuration))
+        assert not any(d.is_loaded() for d in restored.training_datasets)
+        dataset = restored.construct_dataset("target", k_folds=2)
+        assert dataset.data.shape[0] == 32
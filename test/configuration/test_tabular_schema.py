@@ -0,0 +1,189 @@
+from configuration_engine.configuration.pandas import TabularSchema
+from test.fixtures.dataframes import state_category
+from test.fixtures.configuration import dataset_files, tabular_schema_data
+import pandas as pd
+import pytest
+
+
+class TestTabularSchema:
+
+    @pytest.mark.parametrize("workers", [None, 1, 3])
+    def test_build_datasets_keeps_order(self, tabular_schema_data: dict, workers):
+        schema = TabularSchema(**tabular_schema_data, dataset_workers=workers)
+        datasets = schema.build_datasets()
+        assert [dataset.name for dataset in datasets] == [
+            f"dataset_{i}" for i in range(4)
+        ]
+        assert [dataset.data["price"].iloc[0] for dataset in datasets] == [0, 1, 2, 3]
+
+    def test_invalid_worker_count(self, tabular_schema_data: dict):
+        with pytest.raises(ValueError):
+            TabularSchema(**tabular_schema_data, dataset_workers=0)
+
+    def test_build(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        schema = TabularSchema(**tabular_schema_data)
+        configuration = schema.build({"state": state_category})
+        assert len(configuration.training_datasets) == 4
+        assert len(configuration.processing) == 2
+        for dataset in configuration.training_datasets:
+            assert not isinstance(dataset.data["state"].dtype, pd.CategoricalDtype)
+
+    def test_build_with_pushdown(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        schema = TabularSchema(**tabular_schema_data, pushdown=True)
+        configuration = schema.build({"state": state_category})
+        # category change is done by reader
+        assert len(configuration.processing) == 1
+        for dataset in configuration.training_datasets:
+            assert dataset.data["state"].dtype == state_category
+
+    def test_pushdown_drop(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        tabular_schema_data["preprocessing"].append(
+            {"column": "price", "actions": [{"name": "drop"}]}
+        )
+        schema = TabularSchema(**tabular_schema_data, pushdown=True)
+        dtype, exclude, remaining = schema.pushdown_preprocessing(
+            {"state": state_category}
+        )
+        assert dtype == {"state": state_category}
+        assert exclude == ["price"]
+        assert [repr(action) for action in remaining] == ["CategoryToCodes(state)"]
+        configuration = schema.build({"state": state_category})
+        assert "price" not in configuration.training_datasets[0].data.columns
+        dataset = configuration.construct_dataset("target", k_folds=2)
+        assert list(dataset.data.columns) == ["state", "target"]
+
+    def test_pushdown_matches_processing(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        categories = {"state": state_category}
+        pushed = TabularSchema(**tabular_schema_data, pushdown=True).build(categories)
+        plain = TabularSchema(**tabular_schema_data).build(categories)
+        pd.testing.assert_frame_equal(
+            pushed.construct_dataset("target", k_folds=2).data,
+            plain.construct_dataset("target", k_folds=2).data,
+        )
+
+    def test_pushdown_missing_dropped_column(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        tabular_schema_data["preprocessing"].append(
+            {"column": "missing", "actions": [{"name": "drop"}]}
+        )
+        schema = TabularSchema(**tabular_schema_data, pushdown=True)
+        with pytest.raises(ValueError):
+            schema.build({"state": state_category})
+
+    def test_build_lazy(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        schema = TabularSchema(**tabular_schema_data)
+        configuration = schema.build({"state": state_category}, lazy=True)
+        assert not any(
+            dataset.is_loaded() for dataset in configuration.training_datasets
+        )
+
+    def test_build_downcast(
+        self, tabular_schema_data: dict, state_category: pd.CategoricalDtype
+    ):
+        schema = TabularSchema(**tabular_schema_data, downcast=True)
+        configuration = schema.build({"state": state_category})
+        dataset = configuration.construct_dataset("target", k_folds=2)
+        assert dataset.data["price"].dtype == "int8"
+        assert dataset.data["target"].dtype == "int8"
+
+    def test_infer_categories(self, tabular_schema_data: dict):
+        schema = TabularSchema(**tabular_schema_data)
+        categories = schema.infer_categories()
+        assert list(categories) == ["state"]
+        assert list(categories["state"].categories) == ["new", "used", "worn out"]
+
+    def test_build_infers_categories(self, tabular_schema_data: dict):
+        configuration = TabularSchema(**tabular_schema_data).build()
+        dataset = configuration.construct_dataset("target", k_folds=2)
+        assert dataset.data["state"].tolist()[:4] == [1, 0, 2, 0]
+
+    def test_category_columns_skip_dropped(self, tabular_schema_data: dict):
+        tabular_schema_data["preprocessing"].append(
+            {
+                "column": "price",
+                "actions": [
+                    {"name": "category_change", "category": "state"},
+                    {"name": "drop"},
+                ],
+            }
+        )
+        schema = TabularSchema(**tabular_schema_data)
+        assert schema.category_columns() == {"state": ["state"]}
+
+    def test_build_infers_category_of_dropped_column(self, tabular_schema_data: dict):
+        tabular_schema_data["preprocessing"].append(
+            {
+                "column": "price",
+                "actions": [
+                    {"name": "category_change", "category": "c"},
+                    {"name": "drop"},
+                ],
+            }
+        )
+        schema = TabularSchema(**tabular_schema_data)
+        assert schema.category_columns() == {"state": ["state"], "c": ["price"]}
+        configuration = schema.build()
+        dataset = configuration.construct_dataset("target", k_folds=2)
+        assert list(dataset.data.columns) == ["state", "target"]
+
+    def test_lazy_build_reads_no_data(
+        self,
+        tmp_path,
+        tabular_schema_data: dict,
+        state_category: pd.CategoricalDtype,
+    ):
+        import os
+
+        for dataset in tabular_schema_data["training_datasets"]:
+            dataset["cache_dir"] = str(tmp_path / "cache")
+        schema = TabularSchema(**tabular_schema_data)
+        # files are gone, so any read or fingerprint during build would fail
+        for dataset in tabular_schema_data["training_datasets"]:
+            os.remove(dataset["path"])
+        configuration = schema.build({"state": state_category}, lazy=True)
+        assert not any(
+            dataset.is_loaded() for dataset in configuration.training_datasets
+        )
+        assert not os.path.exists(tmp_path / "cache")
+
+    def test_best_config_reads_no_data(
+        self,
+        tmp_path,
+        tabular_schema_data: dict,
+        state_category: pd.CategoricalDtype,
+    ):
+        import os
+        import yaml
+        from configuration_engine.configuration import TrainingSchema
+        from configuration_engine.configuration.pandas import get_best_tabular_config
+
+        config_path = tmp_path / "configs.yaml"
+        config_path.write_text(yaml.safe_dump_all([tabular_schema_data] * 2))
+        metric_path = tmp_path / "metrics.csv"
+        pd.DataFrame({"best_score": [0.1, 0.9]}).to_csv(metric_path, index=False)
+        for dataset in tabular_schema_data["training_datasets"]:
+            os.remove(dataset["path"])
+        configuration = get_best_tabular_config(
+            TrainingSchema(
+                config_path=str(config_path),
+                metric_path=str(metric_path),
+                test_path="",
+                output_path="",
+            ),
+            {"state": state_category},
+        )
+        assert len(configuration.training_datasets) == 4
+        assert not any(
+            dataset.is_loaded() for dataset in configuration.training_datasets
+        )
@@ -0,0 +1,105 @@
+import numpy as np
+import pickle
+import optuna
+import pytest
+from configuration_engine.configuration import TrialCache, assignment_key
+from configuration_engine.configuration.pandas import TabularConfiguration
+from configuration_engine.parameter import Assignment, LiteralParameter
+from test.fixtures.dataframes import state_category
+from test.fixtures.configuration import (
+    dataset_files,
+    tabular_schema_data,
+    tabular_configuration,
+)
+
+
+class TestTrialCache:
+
+    def test_canonical_key(self):
+        assert assignment_key({"a": 1, "b": {"c": 0.5}}) == assignment_key(
+            {"b": {"c": np.float64(0.5)}, "a": np.int64(1)}
+        )
+        assert assignment_key({"a": 1}) != assignment_key({"a": 2})
+
+    def test_persisted(self, tmp_path):
+        path = str(tmp_path / "trials.jsonl")
+        cache = TrialCache(path)
+        calls = []
+        objective = lambda: calls.append(1) or 0.75
+        assert cache.evaluate({"depth": 3}, objective) == 0.75
+        assert cache.evaluate({"depth": 3}, objective) == 0.75
+        assert len(calls) == 1
+        reloaded = TrialCache(path)
+        assert reloaded.get(assignment_key({"depth": 3})) == 0.75
+
+    def test_partial_last_line_ignored(self, tmp_path):
+        path = tmp_path / "trials.jsonl"
+        TrialCache(str(path)).store("key", 1.0)
+        with open(path, "a") as stream:
+            stream.write('{"key": "other", "sco')
+        assert len(TrialCache(str(path))) == 1
+
+    def test_store_after_partial_line(self, tmp_path):
+        path = tmp_path / "trials.jsonl"
+        TrialCache(str(path)).store("key", 1.0)
+        with open(path, "a") as stream:
+            stream.write('{"key": "other", "sco')
+        cache = TrialCache(str(path))
+        cache.store("new", 2.0)
+        cache.store("last", 3.0)
+        reloaded = TrialCache(str(path))
+        assert len(reloaded) == 3
+        assert reloaded.get("new") == 2.0
+        assert "other" not in reloaded
+
+    def test_entry_without_score_should_fail(self, tmp_path):
+        path = tmp_path / "trials.jsonl"
+        with open(path, "w") as stream:
+            stream.write('{"key": "key"}\n{"key": "other", "score": 1.0}\n')
+        with pytest.raises(ValueError):
+            TrialCache(str(path))
+
+    def test_pickle(self, tmp_path):
+        cache = TrialCache(str(tmp_path / "trials.jsonl"))
+        cache.store("key", 1.0)
+        copy = pickle.loads(pickle.dumps(cache))
+        assert copy.get("key") == 1.0
+        copy.store("other", 2.0)
+        cache.reload()
+        assert cache.get("other") == 2.0
+
+    def test_repeated_trials_not_trained(self, tmp_path):
+        parameter = LiteralParameter(name="depth", values=[1, 2, 3])
+        cache = TrialCache(str(tmp_path / "trials.jsonl"))
+        trained = []
+
+        def objective(trial):
+            assignment = Assignment()
+            depth = parameter.suggest(trial, assignment)
+            values = {"depth": parameter.yaml(assignment)}
+            return cache.evaluate(values, lambda: trained.append(depth) or depth, trial)
+
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=0))
+        study.optimize(objective, n_trials=20)
+        assert sorted(trained) == [1, 2, 3]
+        assert sum(trial.user_attrs["cached"] for trial in study.trials) == 17
+
+    def test_tabular_trial_values(self, tabular_configuration: TabularConfiguration):
+        values = tabular_configuration.trial_values(Assignment({"depth": 3}))
+        assert values["model_parameters"] == {"depth": 3}
+        assert values["weights"] == {f"dataset_{i}": i + 1.0 for i in range(4)}
+        default = tabular_configuration.trial_values(Assignment())
+        assert assignment_key(values) != assignment_key(default)
+
+    def test_tabular_trial_values_change_with_file(
+        self, tabular_configuration: TabularConfiguration
+    ):
+        values = tabular_configuration.trial_values(Assignment())
+        assert all(values["datasets"].values())
+        dataset = tabular_configuration.training_datasets[0]
+        with open(dataset.path, "a") as stream:
+            stream.write("new,1.0,0\n")
+        dataset._fingerprint = None
+        changed = tabular_configuration.trial_values(Assignment())
+        assert assignment_key(values) != assignment_key(changed)
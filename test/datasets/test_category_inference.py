@@ -0,0 +1,62 @@
+from configuration_engine.datasets import (
+    distinct_values,
+    read_distinct_values,
+    merge_categories,
+)
+from test.fixtures.dataframes import test_dataframe
+import pandas as pd
+import os
+import pytest
+
+
+class TestDistinctValues:
+
+    @pytest.mark.parametrize("suffix", ["csv", "parquet"])
+    def test_read_in_chunks(self, tmp_path, test_dataframe: pd.DataFrame, suffix):
+        path = str(tmp_path / f"data.{suffix}")
+        if suffix == "csv":
+            test_dataframe.to_csv(path, index=False)
+        else:
+            test_dataframe.to_parquet(path)
+        values = read_distinct_values(path, ["state", "price"], chunksize=1)
+        assert sorted(values["state"]) == ["new", "used", "worn out"]
+        assert sorted(values["price"]) == [1, 5, 10]
+
+    def test_parquet_filters(self, tmp_path, test_dataframe: pd.DataFrame):
+        path = str(tmp_path / "data.parquet")
+        test_dataframe.to_parquet(path)
+        values = read_distinct_values(path, ["state"], [("price", "<", 10)])
+        assert sorted(values["state"]) == ["new", "used", "worn out"]
+        values = read_distinct_values(path, ["state"], [("price", "==", 5)])
+        assert sorted(values["state"]) == ["new", "worn out"]
+
+    def test_missing_values_skipped(self, tmp_path, test_dataframe: pd.DataFrame):
+        test_dataframe.loc[0, "state"] = None
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        assert sorted(read_distinct_values(path, ["state"])["state"]) == [
+            "new",
+            "worn out",
+        ]
+
+    def test_cached(self, tmp_path, test_dataframe: pd.DataFrame):
+        path = str(tmp_path / "data.csv")
+        cache_dir = str(tmp_path / "cache")
+        test_dataframe.to_csv(path, index=False)
+        first = distinct_values(path, ["state"], cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        assert distinct_values(path, ["state"], cache_dir=cache_dir) == first
+
+
+def test_merge_categories():
+    values = [
+        {"state": ["used", "new"], "previous_state": ["broken"]},
+        {"state": ["worn out", "new"]},
+    ]
+    categories = merge_categories(values, {"state": ["state", "previous_state"]})
+    assert list(categories["state"].categories) == [
+        "broken",
+        "new",
+        "used",
+        "worn out",
+    ]
@@ -0,0 +1,56 @@
+from configuration_engine.datasets import DatasetCache, PandasDataset, file_fingerprint
+from configuration_engine.parameter import ConstantParameter
+from test.fixtures.dataframes import test_dataframe
+from unittest.mock import patch
+import pandas as pd
+import os
+
+
+class TestDatasetCache:
+
+    def test_fingerprint_changes_with_content(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n")
+        before = file_fingerprint(str(path))
+        path.write_text("a\n2\n")
+        assert file_fingerprint(str(path)) != before
+
+    def test_key_depends_on_read_options(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        cache = DatasetCache(str(tmp_path / "cache"))
+        assert cache.key(str(path), columns=None) != cache.key(
+            str(path), columns=["a"]
+        )
+
+    def test_missing_key(self, tmp_path):
+        cache = DatasetCache(str(tmp_path / "cache"))
+        assert cache.load("missing") is None
+
+    def test_store_load(self, tmp_path, test_dataframe: pd.DataFrame):
+        cache = DatasetCache(str(tmp_path / "cache"))
+        cache.store("key", test_dataframe)
+        pd.testing.assert_frame_equal(cache.load("key"), test_dataframe)
+
+    def test_concurrent_store(self, tmp_path, test_dataframe: pd.DataFrame):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = DatasetCache(str(tmp_path / "cache"))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: cache.store("key", test_dataframe), range(16)))
+        pd.testing.assert_frame_equal(cache.load("key"), test_dataframe)
+        assert os.listdir(tmp_path / "cache") == ["key.arrow"]
+
+    def test_from_file_uses_cache(self, tmp_path, test_dataframe: pd.DataFrame):
+        path = str(tmp_path / "data.csv")
+        cache_dir = str(tmp_path / "cache")
+        test_dataframe.to_csv(path, index=False)
+        weight = ConstantParameter[float](name="weight", value=1.0)
+        PandasDataset.from_file(path, "data", weight, True, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        with patch.object(pd, "read_csv") as read_csv:
+            dataset = PandasDataset.from_file(
+                path, "data", weight, True, cache_dir=cache_dir
+            )
+            read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(dataset.data, test_dataframe)
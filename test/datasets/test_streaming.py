@@ -0,0 +1,105 @@
+from configuration_engine.datasets import (
+    PandasDataset,
+    DatasetSchema,
+    StreamingOptions,
+    iter_chunks,
+    read_chunked,
+    spill_to_parquet,
+)
+from configuration_engine.parameter import ConstantParameter
+from test.fixtures.dataframes import test_dataframe, state_category
+import pandas as pd
+import numpy as np
+import os
+import pytest
+
+
+@pytest.fixture
+def csv_path(tmp_path, test_dataframe: pd.DataFrame) -> str:
+    path = str(tmp_path / "data.csv")
+    test_dataframe.to_csv(path, index=False)
+    return path
+
+
+class TestReadChunked:
+
+    def test_chunks(self, csv_path: str):
+        chunks = list(iter_chunks(csv_path, chunksize=3))
+        assert [chunk.shape[0] for chunk in chunks] == [3, 1]
+
+    def test_same_as_read_file(self, csv_path: str, state_category):
+        data = read_chunked(
+            csv_path, dtype={"state": state_category}, exclude=["price"], chunksize=1
+        )
+        expected = PandasDataset.read_file(
+            csv_path, dtype={"state": state_category}, exclude=["price"]
+        )
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_downcast(self, csv_path: str):
+        data = read_chunked(csv_path, chunksize=2, downcast=True)
+        assert data["price"].dtype == np.int8
+        assert data["price"].tolist() == [1, 10, 5, 5]
+
+    def test_memory_limit(self, csv_path: str):
+        with pytest.raises(MemoryError):
+            read_chunked(csv_path, chunksize=1, memory_limit=64)
+
+    def test_empty_file(self, tmp_path):
+        path = str(tmp_path / "empty.csv")
+        pd.DataFrame({"state": [], "price": []}).to_csv(path, index=False)
+        assert list(read_chunked(path, chunksize=2).columns) == ["state", "price"]
+
+
+class TestSpill:
+
+    def test_spill_to_parquet(self, tmp_path, csv_path: str, test_dataframe):
+        output = str(tmp_path / "spill" / "data.parquet")
+        spill_to_parquet(csv_path, output, chunksize=1)
+        pd.testing.assert_frame_equal(pd.read_parquet(output), test_dataframe)
+
+    def test_dataset_reads_spilled_file(self, tmp_path, csv_path: str, state_category):
+        spill_dir = str(tmp_path / "spill")
+        schema = DatasetSchema(
+            name="data", path=csv_path, chunksize=2, spill_dir=spill_dir
+        )
+        dataset = PandasDataset.from_file(
+            csv_path,
+            "data",
+            ConstantParameter[float](name="weight", value=1.0),
+            True,
+            dtype={"state": state_category},
+            streaming=schema.streaming(),
+        )
+        assert len(os.listdir(spill_dir)) == 1
+        assert dataset.data["state"].dtype == state_category
+        assert dataset.data["price"].tolist() == [1, 10, 5, 5]
+
+    def test_spill_uses_dtype(self, tmp_path):
+        path = str(tmp_path / "data.csv")
+        # note is empty in first chunk, so its inferred type differs between chunks
+        pd.DataFrame({"note": [None] * 10 + ["text"] * 10, "price": range(20)}).to_csv(
+            path, index=False
+        )
+        spill_dir = str(tmp_path / "spill")
+        load = lambda dtype: PandasDataset.from_file(
+            path,
+            "data",
+            ConstantParameter[float](name="weight", value=1.0),
+            True,
+            dtype=dtype,
+            streaming=StreamingOptions(chunksize=10, spill_dir=spill_dir),
+        )
+        dataset = load({"note": "string"})
+        assert dataset.data["note"].tolist()[-1] == "text"
+        assert dataset.data["note"].isna().sum() == 10
+        # spill depends on dtype
+        load({"note": "string", "price": "float64"})
+        assert len(os.listdir(spill_dir)) == 2
+
+
+def test_schema_without_streaming(csv_path: str):
+    assert DatasetSchema(name="data", path=csv_path).streaming() == None
+    assert DatasetSchema(name="data", path=csv_path, downcast=True).streaming() == (
+        StreamingOptions(downcast=True)
+    )
@@ -0,0 +1,152 @@
+from configuration_engine.datasets import PandasDataset, DatasetSchema
+from configuration_engine.parameter import ConstantParameter
+from test.fixtures.dataframes import test_dataframe, state_category
+import pandas as pd
+import numpy.testing as npt
+import pytest
+
+
+@pytest.fixture
+def weight():
+    return ConstantParameter[float](name="weight", value=1.0)
+
+
+class TestPandasDatasetFromFile:
+
+    def test_read_parquet(self, tmp_path, test_dataframe: pd.DataFrame, weight):
+        path = str(tmp_path / "data.parquet")
+        test_dataframe.to_parquet(path)
+        dataset = PandasDataset.from_file(path, "data", weight, True)
+        pd.testing.assert_frame_equal(dataset.data, test_dataframe)
+
+    def test_read_parquet_columns(
+        self, tmp_path, test_dataframe: pd.DataFrame, weight
+    ):
+        path = str(tmp_path / "data.parquet")
+        test_dataframe.to_parquet(path)
+        dataset = PandasDataset.from_file(path, "data", weight, True, columns=["price"])
+        assert npt.assert_array_equal(dataset.data.columns, ["price"]) == None
+
+    def test_read_parquet_filters(
+        self, tmp_path, test_dataframe: pd.DataFrame, weight
+    ):
+        path = str(tmp_path / "data.parquet")
+        test_dataframe.to_parquet(path, row_group_size=1)
+        dataset = PandasDataset.from_file(
+            path, "data", weight, True, filters=[("price", ">=", 5)]
+        )
+        assert npt.assert_array_equal(dataset.data["price"], [10, 5, 5]) == None
+
+    def test_read_csv_columns(self, tmp_path, test_dataframe: pd.DataFrame, weight):
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        dataset = PandasDataset.from_file(path, "data", weight, True, columns=["state"])
+        assert npt.assert_array_equal(dataset.data.columns, ["state"]) == None
+
+    def test_read_csv_filters_should_fail(
+        self, tmp_path, test_dataframe: pd.DataFrame, weight
+    ):
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            PandasDataset.from_file(
+                path, "data", weight, True, filters=[("price", ">=", 5)]
+            )
+
+    @pytest.mark.parametrize("suffix", ["csv", "parquet"])
+    def test_read_dtype_and_exclude(
+        self, tmp_path, test_dataframe: pd.DataFrame, state_category, weight, suffix
+    ):
+        path = str(tmp_path / f"data.{suffix}")
+        if suffix == "csv":
+            test_dataframe.to_csv(path, index=False)
+        else:
+            test_dataframe.to_parquet(path)
+        dataset = PandasDataset.from_file(
+            path,
+            "data",
+            weight,
+            True,
+            dtype={"state": state_category},
+            exclude=["price"],
+        )
+        assert list(dataset.data.columns) == ["state"]
+        assert dataset.data["state"].dtype == state_category
+        assert dataset.data["state"].tolist() == test_dataframe["state"].tolist()
+
+    def test_read_dtype_missing_column_should_fail(
+        self, tmp_path, test_dataframe: pd.DataFrame, state_category, weight
+    ):
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            PandasDataset.from_file(
+                path, "data", weight, True, dtype={"condition": state_category}
+            )
+
+    def test_unknown_extension_should_fail(self, weight):
+        with pytest.raises(ValueError):
+            PandasDataset.from_file("data.txt", "data", weight, True)
+
+
+class TestDatasetSchema:
+
+    def test_build_passes_read_options(
+        self, tmp_path, test_dataframe: pd.DataFrame
+    ):
+        path = str(tmp_path / "data.parquet")
+        test_dataframe.to_parquet(path, row_group_size=1)
+        schema = DatasetSchema(
+            name="data",
+            path=path,
+            columns=["price"],
+            filters=[["price", "<", 5]],
+        )
+        dataset = schema.build()
+        assert npt.assert_array_equal(dataset.data["price"], [1]) == None
+
+
+class TestLazyPandasDataset:
+
+    def test_lazy_loads_on_first_access(
+        self, tmp_path, test_dataframe: pd.DataFrame, weight
+    ):
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        dataset = PandasDataset.from_file(path, "data", weight, True, lazy=True)
+        assert not dataset.is_loaded()
+        pd.testing.assert_frame_equal(dataset.data, test_dataframe)
+        assert dataset.is_loaded()
+
+    def test_lazy_missing_file_fails_on_access(self, tmp_path, weight):
+        path = str(tmp_path / "missing.csv")
+        dataset = PandasDataset.from_file(path, "data", weight, True, lazy=True)
+        with pytest.raises(OSError):
+            dataset.data
+
+    def test_release(self, tmp_path, test_dataframe: pd.DataFrame, weight):
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        dataset = PandasDataset.from_file(path, "data", weight, True)
+        dataset.release()
+        assert not dataset.is_loaded()
+        pd.testing.assert_frame_equal(dataset.data, test_dataframe)
+
+    def test_release_without_loader_should_fail(
+        self, test_dataframe: pd.DataFrame, weight
+    ):
+        dataset = PandasDataset(test_dataframe, "data", weight, True)
+        with pytest.raises(ValueError):
+            dataset.release()
+
+    def test_pickle_and_copy(self, tmp_path, test_dataframe: pd.DataFrame, weight):
+        import copy
+        import pickle
+
+        path = str(tmp_path / "data.csv")
+        test_dataframe.to_csv(path, index=False)
+        dataset = PandasDataset.from_file(path, "data", weight, True, lazy=True)
+        for restored in (pickle.loads(pickle.dumps(dataset)), copy.deepcopy(dataset)):
+            assert not restored.is_loaded()
+            pd.testing.assert_frame_equal(restored.data, test_dataframe)
+            assert restored._lock is not dataset._lock
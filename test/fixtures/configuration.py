@@ -0,0 +1,48 @@
+from configuration_engine.configuration.pandas import TabularSchema
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def dataset_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = str(tmp_path / f"dataset_{i}.csv")
+        pd.DataFrame(
+            data={
+                "state": ["used", "new", "worn out", "new"] * 2,
+                "price": [i] * 8,
+                "target": [0, 1] * 4,
+            }
+        ).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def tabular_schema_data(dataset_files):
+    return {
+        "metadata": {"name": "test", "output_path": None, "seed": 42},
+        "tuner_parameters": {"n_trials": 10},
+        "additional_parameters": {"direction": "maximize"},
+        "training_datasets": [
+            {"name": f"dataset_{i}", "path": path, "cv": i % 2 == 0, "weight": i + 1.0}
+            for i, path in enumerate(dataset_files)
+        ],
+        "training_parameters": {"epochs": 10},
+        "model_parameters": {"depth": {"min": 1, "max": 5}},
+        "preprocessing": [
+            {
+                "column": "state",
+                "actions": [
+                    {"name": "category_change", "category": "state"},
+                    {"name": "codes"},
+                ],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def tabular_configuration(tabular_schema_data, state_category):
+    return TabularSchema(**tabular_schema_data).build({"state": state_category})
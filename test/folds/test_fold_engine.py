@@ -0,0 +1,62 @@
+from configuration_engine.folds import FoldEngine, target_fingerprint
+from sklearn.model_selection import StratifiedKFold
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+
+@pytest.fixture
+def target():
+    return np.array([0, 1] * 10)
+
+
+class TestFoldEngine:
+
+    def test_matches_stratified_kfold(self, target: np.ndarray):
+        folds = FoldEngine().split(target, 4, 42)
+        kf = StratifiedKFold(n_splits=4, shuffle=True, random_state=42)
+        for (train, valid), (ref_train, ref_valid) in zip(
+            folds, kf.split(X=target, y=target)
+        ):
+            assert train.dtype == np.int32
+            assert npt.assert_array_equal(train, ref_train) == None
+            assert npt.assert_array_equal(valid, ref_valid) == None
+
+    def test_memoized(self, target: np.ndarray):
+        engine = FoldEngine()
+        assert engine.split(target, 4, 42) is engine.split(target.copy(), 4, 42)
+        assert engine.split(target, 4, 42) is not engine.split(target, 4, 1)
+
+    def test_pickle_keeps_memoized_folds(self, target: np.ndarray):
+        import pickle
+
+        engine = FoldEngine()
+        folds = engine.split(target, 4, 42)
+        restored = pickle.loads(pickle.dumps(engine))
+        for (train, valid), (ref_train, ref_valid) in zip(
+            restored.split(target, 4, 42), folds
+        ):
+            assert npt.assert_array_equal(train, ref_train) == None
+            assert npt.assert_array_equal(valid, ref_valid) == None
+
+    def test_additional_rows(self, target: np.ndarray):
+        folds = FoldEngine().split(target, 4, 42, n_additional=5)
+        for train, valid in folds:
+            assert npt.assert_array_equal(train[-5:], np.arange(20, 25)) == None
+            assert valid.max() < 20
+
+    def test_persisted(self, tmp_path, target: np.ndarray):
+        folds = FoldEngine(str(tmp_path)).split(target, 4, 42, n_additional=2)
+        engine = FoldEngine(str(tmp_path))
+        engine._compute = None
+        for (train, valid), (ref_train, ref_valid) in zip(
+            engine.split(target, 4, 42, n_additional=2), folds
+        ):
+            assert npt.assert_array_equal(train, ref_train) == None
+            assert npt.assert_array_equal(valid, ref_valid) == None
+
+    def test_fingerprint(self, target: np.ndarray):
+        changed = target.copy()
+        changed[0] = 1
+        assert target_fingerprint(target) == target_fingerprint(target.copy())
+        assert target_fingerprint(target) != target_fingerprint(changed)
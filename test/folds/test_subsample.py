@@ -0,0 +1,46 @@
+from configuration_engine.folds import FoldEngine, NestedSubsampler, restrict_folds
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def strata():
+    return np.array([0] * 60 + [1] * 30 + [2] * 10)
+
+
+class TestNestedSubsampler:
+
+    def test_stratified(self, strata):
+        rows = NestedSubsampler(strata, 42).rows(0.5)
+        assert np.bincount(strata[rows]).tolist() == [30, 15, 5]
+
+    def test_nested(self, strata):
+        subsampler = NestedSubsampler(strata, 42)
+        small, large = subsampler.rows(0.2), subsampler.rows(0.6)
+        assert set(small) <= set(large)
+        assert subsampler.rows(1.0).tolist() == list(range(100))
+
+    def test_deterministic(self, strata):
+        assert np.array_equal(
+            NestedSubsampler(strata, 42).rows(0.3),
+            NestedSubsampler(strata, 42).rows(0.3),
+        )
+        assert not np.array_equal(
+            NestedSubsampler(strata, 42).rows(0.3),
+            NestedSubsampler(strata, 7).rows(0.3),
+        )
+
+    @pytest.mark.parametrize("fraction", [0, -0.5, 1.5])
+    def test_invalid_fraction(self, strata, fraction):
+        with pytest.raises(ValueError):
+            NestedSubsampler(strata, 42).rows(fraction)
+
+
+def test_restrict_folds(strata):
+    folds = FoldEngine().split(strata, 5, 42)
+    rows = NestedSubsampler(strata, 42).rows(0.5)
+    restricted = restrict_folds(folds, rows, len(strata))
+    for (train, valid), (full_train, full_valid) in zip(restricted, folds):
+        assert set(rows[valid]) == set(full_valid) & set(rows)
+        assert set(rows[train]) == set(full_train) & set(rows)
+        assert len(train) + len(valid) == len(rows)
@@ -0,0 +1,2 @@
+class LazyCandidate:
+    pass
@@ -0,0 +1,83 @@
+import itertools
+import pytest
+from configuration_engine.parameter import (
+    ConstantParameter,
+    LiteralParameter,
+    MultiParameter,
+    ParameterGrid,
+    RangeParameter,
+)
+
+
+@pytest.fixture
+def parameters():
+    return [
+        ConstantParameter(name="seed", value=42),
+        LiteralParameter(name="criterion", values=["gini", "entropy"]),
+        RangeParameter(name="rate", min=0.1, max=0.3, log=False, step=0.1),
+        MultiParameter(
+            name="depth",
+            parameters=[
+                LiteralParameter(name="depth_0", values=[None]),
+                RangeParameter(name="depth_1", min=2, max=6, log=False, step=2),
+            ],
+        ),
+    ]
+
+
+class TestParameterGrid:
+
+    def test_cartesian_product(self, parameters):
+        grid = ParameterGrid(parameters)
+        assert grid.size == 2 * 3 * 4
+        points = [
+            tuple(parameter.first(point) for parameter in parameters) for point in grid
+        ]
+        depths = [None, 2, 4, 6]
+        expected = list(
+            itertools.product([42], ["gini", "entropy"], [0.1, 0.2, 0.3], depths)
+        )
+        assert len(points) == len(expected)
+        for point, values in zip(points, expected):
+            assert point[:2] == values[:2] and point[3] == values[3]
+            assert point[2] == pytest.approx(values[2])
+
+    def test_random_access(self, parameters):
+        grid = ParameterGrid(parameters)
+        points = list(grid)
+        assert grid[5] == points[5]
+        assert grid[-1] == points[-1]
+        with pytest.raises(IndexError):
+            grid[grid.size]
+
+    def test_shards_and_offset(self, parameters):
+        grid = ParameterGrid(parameters)
+        points = list(grid)
+        shards = [list(grid.iterate(shard, 5)) for shard in range(5)]
+        assert [len(shard) for shard in shards] == [
+            grid.shard_size(shard, 5) for shard in range(5)
+        ]
+        assert sorted(
+            (points.index(point) for shard in shards for point in shard)
+        ) == list(range(grid.size))
+        assert list(grid.iterate(2, 5, offset=3)) == shards[2][3:]
+
+    def test_huge_grid_is_lazy(self):
+        grid = ParameterGrid(
+            [
+                RangeParameter(name=f"p{i}", min=0, max=999, log=False, step=None)
+                for i in range(10)
+            ]
+        )
+        assert grid.size == 1000**10
+        point = next(grid.iterate(offset=grid.size - 1))
+        assert all(value == 999 for value in point.values.values())
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ParameterGrid(
+                [RangeParameter(name="rate", min=0.1, max=1.0, log=False, step=None)]
+            )
+        grid = ParameterGrid([LiteralParameter(name="a", values=[1, 2])])
+        with pytest.raises(ValueError):
+            grid.iterate(2, 2)
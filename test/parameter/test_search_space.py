@@ -0,0 +1,61 @@
+import optuna
+import pytest
+from optuna.distributions import IntDistribution, FloatDistribution
+from configuration_engine.parameter import (
+    Assignment,
+    ConstantParameter,
+    LiteralParameter,
+    MultiParameter,
+    RangeParameter,
+    ask_trials,
+    compile_search_space,
+)
+
+
+@pytest.fixture
+def parameters():
+    return [
+        ConstantParameter(name="seed", value=42),
+        LiteralParameter(name="criterion", values=["gini", "entropy"]),
+        RangeParameter(name="rate", min=0.01, max=1.0, log=True, step=None),
+        MultiParameter(
+            name="depth",
+            parameters=[
+                RangeParameter(name="depth_0", min=1, max=5, log=False, step=None),
+                RangeParameter(name="depth_1", min=10, max=50, log=False, step=10),
+            ],
+        ),
+    ]
+
+
+class TestSearchSpace:
+
+    def test_compile(self, parameters):
+        assert compile_search_space(parameters) == {
+            "criterion": IntDistribution(low=0, high=1),
+            "rate": FloatDistribution(low=0.01, high=1.0, log=True),
+            "depth": IntDistribution(low=0, high=1),
+            "depth_0": IntDistribution(low=1, high=5),
+            "depth_1": IntDistribution(low=10, high=50, step=10),
+        }
+
+    def test_alias_conflict(self):
+        with pytest.raises(ValueError):
+            compile_search_space(
+                [
+                    LiteralParameter(name="a", values=[1, 2], alias="x"),
+                    LiteralParameter(name="b", values=[1, 2, 3], alias="x"),
+                ]
+            )
+
+    def test_asked_trials_match_suggestions(self, parameters):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=0))
+        trials = ask_trials(study, compile_search_space(parameters), 5)
+        assert len(trials) == 5
+        for trial, assignment in trials:
+            suggested = Assignment()
+            values = [parameter.suggest(trial, suggested) for parameter in parameters]
+            assert values == [parameter.first(assignment) for parameter in parameters]
+            study.tell(trial, 0.0)
+        assert len(study.trials) == 5
@@ -29,3 +29,98 @@ class TestLiteralParameter:
 
         with pytest.raises(IndexError):
             _ = param.suggest(self.trial)
+
+
+class TestAssignment:
+
+    def test_suggest_records_into_assignment(self):
+        from configuration_engine.parameter import (
+            Assignment,
+            MultiParameter,
+            RangeParameter,
+        )
+
+        param = MultiParameter(
+            name="depth",
+            parameters=[
+                LiteralParameter(name="fixed", values=[3, 5]),
+                RangeParameter(name="range", min=1, max=10, log=False, step=None),
+            ],
+        )
+        trial = MagicMock()
+        trial.suggest_int.side_effect = [1, 7]
+        assignment = Assignment()
+
+        assert param.suggest(trial, assignment) == 7
+        assert assignment == Assignment({"depth": 1, "range": 7})
+        assert param.first(assignment) == 7
+        # parameter keeps no state, without assignment defaults are returned
+        assert param.first() == 3
+
+    def test_concurrent_trials_share_parameters(self):
+        import threading
+        import optuna
+        from configuration_engine.parameter import Assignment
+
+        param = LiteralParameter(name="value", values=list(range(20)))
+        barrier = threading.Barrier(4)
+        mismatches = []
+
+        def objective(trial):
+            assignment = Assignment()
+            value = param.suggest(trial, assignment)
+            barrier.wait(timeout=5)
+            if param.first(assignment) != value:
+                mismatches.append(trial.number)
+            if Assignment.from_trial(trial) != assignment:
+                mismatches.append(trial.number)
+            return value
+
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=0))
+        study.optimize(objective, n_trials=8, n_jobs=4)
+        assert mismatches == []
+        for trial in study.trials:
+            assert param.first(Assignment.from_trial(trial)) == trial.value
+
+
+class TestClassCallableParameter:
+
+    def test_schema_doesnt_import(self):
+        import sys
+        from configuration_engine.parameter import ClassCallableSchema
+
+        parameter = ClassCallableSchema(
+            callable_class=[
+                "test.parameter.lazy_candidate.LazyCandidate",
+                "collections.OrderedDict",
+            ]
+        ).build("model", "model")
+        assert parameter.callables[0] == "test.parameter.lazy_candidate.LazyCandidate"
+        assert "test.parameter.lazy_candidate" not in sys.modules
+        assert parameter.yaml() == {
+            "callable_class": "test.parameter.lazy_candidate.LazyCandidate"
+        }
+        assert "test.parameter.lazy_candidate" not in sys.modules
+
+    def test_schema_checks_module(self):
+        from configuration_engine.parameter import ClassCallableSchema
+
+        for path in ["missing.module.Class", "test.parameter.missing.Class", "Class"]:
+            with pytest.raises(ValueError):
+                ClassCallableSchema(callable_class=[path]).build("model", "model")
+
+    def test_only_chosen_class_instantiated(self):
+        from configuration_engine.parameter import Assignment, ClassCallableParameter
+
+        parameter = ClassCallableParameter(
+            name="model",
+            callables=["collections.OrderedDict", "missing.module.Class"],
+        )
+        first = parameter.first()
+        second = parameter.first(Assignment({"model": 0}))
+        assert type(first).__name__ == "OrderedDict"
+        # fresh instance for each selection
+        assert first is not second
+        with pytest.raises(ImportError):
+            parameter.first(Assignment({"model": 1}))
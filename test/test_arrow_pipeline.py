@@ -0,0 +1,104 @@
+from configuration_engine.processing_action.pandas import (
+    DropColumn,
+    ChangeCategory,
+    CategoryToCodes,
+    Downcast,
+    compile_pipeline,
+)
+from configuration_engine.processing_action.arrow import (
+    ArrowPipeline,
+    compile_arrow_pipeline,
+    frames_to_table,
+)
+from configuration_engine.processing_action import arrow
+from configuration_engine.error import NotFittedError
+from configuration_engine.configuration.pandas import TabularSchema
+from test.fixtures.dataframes import test_dataframe, state_category
+from test.fixtures.configuration import dataset_files, tabular_schema_data
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+
+def run_both(actions, frame: pd.DataFrame, max_workers=None):
+    expected = compile_pipeline(actions).fit_transform(frame)
+    table = frames_to_table([frame])
+    result = compile_arrow_pipeline(actions, max_workers).fit_transform(table)
+    return result.to_pandas(), expected.reset_index(drop=True)
+
+
+class TestArrowActions:
+
+    def test_change_category(self, test_dataframe, state_category):
+        result, expected = run_both(
+            [ChangeCategory("state", state_category)], test_dataframe
+        )
+        assert result["state"].dtype == state_category
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_unknown_values_become_missing(self, test_dataframe, state_category):
+        test_dataframe.loc[0, "state"] = "broken"
+        result, expected = run_both(
+            [ChangeCategory("state", state_category), CategoryToCodes("state")],
+            test_dataframe,
+        )
+        assert result["state"].tolist() == [-1, 1, 2, 1]
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_codes_and_drop(self, test_dataframe, state_category, max_workers):
+        actions = [
+            ChangeCategory("state", state_category),
+            DropColumn("price"),
+            CategoryToCodes("state"),
+        ]
+        result, expected = run_both(actions, test_dataframe, max_workers)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_codes_of_concatenated_tables(self, test_dataframe, state_category):
+        frame = test_dataframe.astype({"state": state_category})
+        table = frames_to_table([frame, frame.iloc[::-1]])
+        action = arrow.CategoryToCodes("state")
+        codes = action.fit_transform(table).column("state").to_pylist()
+        assert codes == [0, 1, 2, 1, 1, 2, 1, 0]
+
+    def test_codes_of_non_categorical_should_fail(self, test_dataframe):
+        action = arrow.CategoryToCodes("state")
+        with pytest.raises(ValueError):
+            action.fit_transform(pa.Table.from_pandas(test_dataframe))
+
+    def test_missing_column_should_fail(self, test_dataframe, state_category):
+        pipeline = compile_arrow_pipeline([ChangeCategory("condition", state_category)])
+        with pytest.raises(ValueError):
+            pipeline.fit_transform(pa.Table.from_pandas(test_dataframe))
+
+    def test_not_fitted(self, test_dataframe):
+        with pytest.raises(NotFittedError):
+            ArrowPipeline([]).transform(pa.Table.from_pandas(test_dataframe))
+
+    def test_unsupported_action_should_fail(self):
+        with pytest.raises(ValueError):
+            compile_arrow_pipeline([Downcast()])
+
+
+def test_arrow_backend_matches_pandas(tabular_schema_data, state_category):
+    categories = {"state": state_category}
+    tabular_schema_data["pushdown"] = False
+    pandas_configuration = TabularSchema(**tabular_schema_data).build(categories)
+    arrow_configuration = TabularSchema(**tabular_schema_data, backend="arrow").build(
+        categories
+    )
+    expected = pandas_configuration.construct_dataset("target", k_folds=2)
+    dataset = arrow_configuration.construct_dataset("target", k_folds=2)
+    pd.testing.assert_frame_equal(dataset.data, expected.data.reset_index(drop=True))
+    assert arrow_configuration.processing_timings
+    for (train, valid), (expected_train, expected_valid) in zip(
+        dataset.folds, expected.folds
+    ):
+        assert train.tolist() == expected_train.tolist()
+        assert valid.tolist() == expected_valid.tolist()
+    holdout = arrow_configuration.training_datasets[0].data
+    pd.testing.assert_frame_equal(
+        arrow_configuration.transform(holdout),
+        pandas_configuration.transform(holdout).reset_index(drop=True),
+    )
@@ -0,0 +1,84 @@
+from configuration_engine.configuration.pandas import TabularSchema
+from configuration_engine.processing_action.pandas import (
+    ChangeCategory,
+    CategoryToCodes,
+    DropColumn,
+    PipelineStore,
+    TabularPipeline,
+    actions_fingerprint,
+    compile_pipeline,
+)
+from test.fixtures.dataframes import test_dataframe, state_category
+from test.fixtures.configuration import dataset_files, tabular_schema_data
+import pandas as pd
+import pytest
+
+
+class TestActionsFingerprint:
+
+    def test_stable(self, state_category):
+        actions = [ChangeCategory("state", state_category), DropColumn("price")]
+        same = [
+            ChangeCategory(
+                "state", pd.CategoricalDtype(list(state_category.categories))
+            ),
+            DropColumn("price"),
+        ]
+        assert actions_fingerprint(actions) == actions_fingerprint(same)
+
+    def test_independent_of_fit(self, test_dataframe, state_category):
+        actions = [ChangeCategory("state", state_category), CategoryToCodes("state")]
+        before = actions_fingerprint(actions)
+        compile_pipeline(actions).fit_transform(test_dataframe)
+        assert actions_fingerprint(actions) == before
+
+    def test_changes(self, state_category):
+        base = actions_fingerprint([ChangeCategory("state", state_category)])
+        reordered = pd.CategoricalDtype(list(state_category.categories)[::-1])
+        assert base != actions_fingerprint([ChangeCategory("state", reordered)])
+        assert base != actions_fingerprint(
+            [ChangeCategory("condition", state_category)]
+        )
+        assert base != actions_fingerprint([CategoryToCodes("state")])
+
+
+class TestPipelineStore:
+
+    def test_missing(self, tmp_path):
+        assert PipelineStore(str(tmp_path)).load("missing") == None
+
+    def test_round_trip(self, tmp_path, test_dataframe, state_category):
+        actions = [ChangeCategory("state", state_category), CategoryToCodes("state")]
+        pipeline = compile_pipeline(actions)
+        expected = pipeline.fit_transform(test_dataframe)
+        store = PipelineStore(str(tmp_path / "pipelines"))
+        key = store.key(actions, ["data"])
+        store.store(key, pipeline)
+        loaded = store.load(key)
+        assert isinstance(loaded, TabularPipeline)
+        pd.testing.assert_frame_equal(loaded.transform(test_dataframe), expected)
+
+    def test_key_depends_on_data(self, tmp_path, state_category):
+        store = PipelineStore(str(tmp_path))
+        actions = [ChangeCategory("state", state_category)]
+        assert store.key(actions, ["a"]) != store.key(actions, ["b"])
+
+
+def test_configuration_loads_fitted_pipeline(
+    tmp_path, tabular_schema_data, state_category
+):
+    tabular_schema_data["pipeline_cache_dir"] = str(tmp_path / "pipelines")
+    schema = TabularSchema(**tabular_schema_data)
+    first = schema.build({"state": state_category})
+    expected = first.construct_dataset("target", k_folds=2)
+    assert len(list((tmp_path / "pipelines").iterdir())) == 1
+
+    second = schema.build({"state": state_category})
+    key = second.pipeline_key()
+    assert key == first.pipeline_key()
+    assert second.fitted_pipeline() is not None
+    dataset = second.construct_dataset("target", k_folds=2)
+    pd.testing.assert_frame_equal(dataset.data, expected.data)
+    # loaded pipeline is kept for new data
+    holdout = second.training_datasets[0].data
+    pd.testing.assert_frame_equal(second.transform(holdout), first.transform(holdout))
@@ -0,0 +1,126 @@
+from test.fixtures.dataframes import test_dataframe, state_category
+from configuration_engine.processing_action.pandas import (
+    DropColumn,
+    DropColumns,
+    ChangeCategory,
+    CategoryToCodes,
+    ChangeCategoryToCodes,
+    TabularProcessingAction,
+    TabularPipeline,
+    compile_pipeline,
+)
+from configuration_engine.error import NotFittedError
+import pandas as pd
+import pytest
+
+
+class AddColumn(TabularProcessingAction):
+
+    def fit(self, X):
+        self._is_fitted = True
+
+    def transform(self, X, inplace=False):
+        X["added"] = 1
+
+    def fit_transform(self, X, inplace=False):
+        self.fit(X)
+        return self.transform(X, inplace)
+
+
+class TestCompilePipeline:
+
+    def test_drops_are_batched(self):
+        pipeline = compile_pipeline(
+            [DropColumn("a"), CategoryToCodes("b"), DropColumn("c")]
+        )
+        assert [type(action) for action in pipeline.actions] == [
+            CategoryToCodes,
+            DropColumns,
+        ]
+        assert pipeline.actions[1].columns == ["a", "c"]
+
+    def test_category_and_codes_are_fused(self, state_category):
+        pipeline = compile_pipeline(
+            [ChangeCategory("state", state_category), CategoryToCodes("state")]
+        )
+        assert [type(action) for action in pipeline.actions] == [ChangeCategoryToCodes]
+
+    def test_dropped_column_is_skipped(self, state_category):
+        pipeline = compile_pipeline(
+            [ChangeCategory("state", state_category), DropColumn("state")]
+        )
+        assert [type(action) for action in pipeline.actions] == [DropColumns]
+
+    def test_use_after_drop_should_fail(self):
+        with pytest.raises(ValueError):
+            compile_pipeline([DropColumn("state"), CategoryToCodes("state")])
+
+    def test_unknown_action_is_barrier(self):
+        custom = AddColumn()
+        pipeline = compile_pipeline([DropColumn("a"), custom, DropColumn("b")])
+        assert [type(action) for action in pipeline.actions] == [
+            DropColumns,
+            AddColumn,
+            DropColumns,
+        ]
+
+    def test_same_result_as_actions(
+        self, test_dataframe: pd.DataFrame, state_category: pd.CategoricalDtype
+    ):
+        actions = [
+            ChangeCategory("state", state_category),
+            DropColumn("price"),
+            CategoryToCodes("state"),
+        ]
+        expected = test_dataframe.copy()
+        for action in actions:
+            action.fit_transform(expected, True)
+        modified = compile_pipeline(actions).fit_transform(test_dataframe)
+        pd.testing.assert_frame_equal(modified, expected)
+        assert "price" in test_dataframe.columns
+
+
+class TestParallelPipeline:
+
+    @pytest.fixture
+    def actions(self, state_category: pd.CategoricalDtype):
+        return [
+            ChangeCategory("state", state_category),
+            ChangeCategory("price", pd.CategoricalDtype([1, 5, 10])),
+            CategoryToCodes("price"),
+            DropColumn("state"),
+        ]
+
+    @pytest.mark.parametrize("inplace", [True, False])
+    def test_same_result_as_sequential(
+        self, test_dataframe: pd.DataFrame, actions, inplace: bool
+    ):
+        expected = TabularPipeline(actions).fit_transform(test_dataframe)
+        pipeline = TabularPipeline(actions, max_workers=2)
+        modified = pipeline.fit_transform(test_dataframe, inplace)
+        if inplace:
+            modified = test_dataframe
+        pd.testing.assert_frame_equal(modified, expected)
+
+    def test_transform_after_fit(self, test_dataframe: pd.DataFrame, actions):
+        pipeline = TabularPipeline(actions, max_workers=2)
+        pipeline.fit(test_dataframe)
+        modified = pipeline.transform(test_dataframe)
+        assert list(modified.columns) == ["price"]
+
+    def test_transform_before_fit_should_fail(
+        self, test_dataframe: pd.DataFrame, actions
+    ):
+        with pytest.raises(NotFittedError):
+            TabularPipeline(actions, max_workers=2).transform(test_dataframe)
+
+    def test_timings(self, test_dataframe: pd.DataFrame, actions):
+        pipeline = TabularPipeline(actions, max_workers=2)
+        pipeline.fit_transform(test_dataframe)
+        assert [name for name, _ in pipeline.timings] == [
+            "ChangeCategory(state)",
+            "ChangeCategory(price)",
+            "CategoryToCodes(price)",
+            "DropColumn(state)",
+        ]
+        assert all(seconds >= 0 for _, seconds in pipeline.timings)
@@ -3,6 +3,9 @@ from configuration_engine.processing_action.pandas.tabular_processing_action imp
     DropColumn,
     ChangeCategory,
     CategoryToCodes,
+    DropColumns,
+    ChangeCategoryToCodes,
+    Downcast,
 )
 import pandas as pd
 import numpy.testing as npt
@@ -81,3 +84,104 @@ class TestCategoryToCodes:
         action = CategoryToCodes("state")
         with pytest.raises(NotFittedError):
             action.transform(test_dataframe)
+
+
+class TestDropColumns:
+
+    def test_drop_columns(self, test_dataframe: pd.DataFrame):
+        action = DropColumns(["price", "state"])
+        modified = action.fit_transform(test_dataframe)
+        assert npt.assert_array_equal(modified.columns, []) == None
+
+    def test_missing_column_should_fail(self, test_dataframe: pd.DataFrame):
+        action = DropColumns(["price", "color"])
+        with pytest.raises(ValueError):
+            action.fit_transform(test_dataframe)
+
+
+class TestChangeCategoryToCodes:
+
+    def test_change_category_to_codes(
+        self, test_dataframe: pd.DataFrame, state_category: pd.CategoricalDtype
+    ):
+        action = ChangeCategoryToCodes("state", state_category)
+        action.fit_transform(test_dataframe, True)
+        state = np.array(test_dataframe["state"])
+        assert npt.assert_array_equal(state, np.array([0, 1, 2, 1])) == None
+
+    def test_matches_category_codes(self, state_category: pd.CategoricalDtype):
+        column = pd.Series(["new", "unknown", None, "used"], name="state")
+        fused = ChangeCategoryToCodes("state", state_category).transform_column(column)
+        # unknown and missing values are -1, codes have dtype of categorical codes
+        expected = pd.Series([1, -1, -1, 0], dtype=np.int8, name="state")
+        pd.testing.assert_series_equal(fused, expected)
+
+
+class TestCopyOnWrite:
+
+    def test_unchanged_columns_are_shared(
+        self, test_dataframe: pd.DataFrame, state_category: pd.CategoricalDtype
+    ):
+        modified = ChangeCategory("state", state_category).fit_transform(test_dataframe)
+        assert np.shares_memory(
+            modified["price"].to_numpy(), test_dataframe["price"].to_numpy()
+        )
+        assert test_dataframe["state"].dtype != state_category
+
+    def test_drop_shares_remaining_columns(self, test_dataframe: pd.DataFrame):
+        modified = DropColumn("state").fit_transform(test_dataframe)
+        assert np.shares_memory(
+            modified["price"].to_numpy(), test_dataframe["price"].to_numpy()
+        )
+        assert "state" in test_dataframe.columns
+
+    def test_drop_columns_shares_consolidated_block(self):
+        data = pd.DataFrame(np.arange(12).reshape(3, 4), columns=list("abcd"))
+        modified = DropColumns(["a", "c"]).fit_transform(data)
+        assert list(modified.columns) == ["b", "d"]
+        assert list(data.columns) == ["a", "b", "c", "d"]
+        for column in modified.columns:
+            assert np.shares_memory(
+                modified[column].to_numpy(), data[column].to_numpy()
+            )
+
+
+class TestDowncast:
+
+    def test_downcast(self, test_dataframe: pd.DataFrame):
+        test_dataframe["weight"] = [1.5, 2.0, 3.0, 4.0]
+        test_dataframe = pd.concat([test_dataframe] * 100, ignore_index=True)
+        action = Downcast()
+        modified = action.fit_transform(test_dataframe)
+        assert modified["price"].dtype == np.int8
+        assert modified["weight"].dtype == np.float32
+        assert isinstance(modified["state"].dtype, pd.CategoricalDtype)
+        assert modified["state"].tolist() == test_dataframe["state"].tolist()
+        assert test_dataframe["price"].dtype == np.int64
+        assert action.memory_saved > 0
+
+    def test_keeps_categories(self, categorical_dataframe: pd.DataFrame, state_category):
+        modified = Downcast().fit_transform(categorical_dataframe)
+        assert modified["state"].dtype == state_category
+
+    def test_smallest_safe_int(self, test_dataframe: pd.DataFrame):
+        test_dataframe["price"] = [1, 1000, -5, 70000]
+        action = Downcast(columns=["price"])
+        action.fit_transform(test_dataframe, True)
+        assert test_dataframe["price"].dtype == np.int32
+
+    def test_high_cardinality_strings_kept(self, test_dataframe: pd.DataFrame):
+        action = Downcast(max_category_ratio=0.5)
+        modified = action.fit_transform(test_dataframe)
+        assert not isinstance(modified["state"].dtype, pd.CategoricalDtype)
+
+    def test_out_of_range_should_fail(self, test_dataframe: pd.DataFrame):
+        action = Downcast(columns=["price"])
+        action.fit(test_dataframe)
+        test_dataframe["price"] = [1, 1000, 5, 5]
+        with pytest.raises(ValueError):
+            action.transform(test_dataframe)
+
+    def test_not_fitted(self, test_dataframe: pd.DataFrame):
+        with pytest.raises(NotFittedError):
+            Downcast().transform(test_dataframe)